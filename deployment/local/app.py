@@ -1,10 +1,28 @@
-"""App to serve the website."""
+"""App to serve the website.
 
+``python deployment/local/app.py`` rebuilds ``website/`` on every change and
+serves it from disk. With ``--memory``, the pages are rendered on request and
+kept in memory instead (see ``electric_toolbox.devsite``): an edit only marks
+them stale, the ``[[assets]]`` are served from their sources, and nothing is
+written to ``website/`` until ``curl -X POST localhost:8080/_dev/export``.
+"""
+
+import argparse
+import mimetypes
 import os
+import tomllib
+from pathlib import Path
+from typing import Dict, List, Optional
 
-from flask import Flask, Response, render_template, send_from_directory
+from flask import Flask, Response, abort, render_template, send_file, send_from_directory
 from livereload import Server, shell  # type: ignore
 
+from electric_toolbox.assets import AssetFile, asset_files, asset_folders, clean_and_sync
+from electric_toolbox.devsite import DevSite
+from electric_toolbox.generate import template_environment
+from electric_toolbox.sinks import DirectorySink
+from electric_toolbox.vendor import write_vendor_scripts
+
 # Get the absolute path to the directory containing app.py
 base_dir = os.path.abspath(os.path.dirname(__file__))
 
@@ -12,50 +30,124 @@ base_dir = os.path.abspath(os.path.dirname(__file__))
 website_dir = os.path.join(base_dir, '..', '..', 'website')
 src_dir = os.path.join(base_dir, '..', '..', 'src')
 content_dir = os.path.join(base_dir, '..', '..', 'content')
+config_path = os.path.join(base_dir, '..', '..', 'compile.config.toml')
+conversion_cache_dir = os.path.join(base_dir, '..', '..', 'build', 'markdown-cache')
 
+# No built-in static route: it would shadow ``serve_static`` for every file.
 app = Flask(
     __name__,
-    static_url_path='',
-    static_folder=website_dir,
+    static_folder=None,
     template_folder=website_dir,
 )
 
+# The in-memory website, in --memory mode.
+site: Optional[DevSite] = None
+# The [[assets]] by location, in --memory mode.
+assets: Dict[str, Path] = {}
+
+
+def _from_memory(filename: str) -> Optional[Response]:
+    """The page from the in-memory website, if it has one."""
+    contents = site.page(filename) if site is not None else None
+    if contents is None:
+        return None
+    return Response(contents, mimetype=mimetypes.guess_type(filename or 'index.html')[0] or 'text/html')
+
+
+def _from_assets(filename: str) -> Response:
+    """The asset from its configured source; nothing else is served in --memory mode."""
+    source = assets.get(filename)
+    if source is None:
+        abort(404)
+    return send_file(source.resolve())
+
 
 @app.route('/')
-def index() -> str:
+def index() -> str | Response:
     """Render and return the index page."""
-    return render_template('index.html')
+    return _from_memory('') or render_template('index.html')
 
 
 @app.route('/<path:filename>')
 def serve_static(filename: str) -> Response:
-    """Serve static files from the configured static folder."""
-    return send_from_directory(app.config['STATIC_FOLDER'], filename)
+    """Serve static files from the in-memory website and the assets, else from ``website/``."""
+    if site is not None:
+        return _from_memory(filename) or _from_assets(filename)
+    return send_from_directory(website_dir, filename)
+
+
+@app.route('/_dev/export', methods=['POST'])
+def export() -> str:
+    """Write the in-memory website to ``website/``."""
+    if site is None:
+        return 'Not serving from memory.\n'
+    files = _asset_files()
+    synced = clean_and_sync(Path(website_dir), files)
+    pages = site.export(DirectorySink(Path(website_dir)))
+    return f'Exported {pages} files and {len(files)} assets ({len(synced.copied)} copied).\n'
+
+
+def _asset_files() -> List[AssetFile]:
+    with open(config_path, 'rb') as conf:
+        return asset_files(asset_folders(tomllib.load(conf)))
+
+
+def _reload_assets() -> None:
+    """Map every asset location to its source again (files may have come or gone)."""
+    assets.clear()
+    assets.update((asset.location, asset.source) for asset in _asset_files())
+
+
+def _reload() -> None:
+    if site is not None:
+        site.reload()
+    _reload_assets()
+
+
+def _memory_site() -> DevSite:
+    with open(config_path, 'rb') as conf:
+        configs = tomllib.load(conf)
+    env = template_environment(configs.get('website', {}))
+    dev_site = DevSite(env, configs, conversion_cache=Path(conversion_cache_dir))
+    env.globals['vendor_scripts'] = write_vendor_scripts(dev_site.files)
+    return dev_site
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--memory', action='store_true', help='Render the pages on request, in memory.')
+    args = parser.parse_args()
+
     server = Server(app.wsgi_app)
 
-    # Watch for changes in content and regenerate the website
-    server.watch(
-        content_dir,
-        shell(
-            'uv run scripts/generate_site.py',
-            output=None,  # No specific output file
-        ),
-    )
-
-    # Watch for changes in src and regenerate the website
-    server.watch(
-        src_dir,
-        shell(
-            'uv run scripts/generate_site.py',
-            output=None,  # No specific output file
-        ),
-    )
-
-    # Watch for changes in src and regenerate the website
-    server.watch(
-        website_dir,
-    )
+    if args.memory:
+        site = _memory_site()
+        _reload_assets()
+        # Content edits: parse again on the next request. Template edits: re-render on request.
+        server.watch(content_dir, _reload)
+        server.watch(config_path, _reload)
+        server.watch(src_dir, site.invalidate)
+    else:
+        # Watch for changes in content and regenerate the website
+        server.watch(
+            content_dir,
+            shell(
+                'uv run scripts/generate_site.py',
+                output=None,  # No specific output file
+            ),
+        )
+
+        # Watch for changes in src and regenerate the website
+        server.watch(
+            src_dir,
+            shell(
+                'uv run scripts/generate_site.py',
+                output=None,  # No specific output file
+            ),
+        )
+
+        # Watch for changes in src and regenerate the website
+        server.watch(
+            website_dir,
+        )
     server.serve(host='0.0.0.0', port=8080, debug=True)  # noqa: S104
@@ -0,0 +1,42 @@
+"""Serve the built website like production: ETags, precompressed files, ranges, threads.
+
+Usage::
+
+    python deployment/local/serve.py [--port 8080] [--precompress]
+
+The ETags come from ``build/deploy-manifest.json`` (written by every build) for
+the files not modified since; the others get a size and mtime ETag.
+``--precompress`` first writes a ``.gz`` sibling of every text file; ``.br``
+siblings made by an external tool (e.g. ``brotli -k``) are served as well.
+Unlike ``app.py``, there is no live reload: rebuild, then restart the server.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from electric_toolbox.server import make_server, precompress
+
+root = Path(os.path.abspath(os.path.dirname(__file__))) / '..' / '..'
+website_dir = root / 'website'
+manifest_path = root / 'build' / 'deploy-manifest.json'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--precompress', action='store_true', help='Write the .gz siblings first.')
+    parser.add_argument('--quiet', action='store_true', help='No access log.')
+    args = parser.parse_args()
+
+    if args.precompress:
+        print(f'Compressed {precompress(website_dir)} files')
+    server = make_server(website_dir, args.host, args.port, manifest=manifest_path, quiet=args.quiet)
+    print(f'Serving {len(server.files)} files on http://{args.host}:{server.server_address[1]}/')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
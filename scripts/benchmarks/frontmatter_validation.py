@@ -0,0 +1,214 @@
+"""Compare the compiled frontmatter schema with the former per-field parsers.
+
+Usage: uv run python scripts/benchmarks/frontmatter_validation.py [--posts 20000] [--broken 0.1]
+
+The former approach ran a dozen ``Result`` functions per post (title, date and
+thumbnail, then the Open Graph page and article parsers). Those parsers are no
+longer part of the package, so a copy of them is kept below to keep the
+comparison reproducible. The schema is timed twice: :func:`parse_frontmatter`
+once per post, as a single post is checked, and :func:`frontmatter_errors` once
+for the whole batch.
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, List
+
+from expression import Error, Nothing, Ok, Option, Result, Some, effect
+from expression.collections import Block
+from expression.extra.result.traversable import traverse
+from pydantic import HttpUrl
+
+from electric_toolbox.exceptions import ParsingError
+from electric_toolbox.parsing.common import isoformat_with_tz
+from electric_toolbox.parsing.components.opengraph import Author, OpenGraph, OpenGraphArticle
+from electric_toolbox.parsing.components.opengraph.article_functions import default_author
+from electric_toolbox.parsing.sections.blog.schema import frontmatter_errors, parse_frontmatter
+
+MarkdownMetadata = Dict[str, Any]
+
+
+class _Post:
+    def __init__(self, metadata: MarkdownMetadata):
+        self.metadata = metadata
+
+
+# The former per-field parsers, as they were in ``opengraph.page_functions``
+# and ``opengraph.article_functions``.
+
+
+def _parse_title(data: MarkdownMetadata) -> Result[str, ParsingError]:
+    title = data.get('title')
+    if title is not None:
+        return Ok(title)
+    return Error(ParsingError(message='Title not found', cause=ValueError()))
+
+
+def _parse_image(data: MarkdownMetadata) -> Result[str, Exception]:
+    image = data.get('image', False)
+    if image:
+        return Ok(image if isinstance(image, str) else image.get('src', ''))
+    return Error(Exception('Image not found'))
+
+
+def _parse_language(data: MarkdownMetadata, default: str = 'en') -> Result[str, Exception]:
+    language = data.get('language', default)
+    if isinstance(language, str):
+        return Ok(language)
+    return Error(Exception('Language must be a string'))
+
+
+def _parse_description(data: MarkdownMetadata) -> Result[Option[str], Exception]:
+    description = data.get('description', Nothing)
+    match description:
+        case str(desc):
+            return Ok(Some(desc))
+        case Option(none=None):
+            return Ok(Nothing)
+        case _:
+            return Error(Exception('Description must be a string'))
+
+
+@effect.result[OpenGraph, Exception]()
+def create_opengraph_typed_article(data: _Post, url: str) -> Generator[Any, Any, OpenGraph]:
+    """The former Open Graph page parser."""
+    return OpenGraph(
+        title=(yield from _parse_title(data.metadata)),
+        ogtype='article',
+        image=(yield from _parse_image(data.metadata)),
+        locale=(yield from _parse_language(data.metadata)),
+        description=(yield from _parse_description(data.metadata)),
+        url=HttpUrl(url),
+    )
+
+
+def _parse_publication_time(data: MarkdownMetadata, add_time: timedelta = timedelta(days=0)) -> Result[str, Exception]:
+    date_obj = data.get('publication_time')
+    match date_obj:
+        case datetime():
+            return Ok(isoformat_with_tz(date_obj + add_time))
+        case _:
+            return Error(Exception('Frontmatter `publication_time` must be an ISO8601 datetime string'))
+
+
+def _parse_modification_time(data: MarkdownMetadata) -> Result[str, Exception]:
+    date_obj = data.get('modified_time', data.get('publication_time'))
+    match date_obj:
+        case datetime():
+            return Ok(isoformat_with_tz(date_obj))
+        case _:
+            return Error(
+                ParsingError(
+                    message='Frontmatter `modified_time` must be an ISO8601 datetime string', cause=ValueError()
+                )
+            )
+
+
+def _parse_author(data: Dict[str, Any]) -> Result[Author, Exception]:
+    try:
+        return Ok(Author(**data))
+    except Exception as e:
+        return Error(Exception('Author frontmatter incorrect.', e))
+
+
+@effect.result[Block[Author], Exception]()
+def _parse_authors(data: MarkdownMetadata) -> Generator[Any, Any, Block[Author]]:
+    if data.get('authors', False):
+        return (yield from traverse(_parse_author, Block.of_seq(xs=data['authors'])))
+    authors: Block[Author] = yield from default_author()
+    return authors
+
+
+def _parse_tags(data: MarkdownMetadata) -> Result[Block[str], Exception]:
+    tags = data.get('tags')
+    if tags is None:
+        return Ok(Block[str].empty())
+    match tags:
+        case list() if all(isinstance(tag, str) for tag in tags):
+            return Ok(Block.of_seq(tags))
+        case _:
+            return Error(Exception('Tags must be a list of strings'))
+
+
+def _parse_section(data: MarkdownMetadata) -> Result[str, Exception]:
+    content_type = data.get('section', False)
+    if content_type:
+        return Ok(str(content_type))
+    return Error(Exception(f'Invalid content type: {content_type}'))
+
+
+@effect.result[OpenGraphArticle, Exception]()
+def create_opengraph_article(data: _Post) -> Generator[Any, Any, OpenGraphArticle]:
+    """The former Open Graph article parser."""
+    return OpenGraphArticle(
+        publication_time=(yield from _parse_publication_time(data.metadata)),
+        modified_time=(yield from _parse_modification_time(data.metadata)),
+        expiration_time=(yield from _parse_publication_time(data.metadata, add_time=timedelta(days=731))),
+        authors=(yield from _parse_authors(data.metadata)),
+        tags=(yield from _parse_tags(data.metadata)),
+        section=(yield from _parse_section(data.metadata)),
+    )
+
+
+def _metadata(i: int, broken: bool) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {
+        'title': f'Post {i}',
+        'image': f'https://example.com/{i}.png',
+        'publication_time': datetime(2024, 1, 1) + timedelta(hours=i),
+        'section': 'Programming',
+        'tags': ['python', f'tag-{i % 50}'],
+        'description': f'About post {i}.',
+    }
+    if broken:
+        del metadata['title']
+        metadata['thumbnail'] = 3
+    return metadata
+
+
+def _per_field(batch: List[Dict[str, Any]]) -> int:
+    """The posts with errors, by the former checks of ``validate_post``."""
+    broken = 0
+    for i, metadata in enumerate(batch):
+        post = _Post(metadata)
+        title = metadata.get('title') is not None
+        date = isinstance(metadata.get('publication_time'), datetime)
+        thumbnail = isinstance(metadata.get('thumbnail', Nothing), (str, type(Nothing)))
+        page = create_opengraph_typed_article(data=post, url=f'https://example.com/{i}.html')
+        article = create_opengraph_article(data=post)
+        broken += not (title and date and thumbnail) or page.is_error() or article.is_error()
+    return broken
+
+
+def _per_post(batch: List[Dict[str, Any]]) -> int:
+    """The posts with errors, validated one at a time."""
+    return sum(parse_frontmatter(metadata).is_error() for metadata in batch)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--posts', type=int, default=20_000)
+    parser.add_argument('--broken', type=float, default=0.1, help='Share of posts with errors')
+    args = parser.parse_args()
+
+    every = max(1, round(1 / args.broken)) if args.broken else 0
+    batch = [_metadata(i, bool(every) and i % every == 0) for i in range(args.posts)]
+
+    start = time.perf_counter()
+    legacy = _per_field(batch)
+    per_field = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = _per_post(batch)
+    per_post = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = sum(1 for errors in frontmatter_errors(batch) if errors)
+    batched = time.perf_counter() - start
+
+    if not found == single == legacy:
+        raise SystemExit(f'broken posts: batch {found}, one call per post {single}, per-field parsers {legacy}')
+    print(f'{args.posts} posts, {found} broken')
+    print(f'per-field parsers:  {per_field:.3f}s')
+    print(f'schema, per post:   {per_post:.3f}s')
+    print(f'schema, one batch:  {batched:.3f}s')
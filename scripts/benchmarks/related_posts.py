@@ -0,0 +1,47 @@
+"""Time the related-posts computation on a synthetic blog.
+
+Usage: uv run python scripts/benchmarks/related_posts.py [--posts 10000] [--words 800] [--k 3] [--pure-python]
+
+The sparse matrix path is used when the ``related`` extra is installed
+(``uv sync --extra related``); ``--pure-python`` times the fallback instead.
+"""
+
+import argparse
+import random
+import time
+
+from electric_toolbox.parsing.components.related import RelatedDocument, functions, related_posts
+
+
+def _synthetic_posts(count: int, words: int, seed: int = 0) -> list[RelatedDocument]:
+    """Posts drawn from a Zipf-like vocabulary, with one to three of 200 tags each."""
+    rng = random.Random(seed)  # noqa: S311
+    vocabulary = [f'word{i}' for i in range(20_000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    tags = [f'tag{i}' for i in range(200)]
+    return [
+        RelatedDocument(
+            tags=rng.sample(tags, rng.randint(1, 3)),
+            text=' '.join(rng.choices(vocabulary, weights=weights, k=words)),
+        )
+        for _ in range(count)
+    ]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--posts', type=int, default=10_000)
+    parser.add_argument('--words', type=int, default=800)
+    parser.add_argument('--k', type=int, default=3)
+    parser.add_argument('--pure-python', action='store_true', help='Time the fallback without NumPy/SciPy')
+    args = parser.parse_args()
+    if args.pure_python:
+        functions.VECTORIZED = False
+
+    documents = _synthetic_posts(args.posts, args.words)
+    start = time.perf_counter()
+    related = related_posts(documents, k=args.k)
+    elapsed = time.perf_counter() - start
+    linked = sum(1 for row in related if row)
+    path = 'sparse matrix' if functions.VECTORIZED else 'pure Python'
+    print(f'{args.posts} posts x {args.words} words, {path}: {elapsed:.2f}s ({linked} posts with related links)')
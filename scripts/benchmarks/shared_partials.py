@@ -0,0 +1,71 @@
+"""Template render time per page, with and without the shared partials cache.
+
+Usage: uv run python scripts/benchmarks/shared_partials.py [--posts 500]
+
+Builds a small corpus twice into memory: once with the header, footer and
+script block rendered once per build (``electric_toolbox.partials``), once with
+every page rendering them again. Only the Jinja ``render`` calls are timed (not
+the Markdown conversion nor the minification).
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, List
+
+from jinja2 import Environment, PackageLoader, Template
+from streaming_build import _write_corpus
+
+from electric_toolbox.icons import load_icons
+from electric_toolbox.main import main
+from electric_toolbox.partials import PartialCache, RenderedPartials, rendered_partials
+from electric_toolbox.sinks import MemorySink
+
+
+def _build(posts: int, cached: bool) -> List[float]:
+    """Seconds spent in each (full page) ``render`` call."""
+    spent: List[float] = []
+    render, get_or_render = Template.render, RenderedPartials.get_or_render
+
+    def timed(self: Template, *args: Any, **kwargs: Any) -> str:
+        start = time.perf_counter()
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            if not (self.name or '').endswith('_fragment.html'):
+                spent.append(time.perf_counter() - start)
+
+    def uncached(self: RenderedPartials, key: Hashable, render: Callable[[], str]) -> str:
+        return render()
+
+    Template.render = timed  # type: ignore[method-assign]
+    if not cached:
+        RenderedPartials.get_or_render = uncached  # type: ignore[method-assign]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            configs = _write_corpus(Path(tmp) / 'content', posts, kilobytes=4)
+            env = Environment(
+                loader=PackageLoader('electric_toolbox', 'templates'), autoescape=True, extensions=[PartialCache]
+            )
+            env.globals.update(
+                icons=load_icons(Path('resources/icons')), site_name='Bench', build_year=2024, inline_css=''
+            )
+            main(base_path=Path(tmp) / 'website', j2_env=env, configs=configs, sink=MemorySink(), workers=1)
+            if cached:
+                partials = rendered_partials(env)
+                print(f'cache: {partials.misses} renders, {partials.hits} hits, {partials.saved * 1000:.1f} ms saved')
+    finally:
+        Template.render, RenderedPartials.get_or_render = render, get_or_render  # type: ignore[method-assign]
+    return spent
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--posts', type=int, default=500)
+    args = parser.parse_args()
+
+    _build(10, cached=True)  # warm up: template compilation, imports
+    for label, cached in (('every page', False), ('cached partials', True)):
+        spent = _build(args.posts, cached)
+        print(f'{label:>16}: {len(spent)} pages, {sum(spent) / len(spent) * 1000:.3f} ms per page')
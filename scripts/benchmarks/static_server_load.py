@@ -0,0 +1,86 @@
+"""Load test of the static server: requests per second and latency percentiles.
+
+Usage: uv run python scripts/benchmarks/static_server_load.py [--site website] [--clients 8] [--seconds 10]
+
+Without ``--site`` a synthetic site (HTML pages with ``.gz`` siblings) is
+served from a temporary folder. Each client keeps one HTTP/1.1 connection open
+and requests random pages, as a browser would: compressed, and a third of the
+time revalidating with ``If-None-Match`` (a 304).
+"""
+
+import argparse
+import http.client
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from electric_toolbox.server import make_server, precompress
+
+_PARAGRAPH = '<p>A paragraph of prose about building static sites, with <em>some</em> markup.</p>\n'
+
+
+def _synthetic_site(root: Path, pages: int, kilobytes: int) -> Path:
+    body = _PARAGRAPH * (kilobytes * 1024 // len(_PARAGRAPH))
+    (root / 'posts').mkdir(parents=True)
+    (root / 'index.html').write_text(f'<!doctype html><title>Home</title>{body}', encoding='utf-8')
+    for i in range(pages):
+        (root / 'posts' / f'post-{i}.html').write_text(f'<!doctype html><title>{i}</title>{body}', encoding='utf-8')
+    precompress(root)
+    return root
+
+
+def _client(port: int, paths: List[str], deadline: float, latencies: List[float], statuses: Dict[int, int]) -> None:
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    etags: Dict[str, str] = {}
+    while time.perf_counter() < deadline:
+        path = random.choice(paths)  # noqa: S311
+        headers = {'Accept-Encoding': 'br, gzip'}
+        if path in etags and random.random() < 1 / 3:  # noqa: S311
+            headers['If-None-Match'] = etags[path]
+        start = time.perf_counter()
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        etags[path] = response.getheader('ETag', '')
+    connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--site', type=Path, help='A built site (default: a synthetic one).')
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--kilobytes', type=int, default=30)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = args.site or _synthetic_site(Path(tmp), args.pages, args.kilobytes)
+        server = make_server(site, port=0, quiet=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        paths = [f'/{location}' for location in server.files if location.endswith('.html')]
+
+        latencies: List[float] = []
+        statuses: Dict[int, int] = {}
+        deadline = time.perf_counter() + args.seconds
+        clients = [
+            threading.Thread(target=_client, args=(server.server_address[1], paths, deadline, latencies, statuses))
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        server.shutdown()
+        server.server_close()
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'{len(paths)} pages, {args.clients} clients, {args.seconds:.0f}s: {len(latencies)} requests {statuses}')
+    print(f'{len(latencies) / args.seconds:.0f} requests/s')
+    print(f'latency p50 {percentiles[49] * 1000:.2f} ms, p99 {percentiles[98] * 1000:.2f} ms')
@@ -0,0 +1,98 @@
+"""Peak memory of a full build versus a streaming build, as the corpus grows.
+
+Usage: uv run python scripts/benchmarks/streaming_build.py [--posts 200 400 800] [--kilobytes 40]
+
+Each build runs in its own process (peak RSS is per process) and writes to a
+temporary ``website/`` folder.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+from jinja2 import Environment, PackageLoader
+
+from electric_toolbox.icons import load_icons
+from electric_toolbox.main import main
+from electric_toolbox.partials import PartialCache
+
+_PARAGRAPH = (
+    'A paragraph of prose about building static sites, with *some* markup and a [link](https://example.com).\n\n'
+)
+
+
+def _write_corpus(root: Path, posts: int, kilobytes: int) -> Dict[str, Any]:
+    (root / 'posts').mkdir(parents=True)
+    (root / 'index.md').write_text('Home.', encoding='utf-8')
+    body = _PARAGRAPH * (kilobytes * 1024 // len(_PARAGRAPH))
+    for i in range(posts):
+        (root / 'posts' / f'post-{i:05d}.md').write_text(
+            f'---\ntitle: "Post {i}"\nimage: "https://example.com/{i}.png"\n'
+            f'publication_time: 2024-01-01 10:00:00\nsection: "Bench"\ntags:\n  - tag{i % 20}\n---\n\n'
+            f'# Post {i}\n\n{body}',
+            encoding='utf-8',
+        )
+    return {
+        'base_url': 'https://example.com',
+        'website': {
+            'title': 'Bench',
+            'description': 'Benchmark',
+            'image': 'https://example.com/og.png',
+            'locale': 'en_US',
+        },
+        'settings': {'include_drafts': False},
+        'sections': {
+            'home': {
+                'title': 'Home',
+                'description': 'Home',
+                'url': 'index',
+                'read_from': {'type': 'singular', 'path': str(root / 'index.md')},
+            },
+            'blog': {
+                'title': 'Posts',
+                'description': 'Posts',
+                'url': 'posts',
+                'read_from': {'type': 'plural', 'each': 'singular', 'path': str(root / 'posts')},
+            },
+        },
+    }
+
+
+def _build(posts: int, kilobytes: int, streaming: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        configs = _write_corpus(Path(tmp) / 'content', posts, kilobytes)
+        env = Environment(
+            loader=PackageLoader('electric_toolbox', 'templates'), autoescape=True, extensions=[PartialCache]
+        )
+        env.globals.update(icons=load_icons(Path('resources/icons')), site_name='Bench', build_year=2024, inline_css='')
+        main(base_path=Path(tmp) / 'website', j2_env=env, configs=configs, streaming=streaming)
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)  # MiB (Linux reports KiB)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--posts', type=int, nargs='+', default=[200, 400, 800])
+    parser.add_argument('--kilobytes', type=int, default=40)
+    parser.add_argument('--child', choices=['full', 'streaming'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        _build(args.posts[0], args.kilobytes, streaming=args.child == 'streaming')
+        sys.exit()
+
+    print(f'{"posts":>6} {"full MiB":>9} {"streaming MiB":>14}')
+    for count in args.posts:
+        peaks = [
+            subprocess.run(  # noqa: S603
+                [sys.executable, __file__, '--child', mode, '--posts', str(count), '--kilobytes', str(args.kilobytes)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            for mode in ('full', 'streaming')
+        ]
+        print(f'{count:>6} {peaks[0]:>9} {peaks[1]:>14}')
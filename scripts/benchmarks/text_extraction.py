@@ -0,0 +1,92 @@
+"""Compare the single-pass plain-text extraction with the former regex passes.
+
+Usage: uv run python scripts/benchmarks/text_extraction.py [--megabytes 4]
+
+The former approach converted the post, then ran seven regex substitutions over
+the raw Markdown for the excerpt and a ``re.findall`` for the reading time; the
+extraction now walks the element tree the conversion already built.
+"""
+
+import argparse
+import re
+import time
+from typing import Any, Callable
+
+from electric_toolbox.parsing.components.text import PlainText, functions
+from electric_toolbox.parsing.sections.blog.article_functions import _md_to_html
+
+_SECTION = """## Section {i}
+
+Some *emphasised* text with `inline code`, a [link](https://example.com/{i}) and an
+image ![alt](image-{i}.png). More words follow to make a realistic paragraph of prose
+that a reader would go through at a steady pace, footnote included[^{i}].
+
+```python
+def function_{i}(value):
+    return value * {i}
+```
+
+| column | value |
+|--------|-------|
+| a      | {i}   |
+
+[^{i}]: Footnote number {i}.
+
+"""
+
+_LEGACY_RES = [
+    (re.compile(r'```.*?```', re.DOTALL), ' '),
+    (re.compile(r'^#{1,6}.*$', re.MULTILINE), ' '),
+    (re.compile(r'!\[[^\]]*\]\([^)]*\)'), ' '),
+    (re.compile(r'\[([^\]]*)\]\([^)]*\)'), r'\1'),
+    (re.compile(r'`[^`]*`'), ' '),
+    (re.compile(r'[*_>~]'), ''),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def _regex_passes(markdown: str) -> tuple[str, int]:
+    """The former excerpt + reading-time work (on top of the conversion)."""
+    text = markdown
+    for pattern, replacement in _LEGACY_RES:
+        text = pattern.sub(replacement, text)
+    return text.strip()[:160], len(re.findall(r'\w+', markdown))
+
+
+def _timing(function: Callable[..., PlainText], spent: list[float]) -> Callable[..., PlainText]:
+    def wrapper(*args: Any) -> PlainText:
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            spent.append(time.perf_counter() - start)
+
+    return wrapper
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--megabytes', type=float, default=4)
+    args = parser.parse_args()
+
+    sections = []
+    size = 0
+    while size < args.megabytes * 1024 * 1024:
+        sections.append(_SECTION.format(i=len(sections)))
+        size += len(sections[-1])
+    markdown = '# Benchmark\n\n' + ''.join(sections)
+    print(f'{len(markdown) / 1024 / 1024:.1f} MB of Markdown, {len(sections)} sections')
+
+    start = time.perf_counter()
+    _regex_passes(markdown)
+    regexes = time.perf_counter() - start
+
+    spent: list[float] = []
+    functions.extract_plain_text = _timing(functions.extract_plain_text, spent)
+    start = time.perf_counter()
+    _md_to_html(markdown)
+    conversion = time.perf_counter() - start
+
+    print(f'conversion (with extraction): {conversion:.2f}s')
+    print(f'former regex passes:          {regexes:.2f}s')
+    print(f'single-pass extraction:       {sum(spent):.2f}s')
@@ -1,40 +1,239 @@
-"""Script to generate website."""
+"""Script to generate website.
 
+Usage::
+
+    uv run scripts/generate_site.py                                        # full, clean build
+    uv run scripts/generate_site.py --changed-template sections/blog/_share.html
+    uv run scripts/generate_site.py --archive build/website.tar.gz
+    uv run scripts/generate_site.py --previous-manifest deployed-manifest.json
+    uv run scripts/generate_site.py --streaming
+    uv run scripts/generate_site.py --validate
+    uv run scripts/generate_site.py --bundle-vendor
+    uv run scripts/generate_site.py --weight-report [--enforce-budgets]
+    uv run scripts/generate_site.py --no-service-worker
+
+``--changed-template`` (repeatable) keeps the existing ``website/`` folder and
+only re-renders the pages that load one of the given templates. ``--archive``
+streams the whole site into a single ``.zip`` / ``.tar`` / ``.tar.gz`` instead
+of writing ``website/``. ``--streaming`` parses, renders and writes one post at
+a time, for a bounded-memory build of a large corpus (same output).
+``--validate`` renders nothing: it checks the frontmatter of every post in
+parallel, prints all the errors and exits with status 1 if there are any.
+
+Alpine.js and htmx are copied from their pinned copies in ``resources/vendor/``
+into ``website/vendor/`` under content-hashed names, with SRI hashes;
+``--bundle-vendor`` concatenates them into a single script. A copy missing or
+not matching ``resources/vendor/SHA256SUMS`` fails the build.
+
+The pages register a service worker (``sw.js``) precaching the homepage, the
+indexes and the newest posts with their current revisions, so repeat visits
+and offline reading are served from the browser's cache;
+``--no-service-worker`` leaves it out.
+
+The static assets declared in the ``[[assets]]`` of ``compile.config.toml``
+(the stylesheet, the share page, the images next to the posts) are mirrored
+into ``website/`` (or added to the ``--archive``): hard-linked or cloned when
+possible, and only the files that changed since the last build. They are in the
+deploy manifest too; only the sources modified since the last manifest are
+hashed again.
+
+Converted post bodies are cached in ``build/markdown-cache/`` (keyed by the
+Markdown source, the extension settings and the library versions), so a
+template or config edit re-renders the pages without converting any post
+again; ``--no-conversion-cache`` converts everything.
+
+``--weight-report`` measures every page as it is written: raw, minified and
+gzip size, split into inlined CSS, social meta tags, JSON-LD, inline icons,
+inline scripts, content and the remaining markup. It writes
+``build/page-weights.json``, prints the heaviest pages and the pages over the
+``[budgets]`` of ``compile.config.toml``; ``--enforce-budgets`` then exits
+with status 1 if any page is over budget.
+
+Every build writes ``build/deploy-manifest.json`` (size + sha256 of each output
+file). With ``--previous-manifest`` (the manifest of what is deployed) it also
+writes ``build/deploy-delta.json``: the files to upload/delete and the URLs to
+purge.
+"""
+
+import argparse
+import sys
 import tomllib
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from jinja2 import Environment, PackageLoader
+from electric_toolbox.assets import AssetSync, asset_files, asset_folders, asset_manifest, clean_and_sync, sync_assets
+from electric_toolbox.main import main, validate
+from electric_toolbox.manifest import (
+    ManifestSink,
+    diff_manifests,
+    load_manifest,
+    save_manifest,
+    save_manifest_diff,
+)
+from electric_toolbox.parsing import format_report
+from electric_toolbox.sinks import ArchiveSink, DirectorySink, OutputSink
+from electric_toolbox.vendor import write_vendor_scripts
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
-import electric_toolbox
-from electric_toolbox.icons import load_icons
-from electric_toolbox.main import main
+    from electric_toolbox.weight import PageWeight, WeightSink
 
 WEBSITE_DIRECTORY: Path = Path('website')
-electric_toolbox.clean_or_create(WEBSITE_DIRECTORY)
+# Size + content hash of every output file of the last build, and its delta.
+MANIFEST_PATH: Path = Path('build/deploy-manifest.json')
+DELTA_PATH: Path = Path('build/deploy-delta.json')
+# Size of every page, by category (see electric_toolbox.weight).
+WEIGHTS_PATH: Path = Path('build/page-weights.json')
+# Markdown conversions, by source and converter (see electric_toolbox.parsing.components.text.cache).
+CONVERSION_CACHE_PATH: Path = Path('build/markdown-cache')
 
 
-with open(Path('compile.config.toml'), 'rb') as conf:
-    configs: Dict[str, Any] = tomllib.load(conf)
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate the static website.')
+    parser.add_argument(
+        '--changed-template',
+        action='append',
+        dest='changed_templates',
+        metavar='PATH',
+        help='Only re-render pages depending on this template (repeatable).',
+    )
+    parser.add_argument(
+        '--archive',
+        type=Path,
+        metavar='PATH',
+        help='Write the site into this .zip/.tar/.tar.gz archive instead of website/.',
+    )
+    parser.add_argument(
+        '--previous-manifest',
+        type=Path,
+        metavar='PATH',
+        help='Manifest of the deployed site; writes the upload/purge delta against it.',
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Parse, render and write one post at a time (bounded memory, same output).',
+    )
+    parser.add_argument(
+        '--bundle-vendor',
+        action='store_true',
+        help='Serve Alpine.js and htmx as one fingerprinted bundle.',
+    )
+    parser.add_argument(
+        '--no-conversion-cache',
+        action='store_true',
+        help='Convert every post again instead of reusing the cached conversions.',
+    )
+    parser.add_argument(
+        '--no-service-worker',
+        action='store_true',
+        help='Do not write nor register the service worker (sw.js).',
+    )
+    parser.add_argument(
+        '--weight-report',
+        action='store_true',
+        help='Report the size of every page by category and the pages over the [budgets].',
+    )
+    parser.add_argument(
+        '--enforce-budgets',
+        action='store_true',
+        help='Exit with status 1 if a page is over its [budgets] (implies --weight-report).',
+    )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Only check every post and report all the errors (no output is written).',
+    )
+    return parser.parse_args()
 
-_website: Dict[str, Any] = configs.get('website', {})
 
-jinja_env = Environment(
-    loader=PackageLoader('electric_toolbox', 'templates'),
-    autoescape=True,
-)
-jinja_env.globals['icons'] = load_icons(Path('resources/icons'))
-jinja_env.globals['site_name'] = _website.get('name') or _website.get('title', '')
-jinja_env.globals['build_year'] = datetime.now(tz=timezone.utc).year
-
-# Inline the (pre-built) Tailwind CSS so there is no render-blocking stylesheet
-# request. Run `bun run build:css` before generating (the justfile / CI do).
-_css_path = Path('build/style.css')
-jinja_env.globals['inline_css'] = _css_path.read_text(encoding='utf-8') if _css_path.is_file() else ''
-
-main(
-    base_path=WEBSITE_DIRECTORY,
-    j2_env=jinja_env,
-    configs=configs,
-)
+def _jinja_env(website: Dict[str, Any], service_worker: bool) -> 'Environment':
+    from electric_toolbox.generate import template_environment  # noqa: PLC0415 -- not needed by --validate
+    from electric_toolbox.service_worker import SERVICE_WORKER_LOCATION  # noqa: PLC0415
+
+    env = template_environment(website)
+    if service_worker:
+        env.globals['service_worker'] = f'/{SERVICE_WORKER_LOCATION}'
+    return env
+
+
+def _report_weights(weights: List['PageWeight'], configs: Dict[str, Any]) -> bool:
+    """Save and print the page weights; whether every page is within its budgets."""
+    from electric_toolbox.weight import (  # noqa: PLC0415 -- only for --weight-report
+        WeightBudget,
+        format_weight_report,
+        over_budget,
+        save_weights,
+    )
+
+    violations = over_budget(weights, WeightBudget.model_validate(configs.get('budgets', {})))
+    save_weights(weights, WEIGHTS_PATH)
+    print(format_weight_report(weights, violations))
+    return not violations
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+
+    if args.validate:
+        with open(Path('compile.config.toml'), 'rb') as conf:
+            report = validate(tomllib.load(conf))
+        print(format_report(report))
+        sys.exit(0 if report.ok else 1)
+
+    with open(Path('compile.config.toml'), 'rb') as conf:
+        configs: Dict[str, Any] = tomllib.load(conf)
+    assets = asset_files(asset_folders(configs))
+
+    output: OutputSink
+    archive: Optional[ArchiveSink] = None
+    synced: Optional[AssetSync] = None
+    if args.archive is not None:
+        output = archive = ArchiveSink(args.archive)
+    else:
+        if args.changed_templates is None:
+            synced = clean_and_sync(WEBSITE_DIRECTORY, assets)
+        else:
+            synced = sync_assets(assets, WEBSITE_DIRECTORY)
+        output = DirectorySink(WEBSITE_DIRECTORY)
+    # A targeted re-render only rewrites some pages; keep the others' entries.
+    sink = ManifestSink(output, base=load_manifest(MANIFEST_PATH) if args.changed_templates else None)
+
+    jinja_env = _jinja_env(configs.get('website', {}), service_worker=not args.no_service_worker)
+    pages: Optional['WeightSink'] = None
+    if args.weight_report or args.enforce_budgets:
+        from electric_toolbox.weight import WeightSink  # noqa: PLC0415 -- only for --weight-report
+
+        pages = WeightSink(sink)
+    try:
+        jinja_env.globals['vendor_scripts'] = write_vendor_scripts(sink, bundle=args.bundle_vendor)
+        main(
+            base_path=WEBSITE_DIRECTORY,
+            j2_env=jinja_env,
+            configs=configs,
+            changed_templates=args.changed_templates,
+            sink=sink if pages is None else pages,
+            streaming=args.streaming,
+            conversion_cache=None if args.no_conversion_cache else CONVERSION_CACHE_PATH,
+        )
+        if archive is not None:
+            for asset in assets:
+                archive.add_file(asset.location, asset.source)
+    finally:
+        sink.close()
+    if synced is not None:
+        print(f'Assets: {len(synced.copied)} copied, {len(synced.unchanged)} unchanged.')
+    else:
+        print(f'Assets: {len(assets)} archived.')
+    for location, entry in asset_manifest(assets, previous=MANIFEST_PATH).items():
+        sink.record(location, entry)
+    save_manifest(sink.manifest, MANIFEST_PATH)
+    if args.previous_manifest is not None:
+        save_manifest_diff(
+            diff_manifests(load_manifest(args.previous_manifest), sink.manifest),
+            base_url=configs.get('base_url', ''),
+            path=DELTA_PATH,
+        )
+    if pages is not None and not _report_weights(pages.weights, configs) and args.enforce_budgets:
+        sys.exit(1)
@@ -1,8 +1,22 @@
 """Electric Toolbox."""
 
-from .main import main
+from typing import TYPE_CHECKING, Any
+
 from .utils import clean_or_create
 
+if TYPE_CHECKING:
+    from .main import main
+
+
+def __getattr__(name: str) -> Any:
+    """Import the build (Jinja2, the parsers, the renderers) only when it is used."""
+    if name == 'main':
+        from .main import main  # noqa: PLC0415
+
+        return main
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 __all__ = [
     'clean_or_create',
     'main',
@@ -0,0 +1,231 @@
+"""Static assets: the files copied into the site as they are.
+
+The ``[[assets]]`` entries of ``compile.config.toml`` declare them: a file or a
+folder, mirrored under a folder of the site (e.g. the built stylesheet, the
+vendored share page, the images next to the posts). :func:`asset_files` lists
+what they hold and :func:`sync_assets` mirrors it into ``website/``
+(:func:`clean_and_sync` empties the folder of everything else first):
+
+* a file already there with the same size and modification time (or, when only
+  the time differs, the same contents) is left alone, so a build only touches
+  the assets that changed;
+* the others are hard-linked to their source when the site is on the same
+  file system (no data is copied at all), else cloned (a reflink, on file
+  systems that share blocks), else copied in the kernel (``copy_file_range``),
+  else copied;
+* the files are placed from a thread pool: the work is system calls, which
+  release the GIL, so thousands of images sync in a fraction of a second.
+
+A copy keeps its source's modification time, so the next sync skips it.
+:func:`asset_manifest` gives the assets their deploy manifest entries, so a
+deploy delta lists the new and changed images too; only the sources modified
+since the previous manifest was written are hashed again.
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict
+
+from .configs.functions import IMAGE_SUFFIXES
+from .manifest import ManifestEntry, load_manifest
+from .utils import clean_or_create
+
+# FICLONE (linux/fs.h): share the source's blocks (btrfs, XFS, bcachefs).
+_FICLONE = 0x40049409
+_COPY_CHUNK = 1 << 30
+_HASH_CHUNK = 1 << 20
+
+
+class AssetFolder(BaseModel):
+    """A file or folder whose files are copied into the site (an ``[[assets]]`` entry)."""
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    source: Path
+    destination: str = ''  # folder under the site root ('' is the root)
+    images: bool = False  # only the images of the folder (e.g. next to the posts)
+
+
+class AssetFile(NamedTuple):
+    """A file to copy and where it goes."""
+
+    source: Path
+    location: str  # relative to the site root
+
+
+class AssetSync(NamedTuple):
+    """What :func:`sync_assets` did, by location."""
+
+    copied: List[str]
+    unchanged: List[str]
+
+
+def asset_folders(configs: Dict[str, Any]) -> List[AssetFolder]:
+    """The ``[[assets]]`` of the configs."""
+    return [AssetFolder.model_validate(folder) for folder in configs.get('assets', [])]
+
+
+def asset_files(folders: Iterable[AssetFolder]) -> List[AssetFile]:
+    """The files of the asset folders (a missing source has none), sorted by location.
+
+    A folder's files keep their path under it; a file keeps its name.
+    """
+    files = {}
+    for folder in folders:
+        prefix = f'{folder.destination.strip("/")}/'.lstrip('/')
+        if folder.source.is_file():
+            files[prefix + folder.source.name] = folder.source
+            continue
+        for directory, _, names in os.walk(folder.source):
+            for name in names:
+                path = Path(directory, name)
+                if not folder.images or path.suffix.lower() in IMAGE_SUFFIXES:
+                    files[prefix + path.relative_to(folder.source).as_posix()] = path
+    return [AssetFile(source, location) for location, source in sorted(files.items())]
+
+
+def _digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        while chunk := handle.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _unchanged(source: Path, target: Path) -> bool:
+    """Whether ``target`` already holds ``source``: the same file, size and time, or contents."""
+    try:
+        theirs, ours = source.stat(), target.stat()
+    except FileNotFoundError:
+        return False
+    if (theirs.st_dev, theirs.st_ino) == (ours.st_dev, ours.st_ino):
+        return True
+    if theirs.st_size != ours.st_size:
+        return False
+    return theirs.st_mtime_ns == ours.st_mtime_ns or _digest(source) == _digest(target)
+
+
+def _clone(source: Path, target: Path) -> None:
+    """Copy without going through user space: a reflink, else ``copy_file_range``, else a plain copy."""
+    with source.open('rb') as src, target.open('wb') as dst:
+        try:
+            import fcntl  # noqa: PLC0415 -- POSIX only
+
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+        try:
+            while os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK):
+                pass
+            return
+        except (AttributeError, OSError):
+            dst.seek(0)
+            dst.truncate()
+            src.seek(0)
+        shutil.copyfileobj(src, dst)
+
+
+def _link(source: Path, target: Path) -> bool:
+    """Hard-link ``target`` to ``source``; ``False`` across file systems or where there are no hard links."""
+    try:
+        os.link(source, target)
+    except OSError:
+        return False
+    return True
+
+
+def _place(asset: AssetFile, root: Path, hardlink: bool) -> Optional[str]:
+    """Put ``asset`` under ``root``; its location if it was copied, ``None`` if it was already there."""
+    target = root / asset.location
+    if _unchanged(asset.source, target):
+        return None
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Written next to the target, then renamed over it: a reader never sees half a file.
+    temporary = target.with_name(f'.{target.name}.sync')
+    temporary.unlink(missing_ok=True)
+    if not (hardlink and _link(asset.source, temporary)):
+        _clone(asset.source, temporary)
+        stat = asset.source.stat()
+        os.utime(temporary, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(temporary, target)
+    return asset.location
+
+
+def sync_assets(
+    assets: Iterable[AssetFile],
+    root: Path,
+    hardlink: bool = True,
+    workers: Optional[int] = None,
+) -> AssetSync:
+    """Mirror the asset files into the site folder, skipping those already there.
+
+    Args:
+        assets: The files (see :func:`asset_files`).
+        root: The site folder (``website/``).
+        hardlink: Link the files to their sources when possible. A hard link
+            is the source file itself: leave it off if something edits the
+            site folder in place.
+        workers: Threads placing the files; ``None`` is Python's default.
+
+    Returns:
+        The locations copied and the ones left as they were.
+    """
+    assets = list(assets)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        placed = list(pool.map(lambda asset: _place(asset, root, hardlink), assets))
+    return AssetSync(
+        copied=[location for location in placed if location is not None],
+        unchanged=[asset.location for asset, location in zip(assets, placed, strict=True) if location is None],
+    )
+
+
+def _entry(asset: AssetFile, known: Optional[ManifestEntry], since_ns: int) -> ManifestEntry:
+    """The entry of ``asset``: ``known`` if its source has its size and was not modified since."""
+    stat = asset.source.stat()
+    if known is not None and known.size == stat.st_size and stat.st_mtime_ns < since_ns:
+        return known
+    return ManifestEntry(size=stat.st_size, sha256=_digest(asset.source).hex())
+
+
+def asset_manifest(
+    assets: Iterable[AssetFile],
+    previous: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, ManifestEntry]:
+    """The deploy manifest entries of the assets (size and sha256 of their sources), by location.
+
+    Args:
+        assets: The files (see :func:`asset_files`).
+        previous: The manifest of the last build: its entries are kept for the
+            sources with the same size, not modified since it was written.
+        workers: Threads hashing the other sources; ``None`` is Python's default.
+
+    Returns:
+        The entry of every asset.
+    """
+    assets = list(assets)
+    known = load_manifest(previous).files if previous is not None else {}
+    since_ns = previous.stat().st_mtime_ns if previous is not None and previous.is_file() else 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = pool.map(lambda asset: _entry(asset, known.get(asset.location), since_ns), assets)
+        return dict(zip((asset.location for asset in assets), entries, strict=True))
+
+
+def clean_and_sync(root: Path, assets: Sequence[AssetFile]) -> AssetSync:
+    """Empty the site folder but for the assets, then sync them (the unchanged ones are not copied again).
+
+    Args:
+        root: The site folder (``website/``), created if missing.
+        assets: The files (see :func:`asset_files`).
+
+    Returns:
+        What :func:`sync_assets` did.
+    """
+    clean_or_create(root, keep={root / asset.location for asset in assets})
+    return sync_assets(assets, root)
@@ -2,6 +2,7 @@
 
 from .functions import create_file_data, list_folder_files, parse_website_config
 from .models import (
+    DEFAULT_PREFETCH,
     ConfigContents,
     ConfigHead,
     ConfigSettings,
@@ -17,6 +18,7 @@ from .models import (
 )
 
 __all__ = [
+    'DEFAULT_PREFETCH',
     'ConfigContents',
     'ConfigHead',
     'ConfigSettings',
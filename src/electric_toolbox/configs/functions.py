@@ -9,6 +9,7 @@ from expression.extra.result import traverse
 from pydantic import ValidationError
 
 from .models import (
+    DEFAULT_PREFETCH,
     ConfigContents,
     ConfigHead,
     ConfigSettings,
@@ -23,6 +24,9 @@ from .models import (
     WebsiteInfo,
 )
 
+# Files of a plural section that are not posts: the images shown by the posts next to them.
+IMAGE_SUFFIXES = frozenset({'.avif', '.bmp', '.gif', '.ico', '.jpeg', '.jpg', '.png', '.svg', '.tif', '.tiff', '.webp'})
+
 
 def create_file_data(
     file_path: Path,
@@ -125,12 +129,19 @@ def _parse_read_from_singular(data: Dict[str, Any]) -> Generator[Any, Any, ReadF
     )
 
 
+def _unloaded_file_data(file_path: Path) -> Result[FileData, Exception]:
+    """A FileData whose contents are read later (streaming build)."""
+    return Ok(FileData(path=file_path, file_name=file_path.name, contents=''))
+
+
 @effect.result[ReadFromPlural, Exception]()
-def _parse_read_from_plural(data: Dict[str, Any]) -> Generator[Any, Any, ReadFromPlural]:
+def _parse_read_from_plural(data: Dict[str, Any], load_contents: bool = True) -> Generator[Any, Any, ReadFromPlural]:
     """Parses read_from plural configuration.
 
     Args:
         data: The read_from data.
+        load_contents: Read every file now. Otherwise the files are only
+            listed, with empty contents.
 
     Returns:
         Result[ReadFromPlural, Exception]: Ok(ReadFromPlural) if successful,
@@ -141,22 +152,23 @@ def _parse_read_from_plural(data: Dict[str, Any]) -> Generator[Any, Any, ReadFro
         path=data.get('path', 'will_error'),
         files=(
             yield from traverse(
-                create_file_data,
+                create_file_data if load_contents else _unloaded_file_data,
                 list_folder_files(
                     Path(
                         data.get('path', 'will_error'),
                     )
-                ),
+                ).filter(lambda path: path.suffix.lower() not in IMAGE_SUFFIXES),
             )
         ),
     )
 
 
-def _parse_read_from(data: Dict[str, Any]) -> Result[ReadFrom, Exception]:
+def _parse_read_from(data: Dict[str, Any], load_contents: bool = True) -> Result[ReadFrom, Exception]:
     """Parses read_from configuration.
 
     Args:
         data: The read_from data.
+        load_contents: Read the files of plural sections now.
 
     Returns:
         Result[ReadFrom, Exception]: Ok(ReadFrom) if successful,
@@ -166,17 +178,18 @@ def _parse_read_from(data: Dict[str, Any]) -> Result[ReadFrom, Exception]:
         case 'singular':
             return _parse_read_from_singular(data)
         case 'plural':
-            return _parse_read_from_plural(data)
+            return _parse_read_from_plural(data, load_contents)
         case _:
-            return Error(Exception(f"Invalid read_from type: {data['type']}"))
+            return Error(Exception(f'Invalid read_from type: {data["type"]}'))
 
 
 @effect.result[Section, Exception]()
-def _parse_section(data: Dict[str, Any]) -> Generator[Any, Any, Section]:
+def _parse_section(data: Dict[str, Any], load_contents: bool = True) -> Generator[Any, Any, Section]:
     """Parses a single section.
 
     Args:
         data: The section data.
+        load_contents: Read the files of plural sections now.
 
     Returns:
         Result[Section, Exception]: Ok(Section) if successful,
@@ -204,20 +217,32 @@ def _parse_section(data: Dict[str, Any]) -> Generator[Any, Any, Section]:
         except KeyError as e:
             return Error(Exception(f'Missing url field in section configuration: {e}', e))
 
+    def _get_prefetch(data: Dict[str, Any]) -> Result[int, Exception]:
+        """Gets the prefetch count from the data."""
+        prefetch = data.get('prefetch', DEFAULT_PREFETCH)
+        if isinstance(prefetch, bool) or not isinstance(prefetch, int) or prefetch < 0:
+            return Error(Exception(f'Invalid prefetch field in section configuration: {prefetch!r}'))
+        return Ok(prefetch)
+
     return Section(
         title=(yield from _get_title(data)),
         description=(yield from _get_description(data)),
         resource_path=(yield from _get_url(data)),
-        read_from=(yield from _parse_read_from(data['read_from'])),
+        read_from=(yield from _parse_read_from(data['read_from'], load_contents)),
+        prefetch=(yield from _get_prefetch(data)),
     )
 
 
 @effect.result[Dict[str, Section], Exception]()
-def _parse_config_sections(data: Dict[str, Any]) -> Generator[Any, Any, Dict[str, Section]]:
+def _parse_config_sections(
+    data: Dict[str, Any],
+    load_contents: bool = True,
+) -> Generator[Any, Any, Dict[str, Section]]:
     """Parses config sections.
 
     Args:
         data: The sections data.
+        load_contents: Read the files of plural sections now.
 
     Returns:
         Result[ConfigSections, Exception]: Ok(ConfigSections) if successful,
@@ -225,7 +250,7 @@ def _parse_config_sections(data: Dict[str, Any]) -> Generator[Any, Any, Dict[str
     """
     sections = {}
     for name, section_data in data.items():
-        section_result = yield from _parse_section(section_data)
+        section_result = yield from _parse_section(section_data, load_contents)
         sections[name] = section_result
     return sections
 
@@ -263,11 +288,13 @@ def _parse_website(data: Dict[str, Any]) -> Result[WebsiteInfo, Exception]:
 
 
 @effect.result[SiteConfigs, Exception]()
-def parse_website_config(configs: Dict[str, Any]) -> Generator[Any, Any, SiteConfigs]:
+def parse_website_config(configs: Dict[str, Any], load_contents: bool = True) -> Generator[Any, Any, SiteConfigs]:
     """Parse website configuration data.
 
     Args:
         configs: The website configuration data.
+        load_contents: Read the files of plural sections (the posts) now. The
+            streaming build lists them only and reads each one when it is used.
 
     Returns:
         Result[SiteConfigs, Exception]: Ok(SiteConfigs) if successful,
@@ -277,5 +304,5 @@ def parse_website_config(configs: Dict[str, Any]) -> Generator[Any, Any, SiteCon
         base_url=configs.get('base_url', ''),
         website=(yield from _parse_website(configs.get('website', {}))),
         settings=(yield from _parse_config_settings(configs.get('settings', {}))),
-        sections=(yield from _parse_config_sections(configs.get('sections', {}))),
+        sections=(yield from _parse_config_sections(configs.get('sections', {}), load_contents)),
     )
@@ -60,6 +60,10 @@ class ReadFromPlural(BaseModel):
 ReadFrom = Union[ReadFromSingular, ReadFromPlural]
 
 
+# Pages a section's pages hint the browser to prefetch, unless configured.
+DEFAULT_PREFETCH = 3
+
+
 class Section(BaseModel):
     """Section data."""
 
@@ -68,6 +72,7 @@ class Section(BaseModel):
     description: str
     resource_path: str
     read_from: ReadFrom
+    prefetch: int = DEFAULT_PREFETCH  # how many likely next pages each page prefetches
 
 
 class SiteAuthor(BaseModel):
@@ -4,12 +4,16 @@ from enum import Enum, auto
 
 
 class ExistingTemplates(Enum):
-    """Enum of full-page templates.
+    """Enum of page templates.
 
-    With hx-boost there is one document per page; htmx fetches it and swaps
-    ``#body-content`` on navigation, so no separate fragment templates exist.
+    Every page is written twice: the full document (first load, crawlers) and
+    its htmx fragment (``*_FRAGMENT``: the title and ``#body-content`` only),
+    which boosted navigation fetches instead of the whole document.
     """
 
     INDEX = auto()
     BLOG_INDEX = auto()
     BLOG_ARTICLE = auto()
+    INDEX_FRAGMENT = auto()
+    BLOG_INDEX_FRAGMENT = auto()
+    BLOG_ARTICLE_FRAGMENT = auto()
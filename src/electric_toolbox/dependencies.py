@@ -0,0 +1,108 @@
+"""Template dependency graph used for targeted re-rendering.
+
+Every output page is rendered from one root template that pulls in others via
+``{% extends %}`` / ``{% include %}``. The graph records, per output page, the
+full set of templates it loads, so a change to a single partial only needs the
+pages that actually depend on it to be re-rendered.
+"""
+
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable
+
+from jinja2 import Environment, meta
+from pydantic import BaseModel, ConfigDict
+
+# Marker for a page that includes a template whose name is only known at render
+# time (e.g. ``{% include some_variable %}``). Such pages match any change.
+DYNAMIC_DEPENDENCY = '*'
+
+
+class TemplateDependencies(BaseModel):
+    """Output page destination -> every template it loads (root included)."""
+
+    model_config = ConfigDict(frozen=True)
+    pages: Dict[str, FrozenSet[str]] = {}
+
+
+def referenced_templates(env: Environment, name: str) -> FrozenSet[str]:
+    """Templates directly referenced by ``name`` through extends/include/import.
+
+    Args:
+        env: The Jinja2 environment (its loader provides the sources).
+        name: The template name, relative to the templates folder.
+
+    Returns:
+        The referenced template names. Non-constant references are reported as
+        :data:`DYNAMIC_DEPENDENCY`.
+    """
+    if env.loader is None:
+        raise ValueError('The Jinja2 environment has no loader to read templates from')
+    source, _, _ = env.loader.get_source(env, name)
+    return frozenset(
+        ref if ref is not None else DYNAMIC_DEPENDENCY for ref in meta.find_referenced_templates(env.parse(source))
+    )
+
+
+def template_closure(
+    env: Environment,
+    name: str,
+    memo: Dict[str, FrozenSet[str]] | None = None,
+) -> FrozenSet[str]:
+    """Every template loaded when rendering ``name``, including itself.
+
+    Args:
+        env: The Jinja2 environment.
+        name: The root template name.
+        memo: Optional cache shared between calls of a single build.
+
+    Returns:
+        The transitive set of template names.
+    """
+    cache = memo if memo is not None else {}
+    if name in cache:
+        return cache[name]
+
+    seen: set[str] = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        if current != DYNAMIC_DEPENDENCY:
+            pending.extend(referenced_templates(env, current) - seen)
+
+    cache[name] = frozenset(seen)
+    return cache[name]
+
+
+def normalise_template_name(path: str) -> str:
+    """Turn a changed file path into a template name.
+
+    ``src/electric_toolbox/templates/sections/blog/_share.html`` and
+    ``sections/blog/_share.html`` both become ``sections/blog/_share.html``.
+    """
+    posix = Path(path).as_posix()
+    _, marker, tail = posix.rpartition('templates/')
+    return tail if marker else posix.lstrip('/')
+
+
+def affected_pages(
+    graph: TemplateDependencies,
+    changed_templates: Iterable[str],
+) -> FrozenSet[str]:
+    """Output pages that must be re-rendered after ``changed_templates`` changed.
+
+    Args:
+        graph: The dependency graph of the website's pages.
+        changed_templates: Changed template names or paths.
+
+    Returns:
+        The destinations of the pages depending on any of the changed templates.
+    """
+    changed = frozenset(normalise_template_name(t) for t in changed_templates)
+    return frozenset(
+        destination
+        for destination, templates in graph.pages.items()
+        if DYNAMIC_DEPENDENCY in templates or not changed.isdisjoint(templates)
+    )
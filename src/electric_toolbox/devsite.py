@@ -0,0 +1,130 @@
+"""The website for development: rendered on demand, kept in memory.
+
+A build writes every page to ``website/`` and the dev server reads them back.
+:class:`DevSite` keeps the rendered pages in a map keyed by their location
+instead, and renders a page only when it is requested:
+
+* after a template edit, :meth:`DevSite.invalidate` marks the pages that load
+  the template as stale (all of them if unknown); each is re-rendered on its
+  next request;
+* after a content or configuration edit, :meth:`DevSite.reload` drops the
+  parsed website; it is parsed again on the next request (unchanged posts come
+  from the conversion cache) and every page is rendered lazily again;
+* nothing is written to ``website/`` until :meth:`DevSite.export`.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from expression import Result
+from jinja2 import Environment
+
+from .configs import parse_website_config
+from .dependencies import TemplateDependencies, affected_pages
+from .generate import PageJob, dependency_graph, render_page, website_pages, write_feeds, write_page_markdown
+from .parsing import create_website_view_model, parse_website
+from .parsing.sections.blog import use_conversion_cache
+from .partials import rendered_partials
+from .sinks import MemorySink, OutputSink, normalise_location
+
+
+class DevSite:
+    """The pages of the website by location, each rendered on its first request.
+
+    Args:
+        env: The Jinja2 environment.
+        configs: Website configurations (as loaded from ``compile.config.toml``).
+        conversion_cache: Directory of the Markdown conversion cache, so a
+            reload only converts the posts that changed.
+    """
+
+    def __init__(self, env: Environment, configs: Dict[str, Any], conversion_cache: Optional[Path] = None):
+        """Nothing is parsed nor rendered until a page is requested."""
+        self.env = env
+        self.configs = configs
+        self.conversion_cache = conversion_cache
+        self.files = MemorySink()
+        self.renders = 0
+        self._jobs: Optional[Dict[str, PageJob]] = None
+        self._graph = TemplateDependencies()
+        self._stale: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, PageJob]:
+        """Parse the website; its pages are all stale, the feeds and Markdown versions are written."""
+        use_conversion_cache(self.conversion_cache)
+        try:
+            match parse_website_config(self.configs).bind(lambda configs: parse_website(configs, workers=1)):
+                case Result(tag='ok', ok=website):
+                    view = create_website_view_model(website)
+                case Result(error=error):
+                    raise error
+        finally:
+            use_conversion_cache(None)
+        jobs = {normalise_location(job['template'].destination): job for job in website_pages(view)}
+        self._graph = dependency_graph(self.env, jobs.values())
+        self._stale = set(jobs)
+        for location in set(self.files.files) - set(jobs):
+            if location.endswith(('.html', '.md')):
+                del self.files.files[location]  # A page that no longer exists.
+        rendered_partials(self.env).clear()
+        write_feeds(self.files, view)
+        for job in jobs.values():
+            write_page_markdown(self.files, job)
+        return jobs
+
+    def page(self, location: str) -> Optional[str]:
+        """The file served at ``location`` (``/`` and folders serve their ``index.html``), if any.
+
+        A stale page is rendered first; the website is parsed first if needed.
+        """
+        location = normalise_location(location)
+        if location == '' or location.endswith('/'):
+            location += 'index.html'
+        with self._lock:
+            if self._jobs is None:
+                self._jobs = self._load()
+            if location in self._stale:
+                self._render(self._jobs, location)
+            return self.files.files.get(location)
+
+    def _render(self, jobs: Dict[str, PageJob], location: str) -> None:
+        render_page(self.files, self.env, jobs[location])
+        self._stale.discard(location)
+        self.renders += 1
+
+    def invalidate(self, templates: Optional[Iterable[str]] = None) -> int:
+        """Mark the pages loading one of ``templates`` (every page if ``None``) for re-rendering.
+
+        Returns:
+            How many pages are stale now.
+        """
+        with self._lock:
+            if self._jobs is not None:
+                pages = self._jobs.keys() if templates is None else affected_pages(self._graph, templates)
+                self._stale |= {normalise_location(page) for page in pages}
+                # The edit may have added or removed includes.
+                self._graph = dependency_graph(self.env, self._jobs.values())
+            rendered_partials(self.env).clear()
+            return len(self._stale)
+
+    def reload(self) -> None:
+        """Parse the website again on the next request (content or configuration changed)."""
+        with self._lock:
+            self._jobs = None
+
+    def export(self, sink: OutputSink) -> int:
+        """Render every stale page, then write the whole website to ``sink``.
+
+        Returns:
+            How many files were written.
+        """
+        with self._lock:
+            if self._jobs is None:
+                self._jobs = self._load()
+            for location in sorted(self._stale):
+                self._render(self._jobs, location)
+            for location, contents in self.files.files.items():
+                sink.write(location, contents)
+            return len(self.files.files)
@@ -1,6 +1,6 @@
 """Custom exceptions for the parsing module."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 
 class ParsingError(Exception):
@@ -24,6 +24,10 @@ class ParsingError(Exception):
         self.context = context or {}
         super().__init__(self.message)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle with all three fields (errors cross process boundaries in validation)."""
+        return (type(self), (self.message, self.cause, self.context))
+
     def __str__(self) -> str:
         """Returns a string representation of the exception."""
         details = f'ParsingError: {self.message}'
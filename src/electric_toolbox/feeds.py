@@ -0,0 +1,206 @@
+"""Streaming ``sitemap.xml`` and Atom feed writers.
+
+Both writers consume an iterable of small records and write XML element by
+element through :meth:`OutputSink.open`, so memory stays constant however many
+pages the site has. The sitemap is a single ``sitemap.xml`` until it crosses
+the protocol limits (50 000 URLs or 50 MB uncompressed per file); then it is
+sharded behind a ``sitemap.xml`` index.
+"""
+
+from contextlib import ExitStack
+from tempfile import SpooledTemporaryFile
+from typing import IO, Iterable, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .sinks import OutputSink, TextWriter
+
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+FEED_MAX_ENTRIES = 20
+
+_SPOOL_MAX_SIZE = 1024 * 1024
+_COPY_CHUNK = 64 * 1024
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_URLSET_OPEN = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_URLSET_CLOSE = '</urlset>\n'
+
+
+class SitemapUrl(NamedTuple):
+    """One ``<url>`` of the sitemap."""
+
+    loc: str
+    lastmod: Optional[str] = None  # iso8601
+
+
+class FeedEntry(NamedTuple):
+    """One ``<entry>`` of the Atom feed."""
+
+    title: str
+    url: str
+    published: str  # iso8601
+    updated: str  # iso8601
+    summary: Optional[str] = None
+    authors: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+
+
+class FeedInfo(NamedTuple):
+    """Feed-level metadata."""
+
+    title: str
+    url: str  # the site's home page
+    feed_url: str  # the absolute URL of the feed itself
+    updated: str  # iso8601, newest entry update
+    subtitle: Optional[str] = None
+    author: Optional[str] = None
+
+
+def _url_element(url: SitemapUrl) -> str:
+    lastmod = f'<lastmod>{escape(url.lastmod)}</lastmod>' if url.lastmod else ''
+    return f'<url><loc>{escape(url.loc)}</loc>{lastmod}</url>\n'
+
+
+def _latest(current: Optional[str], candidate: Optional[str]) -> Optional[str]:
+    """Later of two iso8601 timestamps (string order is fine for a single offset)."""
+    if candidate is None:
+        return current
+    return candidate if current is None or candidate > current else current
+
+
+def _copy(source: IO[str], target: TextWriter) -> None:
+    source.seek(0)
+    while chunk := source.read(_COPY_CHUNK):
+        target.write(chunk)
+
+
+def write_sitemap(  # noqa: PLR0913
+    sink: OutputSink,
+    urls: Iterable[SitemapUrl],
+    *,
+    base_url: str,
+    name: str = 'sitemap',
+    max_urls: int = SITEMAP_MAX_URLS,
+    max_bytes: int = SITEMAP_MAX_BYTES,
+) -> List[str]:
+    """Stream ``urls`` into ``<name>.xml``, sharding it behind an index once a limit is crossed.
+
+    Until the first shard fills up it is spooled to a temporary file, so a site
+    that fits one file gets a plain ``<urlset>`` at ``<name>.xml``. Otherwise the
+    spool becomes ``<name>-1.xml``, the rest is streamed to ``<name>-2.xml``,
+    ... and ``<name>.xml`` is the ``<sitemapindex>`` over them.
+
+    Args:
+        sink: Where the files are written to.
+        urls: The URLs, consumed once.
+        base_url: Absolute site root, used to link the shards from the index.
+        name: Base name of the files (``sitemap.xml``, ``sitemap-1.xml``, ...).
+        max_urls: URL limit per shard.
+        max_bytes: Size limit (UTF-8 bytes) per shard.
+
+    Returns:
+        The locations of the files holding the URLs: ``[<name>.xml]`` or the shards, in order.
+    """
+    overhead = len((_XML_DECLARATION + _URLSET_OPEN + _URLSET_CLOSE).encode('utf-8'))
+    shards: List[str] = [f'{name}.xml']
+    lastmods: List[Optional[str]] = [None]
+
+    with ExitStack() as stack:
+        spool = stack.enter_context(SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE, mode='w+', encoding='utf-8'))
+        shard_stack = stack.enter_context(ExitStack())
+        handle: TextWriter = spool
+        handle.write(_XML_DECLARATION + _URLSET_OPEN)
+        count, size = 0, overhead
+        for url in urls:
+            element = _url_element(url)
+            element_size = len(element.encode('utf-8'))
+            if count >= max_urls or size + element_size > max_bytes:
+                handle.write(_URLSET_CLOSE)
+                if handle is spool:
+                    shards[0] = f'{name}-1.xml'
+                    with sink.open(shards[0]) as first:
+                        _copy(spool, first)
+                else:
+                    shard_stack.close()
+                shards.append(f'{name}-{len(shards) + 1}.xml')
+                lastmods.append(None)
+                handle = shard_stack.enter_context(sink.open(shards[-1]))
+                handle.write(_XML_DECLARATION + _URLSET_OPEN)
+                count, size = 0, overhead
+            handle.write(element)
+            count += 1
+            size += element_size
+            lastmods[-1] = _latest(lastmods[-1], url.lastmod)
+        handle.write(_URLSET_CLOSE)
+        if handle is spool:
+            with sink.open(shards[0]) as single:
+                _copy(spool, single)
+            return shards
+
+    root = base_url.rstrip('/')
+    with sink.open(f'{name}.xml') as index:
+        index.write(_XML_DECLARATION)
+        index.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for shard, lastmod in zip(shards, lastmods):
+            lastmod_element = f'<lastmod>{escape(lastmod)}</lastmod>' if lastmod else ''
+            index.write(f'<sitemap><loc>{escape(f"{root}/{shard}")}</loc>{lastmod_element}</sitemap>\n')
+        index.write('</sitemapindex>\n')
+    return shards
+
+
+def _entry_element(entry: FeedEntry) -> str:
+    parts = [
+        '<entry>',
+        f'<title>{escape(entry.title)}</title>',
+        f'<link rel="alternate" type="text/html" href={quoteattr(entry.url)}/>',
+        f'<id>{escape(entry.url)}</id>',
+        f'<published>{escape(entry.published)}</published>',
+        f'<updated>{escape(entry.updated)}</updated>',
+        *(f'<author><name>{escape(author)}</name></author>' for author in entry.authors),
+        *(f'<category term={quoteattr(category)}/>' for category in entry.categories),
+    ]
+    if entry.summary:
+        parts.append(f'<summary>{escape(entry.summary)}</summary>')
+    parts.append('</entry>\n')
+    return ''.join(parts)
+
+
+def write_atom_feed(
+    sink: OutputSink,
+    location: str,
+    info: FeedInfo,
+    entries: Iterable[FeedEntry],
+    limit: int = FEED_MAX_ENTRIES,
+) -> int:
+    """Stream an Atom feed to ``location``.
+
+    Args:
+        sink: Where the feed is written to.
+        location: The feed location (e.g. ``feed.xml``).
+        info: Feed-level metadata.
+        entries: The entries, newest first; consumed lazily.
+        limit: Maximum number of entries.
+
+    Returns:
+        The number of entries written.
+    """
+    written = 0
+    with sink.open(location) as feed:
+        feed.write(_XML_DECLARATION)
+        feed.write('<feed xmlns="http://www.w3.org/2005/Atom">\n')
+        feed.write(f'<title>{escape(info.title)}</title>\n')
+        if info.subtitle:
+            feed.write(f'<subtitle>{escape(info.subtitle)}</subtitle>\n')
+        feed.write(f'<link rel="alternate" type="text/html" href={quoteattr(info.url)}/>\n')
+        feed.write(f'<link rel="self" type="application/atom+xml" href={quoteattr(info.feed_url)}/>\n')
+        feed.write(f'<id>{escape(info.url)}</id>\n')
+        feed.write(f'<updated>{escape(info.updated)}</updated>\n')
+        if info.author:
+            feed.write(f'<author><name>{escape(info.author)}</name></author>\n')
+        for entry in entries:
+            if written >= limit:
+                break
+            feed.write(_entry_element(entry))
+            written += 1
+        feed.write('</feed>\n')
+    return written
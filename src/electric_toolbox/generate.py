@@ -1,15 +1,69 @@
 """Generation of files."""
 
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TypedDict
 
-import minify_html
-from expression import curry_flip
-from jinja2 import Environment, Template
+from jinja2 import Environment, PackageLoader, Template
 
 from .constants import ExistingTemplates
+from .dependencies import TemplateDependencies, affected_pages, template_closure
+from .feeds import FeedEntry, FeedInfo, SitemapUrl, write_atom_feed, write_sitemap
+from .icons import load_icons
+from .llms import LLMS_LOCATION, llms_index, page_markdown
+from .parsing import TargetFiles, ViewModelBlog, ViewModelBlogPost, ViewModelHomePage, ViewModelWebsite
 from .parsing import Template as InternalTemplate
-from .parsing import ViewModelBlog, ViewModelBlogPost, ViewModelHomePage, ViewModelNavigationMenu, ViewModelWebsite
+from .parsing.common import FRAGMENTS_DIRECTORY, isoformat_with_tz
+from .partials import PartialCache, rendered_partials
+from .prefetch import PrefetchPage, adjacent, newest, prefetch_href, ranked
+from .service_worker import page_entry, precached_pages, write_service_worker
+from .sinks import DirectorySink, OutputSink, WrittenFile
+
+FEED_LOCATION = 'feed.xml'
+
+
+def template_name(template_type: ExistingTemplates) -> str:
+    """Maps the enum member to its template path (relative to ``templates/``).
+
+    Args:
+        template_type: The ExistingTemplates enum member.
+
+    Returns:
+        The template name, as understood by the Jinja2 loader.
+    """
+    match template_type:
+        case ExistingTemplates.INDEX:
+            return 'sections/index/index.html'
+        case ExistingTemplates.BLOG_INDEX:
+            return 'sections/blog/index.html'
+        case ExistingTemplates.BLOG_ARTICLE:
+            return 'sections/blog/article.html'
+        case ExistingTemplates.INDEX_FRAGMENT:
+            return 'sections/index/index_fragment.html'
+        case ExistingTemplates.BLOG_INDEX_FRAGMENT:
+            return 'sections/blog/index_fragment.html'
+        case ExistingTemplates.BLOG_ARTICLE_FRAGMENT:
+            return 'sections/blog/article_fragment.html'
+
+
+def template_environment(website: Dict[str, Any]) -> Environment:
+    """The Jinja2 environment of the package templates, with the globals the pages use.
+
+    Args:
+        website: The ``[website]`` table of the configuration (for the site name).
+
+    Returns:
+        The environment; the icons come from ``resources/icons`` and the
+        inlined CSS from ``build/style.css`` (``bun run build:css``), if built.
+    """
+    env = Environment(loader=PackageLoader('electric_toolbox', 'templates'), autoescape=True, extensions=[PartialCache])
+    env.globals['icons'] = load_icons(Path('resources/icons'))
+    env.globals['site_name'] = website.get('name') or website.get('title', '')
+    env.globals['build_year'] = datetime.now(tz=timezone.utc).year
+    # Inlined, so there is no render-blocking stylesheet request.
+    css_path = Path('build/style.css')
+    env.globals['inline_css'] = css_path.read_text(encoding='utf-8') if css_path.is_file() else ''
+    return env
 
 
 def get_template_function(
@@ -25,20 +79,15 @@ def get_template_function(
     Returns:
         The Jinja2 template.
     """
-    match template_type:
-        case ExistingTemplates.INDEX:
-            return env.get_template('sections/index/index.html')
-        case ExistingTemplates.BLOG_INDEX:
-            return env.get_template('sections/blog/index.html')
-        case ExistingTemplates.BLOG_ARTICLE:
-            return env.get_template('sections/blog/article.html')
+    return env.get_template(template_name(template_type))
 
 
-class WrittenFile(TypedDict):
-    """TypedDict representing a written file."""
+class PageJob(TypedDict):
+    """A single page to render: the target template and its context."""
 
-    path: Path
-    contents: str
+    template: InternalTemplate
+    data: Any
+    additional_data: Dict[str, Any]
 
 
 def create_dir_if_not_exists(path: Path) -> Path:
@@ -49,6 +98,11 @@ def create_dir_if_not_exists(path: Path) -> Path:
     return path
 
 
+def _prepare_contents(file_location: str, contents: str) -> str:
+    """Post-process a rendered file before it reaches the sink (HTML is minified)."""
+    return minify_page(contents) if file_location.endswith('.html') else contents
+
+
 def string_to_file(
     base_path: Path,
     file_location: str,
@@ -61,18 +115,13 @@ def string_to_file(
         file_location (str): The location of the file to write (relative to the base path, including extension).
         contents (str): The contents to dump into the file.
     """
-    fl = file_location.removeprefix('/')
-    full_path = base_path / fl
-    create_dir_if_not_exists(full_path.parent)  # Create directory for the file
-    output = _minify_html(contents) if fl.endswith('.html') else contents
-    with open(full_path, 'w') as f:
-        f.write(output)
-
-    return WrittenFile(path=base_path / fl, contents=output)
+    return DirectorySink(base_path).write(file_location, _prepare_contents(file_location, contents))
 
 
-def _minify_html(contents: str) -> str:
+def minify_page(contents: str) -> str:
     """Minify generated HTML (whitespace-safe for <pre>/<code>; JS left as-is)."""
+    import minify_html  # noqa: PLC0415 -- lazy, keeps the native module out of the import path
+
     return minify_html.minify(
         contents,
         minify_css=True,
@@ -83,7 +132,7 @@ def _minify_html(contents: str) -> str:
 
 
 def _render(
-    base_path: Path,
+    sink: OutputSink,
     env: Environment,
     template: InternalTemplate,
     data: Any,
@@ -92,86 +141,240 @@ def _render(
     """Render the template.
 
     Args:
-        base_path (Path): The base path to write the file to.
+        sink (OutputSink): Where the rendered file is written to.
         env (Environment): The Jinja2 environment.
         template (InternalTemplate): The template to render.
         data (Any): The data to render the template with.
+        additional_data (Any): Extra context merged on top of ``data``.
     """
-    return string_to_file(
-        base_path=base_path,
-        file_location=f'{template.destination}',
-        contents=get_template_function(template.template, env).render(
-            data,
-            **additional_data,
-        ),
+    file_location = f'{template.destination}'
+    contents = get_template_function(template.template, env).render(
+        data,
+        **additional_data,
     )
+    return sink.write(file_location, _prepare_contents(file_location, contents))
 
 
-def _render_homepage(
-    base_path: Path,
-    env: Environment,
-    view: ViewModelHomePage,
-) -> None:
-    """Render the homepage.
+def render_page(sink: OutputSink, env: Environment, page: PageJob) -> WrittenFile:
+    """Render one page of :func:`website_pages` into ``sink``."""
+    return _render(
+        sink=sink,
+        env=env,
+        template=page['template'],
+        data=page['data'],
+        additional_data=page['additional_data'],
+    )
+
+
+def write_page_markdown(sink: OutputSink, page: PageJob) -> None:
+    """Write the Markdown version of a page (once, with its full document), if it has one."""
+    targets = page['data'].targets
+    if targets.llm is not None and page['template'] == targets.complete:
+        sink.write(targets.llm, page_markdown(page['data']))
+
+
+def _page_jobs(targets: TargetFiles, data: Any, additional_data: Dict[str, Any]) -> Iterator[PageJob]:
+    """The full document of a page and, if it has one, its htmx fragment."""
+    yield PageJob(template=targets.complete, data=data, additional_data=additional_data)
+    if targets.fragment is not None:
+        yield PageJob(template=targets.fragment, data=data, additional_data=additional_data)
+
+
+def _prefetch_pages(posts: Iterable[ViewModelBlogPost]) -> List[PrefetchPage]:
+    """The posts, as navigation graph nodes."""
+    return [PrefetchPage(page=post.resource_path, href=prefetch_href(post.targets), date=post.date) for post in posts]
+
+
+def _homepage_pages(view: ViewModelHomePage, collections: Iterable[ViewModelBlog] = ()) -> List[PageJob]:
+    """The documents of a standalone page (the homepage, or another singular section).
 
     Args:
-    base_path (Path): The base path to write the file to.
-    env (Environment): The Jinja2 environment.
-    view (ViewModelHomePage): The homepage view to generate.
+        view (ViewModelHomePage): The page view to generate.
+        collections (Iterable[ViewModelBlog]): The collections, whose newest
+            posts (then their indexes) the page prefetches.
     """
-    _ = _render(
-        base_path=base_path,
-        env=env,
-        template=view.targets.complete,
-        data=view,
-    )
+    blogs = list(collections)
+    candidates = [
+        *newest(page for blog in blogs for page in _prefetch_pages(blog.posts)),
+        *(prefetch_href(blog.targets) for blog in blogs),
+    ]
+    return list(_page_jobs(view.targets, view, {'prefetch_links': ranked(candidates, view.prefetch)}))
 
 
-def _render_blog(
-    base_path: Path,
-    env: Environment,
+def _blog_pages(
     view: ViewModelBlog,
-) -> None:
-    """Render the blog index and one document per post.
+    posts: Optional[Iterable[ViewModelBlogPost]] = None,
+) -> Iterator[PageJob]:
+    """The blog index and the documents of every post.
+
+    Each page prefetches ``view.prefetch`` likely next pages: the newest posts
+    from the index; from a post, the next and previous posts, its related posts
+    and the index.
+
+    Args:
+        view (ViewModelBlog): The Blog view to generate.
+        posts (Optional[Iterable[ViewModelBlogPost]]): The post views to render,
+            if not ``view.posts`` (a streaming build passes them lazily).
+    """
+    pages = _prefetch_pages(view.posts)
+    hrefs = {page.page: page.href for page in pages}
+    neighbours = adjacent(pages)
+    index_href = prefetch_href(view.targets)
+    yield from _page_jobs(view.targets, view, {'prefetch_links': ranked(newest(pages), view.prefetch)})
+    for post_view in posts if posts is not None else view.posts:
+        candidates = [
+            *neighbours.get(post_view.resource_path, []),
+            *(hrefs.get(related.href, related.href) for related in post_view.related),
+            index_href,
+        ]
+        yield from _page_jobs(
+            post_view.targets,
+            post_view,
+            {
+                'navigation': view.navigation,
+                'prefetch_links': ranked(candidates, view.prefetch, exclude=prefetch_href(post_view.targets)),
+            },
+        )
+
+
+def website_pages(
+    website: ViewModelWebsite,
+    posts: Optional[Callable[[str], Iterable[ViewModelBlogPost]]] = None,
+) -> Iterator[PageJob]:
+    """Every page of the website, in render order: the standalone pages, then each collection.
+
+    Args:
+        website (ViewModelWebsite): The website to generate.
+        posts (Optional[Callable[[str], Iterable[ViewModelBlogPost]]]): The post
+            views of a collection (by section name) to render, if not its
+            ``posts``; each is consumed once, as the pages are rendered.
+    """
+    for page in website.pages.values():
+        yield from _homepage_pages(page, website.collections.values())
+    for name, blog in website.collections.items():
+        yield from _blog_pages(blog, None if posts is None else posts(name))
+
+
+def dependency_graph(
+    env: Environment,
+    pages: Iterable[PageJob],
+) -> TemplateDependencies:
+    """Records the templates each page loads through extends/include.
 
     Args:
-        base_path (Path): The base path to write the file to.
         env (Environment): The Jinja2 environment.
-        view (ViewModelWebsite): The Blog view to generate.
+        pages (Iterable[PageJob]): The pages of the website.
     """
+    memo: Dict[str, FrozenSet[str]] = {}
+    return TemplateDependencies(
+        pages={
+            page['template'].destination: template_closure(env, template_name(page['template'].template), memo)
+            for page in pages
+        }
+    )
 
-    @curry_flip(1)
-    def _for_each_post(
-        post_view: ViewModelBlogPost,
-        navigation: ViewModelNavigationMenu,
-    ) -> None:
-        _ = _render(
-            base_path=base_path,
-            env=env,
-            template=post_view.targets.complete,
-            data=post_view,
-            additional_data={'navigation': navigation},
+
+def _sitemap_urls(website: ViewModelWebsite) -> Iterator[SitemapUrl]:
+    """Canonical URL of every page, with the post modification time as ``lastmod``."""
+    root = website.base_url.rstrip('/')
+    for page in website.pages.values():
+        destination = page.targets.complete.destination.lstrip('/')
+        yield SitemapUrl(loc=f'{root}/' if destination == 'index.html' else f'{root}/{destination}')
+    for blog in website.collections.values():
+        posts = blog.posts
+        yield SitemapUrl(loc=f'{root}{blog.all_href}', lastmod=max((p.modified_time for p in posts), default=None))
+        for post in posts:
+            yield SitemapUrl(loc=post.url, lastmod=post.modified_time or post.date)
+
+
+def _feed_entries(website: ViewModelWebsite) -> Iterator[FeedEntry]:
+    """The posts of every collection as feed entries, newest first."""
+    for post in sorted(website.posts(), key=lambda p: p.date, reverse=True):
+        yield FeedEntry(
+            title=post.title,
+            url=post.url,
+            published=post.date,
+            updated=post.modified_time or post.date,
+            summary=post.summary.default_value(None),
+            authors=tuple(author.strip() for author in post.byline.split(',') if author.strip()),
+            categories=tuple(post.tags),
         )
 
-    _ = _render(
-        base_path=base_path,
-        env=env,
-        template=view.targets.complete,
-        data=view,
-    )
 
-    _ = list(map(_for_each_post(navigation=view.navigation), view.posts))
+def write_feeds(sink: OutputSink, website: ViewModelWebsite) -> None:
+    """Write ``sitemap.xml`` (+ shards), the Atom feed, ``llms.txt`` and ``robots.txt``.
+
+    Args:
+        sink (OutputSink): Where the files are written to.
+        website (ViewModelWebsite): The website to describe.
+    """
+    root = website.base_url.rstrip('/')
+    info = website.website_info
+    write_sitemap(sink, _sitemap_urls(website), base_url=root)
+    write_atom_feed(
+        sink,
+        FEED_LOCATION,
+        FeedInfo(
+            title=info.site_name,
+            subtitle=info.description,
+            url=f'{root}/',
+            feed_url=f'{root}/{FEED_LOCATION}',
+            updated=max(
+                (p.modified_time or p.date for p in website.posts()),
+                default=isoformat_with_tz(datetime.now(tz=timezone.utc).replace(microsecond=0)),
+            ),
+            author=info.author.full_name,
+        ),
+        _feed_entries(website),
+    )
+    sink.write(LLMS_LOCATION, llms_index(website))
+    sink.write(
+        'robots.txt', f'User-agent: *\nAllow: /\nDisallow: /{FRAGMENTS_DIRECTORY}/\n\nSitemap: {root}/sitemap.xml\n'
+    )
 
 
 def generate(
-    base_path: Path,
+    sink: OutputSink,
     env: Environment,
     website: ViewModelWebsite,
-) -> None:
+    changed_templates: Optional[Iterable[str]] = None,
+    posts: Optional[Callable[[str], Iterable[ViewModelBlogPost]]] = None,
+) -> TemplateDependencies:
     """Generate the website files.
 
     Args:
+        sink (OutputSink): Where the generated files are written to.
+        env (Environment): The Jinja2 environment.
         website (ViewModelWebsite): The website to generate.
+        changed_templates (Optional[Iterable[str]]): When given, only the pages
+            depending on one of these templates are re-rendered (the sitemap,
+            the feed and the Markdown versions do not depend on templates and
+            are left alone, but the pages the service worker precaches are
+            rendered, to give it their revisions). ``None`` renders everything.
+        posts (Optional[Callable[[str], Iterable[ViewModelBlogPost]]]): Streaming
+            build: the full post views of a collection, produced one at a time
+            and rendered as they come, while the collections' ``posts`` only
+            hold their summaries (index, feed and sitemap).
+
+    Returns:
+        The template dependency graph of every page of the website.
     """
-    _render_homepage(base_path, env, website.homepage)
-    _render_blog(base_path, env, website.blog)
+    graph = dependency_graph(env, website_pages(website))
+    rendered_partials(env).clear()
+    selected = None if changed_templates is None else affected_pages(graph, changed_templates)
+    # The service worker lists the revisions of its pages: they are always rendered.
+    precached = set(precached_pages(website)) if env.globals.get('service_worker') else set()
+    entries = []
+    for page in website_pages(website, posts):
+        destination = page['template'].destination
+        if selected is None or destination in selected or destination in precached:
+            written = render_page(sink, env, page)
+            if destination in precached:
+                entries.append(page_entry(destination, written))
+        if selected is None:
+            write_page_markdown(sink, page)
+    if selected is None:
+        write_feeds(sink, website)
+    if precached:
+        write_service_worker(sink, env, website, entries)
+    return graph
@@ -0,0 +1,95 @@
+"""Plain Markdown versions of the pages, and the ``llms.txt`` index.
+
+Crawlers and agents reading the site do not need the inlined CSS, the scripts
+or the markup: every page also gets a compact Markdown version at its
+``targets.llm`` (``/posts/a.html`` -> ``/posts/a.html.md``), and ``llms.txt``
+(https://llmstxt.org) lists them. Both are written from the view models the
+pages are rendered from: a post's Markdown is its source body, as read with the
+frontmatter, so nothing is parsed or converted again.
+"""
+
+from typing import Iterator, List, Union
+
+from .parsing import ViewModelBlog, ViewModelBlogPost, ViewModelHomePage, ViewModelWebsite
+
+LLMS_LOCATION = 'llms.txt'
+
+ViewModelPage = Union[ViewModelHomePage, ViewModelBlog, ViewModelBlogPost]
+
+
+def _one_line(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def _link(title: str, root: str, page: Union[ViewModelBlog, ViewModelBlogPost, ViewModelHomePage]) -> str:
+    """``[title](url of the Markdown version)``, or of the page itself if it has none."""
+    targets = page.targets
+    location = targets.llm if targets.llm is not None else targets.complete.destination
+    return f'[{title}]({root}/{location.lstrip("/")})'
+
+
+def _post_item(post: ViewModelBlogPost, root: str) -> str:
+    summary = post.summary.default_value(None)
+    return f'- {_link(post.title, root, post)}' + (f': {_one_line(summary)}' if summary else '')
+
+
+def _post_markdown(post: ViewModelBlogPost) -> Iterator[str]:
+    yield f'# {post.title}\n'
+    summary = post.summary.default_value(None)
+    if summary:
+        yield f'> {_one_line(summary)}\n'
+    details = [f'Published {post.date[:10]}']
+    if post.modified_time and post.modified_time[:10] != post.date[:10]:
+        details.append(f'updated {post.modified_time[:10]}')
+    if post.byline:
+        details.append(f'by {post.byline}')
+    details.append(f'{post.reading_time} read')
+    yield ', '.join(details) + f'. Source: <{post.url}>'
+    if post.tags:
+        yield f'\nTags: {", ".join(post.tags)}'
+    yield f'\n{post.markdown.strip()}'
+
+
+def _blog_markdown(blog: ViewModelBlog) -> Iterator[str]:
+    root = blog.base_url.rstrip('/')
+    yield f'# {blog.title}\n'
+    yield from (_post_item(post, root) for post in blog.posts)
+
+
+def page_markdown(page: ViewModelPage) -> str:
+    """The Markdown version of a page: its title, metadata and body.
+
+    Args:
+        page: The view model the page is rendered from.
+
+    Returns:
+        The document, ending with a newline.
+    """
+    match page:
+        case ViewModelBlogPost():
+            lines = list(_post_markdown(page))
+        case ViewModelBlog():
+            lines = list(_blog_markdown(page))
+        case ViewModelHomePage():
+            lines = [f'# {page.title}\n', page.contents.strip()]
+    return '\n'.join(lines) + '\n'
+
+
+def llms_index(website: ViewModelWebsite) -> str:
+    """The ``llms.txt`` of the website: its name, description and every page's Markdown version.
+
+    Args:
+        website: The website (a streaming build's post summaries are enough).
+
+    Returns:
+        The document, ending with a newline.
+    """
+    root = website.base_url.rstrip('/')
+    info = website.website_info
+    lines: List[str] = [f'# {info.site_name}\n', f'> {_one_line(info.description)}\n']
+    if website.pages:
+        lines += ['## Pages\n', *(f'- {_link(page.title, root, page)}' for page in website.pages.values()), '']
+    for blog in website.collections.values():
+        lines += [f'## {blog.title}\n', f'- {_link(f"{blog.title} index", root, blog)}']
+        lines += [*(_post_item(post, root) for post in blog.posts), '']
+    return '\n'.join(lines).rstrip('\n') + '\n'
@@ -1,39 +1,114 @@
 """Entrypoint to website generation."""
 
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from expression import Result
-from jinja2 import Environment
 
 from electric_toolbox.configs import parse_website_config
-from electric_toolbox.parsing import create_website_view_model, parse_website
+from electric_toolbox.parsing import (
+    ValidationReport,
+    create_website_view_model,
+    parse_website,
+    stream_website,
+    validate_website,
+)
 
-from .generate import generate
+from .sinks import DirectorySink, OutputSink
 
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
-def main(
+    from .dependencies import TemplateDependencies
+
+
+def main(  # noqa: PLR0913
     base_path: Path,
-    j2_env: Environment,
+    j2_env: 'Environment',
     configs: Dict[str, Any],
-) -> None:
+    *,
+    changed_templates: Optional[Iterable[str]] = None,
+    sink: Optional[OutputSink] = None,
+    streaming: bool = False,
+    workers: Optional[int] = None,
+    conversion_cache: Optional[Path] = None,
+) -> 'TemplateDependencies':
     """Entrypoint to generate website.
 
     Args:
-        path (Path): Root path/folder of the static website.
+        base_path (Path): Root path/folder of the static website.
         j2_env (Environment): Jinja2 Templates envornment.
         configs (Dict[str, Any]): Website configurations.
+        changed_templates (Optional[Iterable[str]]): Only re-render the pages
+            depending on these templates. ``None`` renders every page.
+        sink (Optional[OutputSink]): Where the files are written to. Defaults
+            to one file per page under ``base_path``.
+        streaming (bool): Parse, render and write the posts one at a time,
+            keeping only their summaries (bounded memory, each post is parsed
+            twice but converted once). The output is the same.
+        workers (Optional[int]): Processes reading the collections (``None``:
+            one per CPU, ``1``: in process).
+        conversion_cache (Optional[Path]): Directory of the persistent
+            Markdown conversion cache: unchanged posts are not converted again
+            (e.g. after a template edit). A streaming build without one uses a
+            temporary cache, so that each post is still converted once.
+
+    Returns:
+        The template dependency graph of the generated pages.
+    """
+    # Rendering (Jinja2, minify-html) is only imported by the commands that render.
+    from .generate import generate  # noqa: PLC0415
+    from .parsing.sections.blog import use_conversion_cache  # noqa: PLC0415
+
+    with ExitStack() as stack:
+        if conversion_cache is None and streaming:
+            # Each post is parsed twice: the second conversion is read back from a scratch cache.
+            conversion_cache = Path(stack.enter_context(TemporaryDirectory(prefix='electric-toolbox-')))
+        use_conversion_cache(conversion_cache)
+        stack.callback(use_conversion_cache, None)
+        output = sink if sink is not None else DirectorySink(base_path)
+        match parse_website_config(configs, load_contents=not streaming):
+            case Result(tag='ok', ok=configs_loaded) if streaming:
+                match stream_website(configs=configs_loaded):
+                    case Result(tag='ok', ok=streamed):
+                        return generate(
+                            sink=output,
+                            env=j2_env,
+                            website=streamed.website,
+                            changed_templates=changed_templates,
+                            posts=streamed.posts,
+                        )
+                    case Result(error=website_error):
+                        raise website_error
+            case Result(tag='ok', ok=configs_loaded):
+                match parse_website(configs=configs_loaded, workers=workers):
+                    case Result(tag='ok', ok=website):
+                        return generate(
+                            sink=output,
+                            env=j2_env,
+                            website=create_website_view_model(website),
+                            changed_templates=changed_templates,
+                        )
+                    case Result(error=website_error):
+                        raise website_error
+            case Result(error=configs_error):
+                raise configs_error
+
+
+def validate(configs: Dict[str, Any], workers: Optional[int] = None) -> ValidationReport:
+    """Check every post without rendering anything, collecting all the errors.
+
+    Args:
+        configs (Dict[str, Any]): Website configurations.
+        workers (Optional[int]): Processes to use (``None``: one per CPU).
+
+    Returns:
+        The validation report (a configuration error is raised).
     """
-    match parse_website_config(configs):
+    match parse_website_config(configs, load_contents=False):
         case Result(tag='ok', ok=configs_loaded):
-            match parse_website(configs=configs_loaded):
-                case Result(tag='ok', ok=website):
-                    generate(
-                        base_path=base_path,
-                        env=j2_env,
-                        website=create_website_view_model(website),
-                    )
-                case Result(error=website_error):
-                    raise website_error
+            return validate_website(configs_loaded, workers=workers)
         case Result(error=configs_error):
             raise configs_error
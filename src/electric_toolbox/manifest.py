@@ -0,0 +1,175 @@
+"""Deploy manifest: every output file with its size and content hash.
+
+The manifest is recorded while the site is written (see :class:`ManifestSink`),
+so no output file has to be read back or re-hashed. Diffing it against the
+manifest of what is currently deployed gives the delta to upload and the URLs
+whose CDN cache must be purged.
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from .sinks import OutputSink, TextWriter, WrittenFile, normalise_location
+
+
+class ManifestEntry(BaseModel):
+    """Size and content hash of one output file."""
+
+    model_config = ConfigDict(frozen=True)
+    size: int
+    sha256: str
+
+
+class Manifest(BaseModel):
+    """Output location (relative to the site root) -> entry."""
+
+    model_config = ConfigDict(frozen=True)
+    files: Dict[str, ManifestEntry] = {}
+
+
+class ManifestDiff(BaseModel):
+    """What changed between two manifests."""
+
+    model_config = ConfigDict(frozen=True)
+    added: Tuple[str, ...] = ()
+    changed: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+
+    @property
+    def to_upload(self) -> Tuple[str, ...]:
+        """Files that must be pushed (new or different)."""
+        return self.added + self.changed
+
+
+def manifest_entry(data: bytes) -> ManifestEntry:
+    """Build the entry for a file's raw bytes."""
+    return ManifestEntry(size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
+
+class _HashingWriter:
+    """Forwards writes while hashing the UTF-8 bytes that go through."""
+
+    def __init__(self, inner: TextWriter):
+        self.inner = inner
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def write(self, s: str, /) -> int:
+        data = s.encode('utf-8')
+        self.hasher.update(data)
+        self.size += len(data)
+        return self.inner.write(s)
+
+
+class ManifestSink:
+    """Sink wrapper recording a manifest entry for every file it forwards.
+
+    Args:
+        inner (OutputSink): The sink that actually stores the files.
+        base (Optional[Manifest]): Entries of files not rewritten by this build
+            (e.g. the previous manifest when only a few pages are re-rendered).
+    """
+
+    def __init__(self, inner: OutputSink, base: Optional[Manifest] = None):
+        """Manifest-recording sink."""
+        self.inner = inner
+        self._files: Dict[str, ManifestEntry] = dict(base.files) if base is not None else {}
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Record the entry for ``contents`` and forward it to the inner sink."""
+        self._files[normalise_location(location)] = manifest_entry(contents.encode('utf-8'))
+        return self.inner.write(location, contents)
+
+    @contextmanager
+    def open(self, location: str) -> Iterator[TextWriter]:
+        """Forward the stream to the inner sink, hashing it on the way."""
+        with self.inner.open(location) as handle:
+            writer = _HashingWriter(handle)
+            yield writer
+        self._files[normalise_location(location)] = ManifestEntry(size=writer.size, sha256=writer.hasher.hexdigest())
+
+    def record(self, location: str, entry: ManifestEntry) -> None:
+        """Record a file written without the sink (e.g. a static asset)."""
+        self._files[normalise_location(location)] = entry
+
+    def close(self) -> None:
+        """Close the inner sink."""
+        self.inner.close()
+
+    @property
+    def manifest(self) -> Manifest:
+        """The manifest of everything written so far."""
+        return Manifest(files=dict(sorted(self._files.items())))
+
+
+def manifest_of_directory(directory: Path) -> Manifest:
+    """Hash an existing output folder (e.g. to bootstrap the first deployed manifest)."""
+    return Manifest(
+        files={
+            path.relative_to(directory).as_posix(): manifest_entry(path.read_bytes())
+            for path in sorted(directory.rglob('*'))
+            if path.is_file()
+        }
+    )
+
+
+def diff_manifests(previous: Manifest, current: Manifest) -> ManifestDiff:
+    """Compare the deployed manifest with the freshly built one.
+
+    Args:
+        previous: What is currently deployed.
+        current: What the build produced.
+
+    Returns:
+        The added, changed (different hash) and removed locations, sorted.
+    """
+    before, after = previous.files, current.files
+    return ManifestDiff(
+        added=tuple(sorted(after.keys() - before.keys())),
+        changed=tuple(sorted(k for k in after.keys() & before.keys() if after[k] != before[k])),
+        removed=tuple(sorted(before.keys() - after.keys())),
+    )
+
+
+def _urls_for(location: str, base_url: str) -> List[str]:
+    """Public URLs serving ``location`` (``index.html`` is also served as the folder)."""
+    root = base_url.rstrip('/')
+    urls = [f'{root}/{location}']
+    if location == 'index.html' or location.endswith('/index.html'):
+        urls.append(f'{root}/{location.removesuffix("index.html")}')
+    return urls
+
+
+def urls_to_purge(diff: ManifestDiff, base_url: str) -> List[str]:
+    """URLs whose cached copy is stale after deploying ``diff`` (changed or removed)."""
+    return [url for location in (*diff.changed, *diff.removed) for url in _urls_for(location, base_url)]
+
+
+def save_manifest(manifest: Manifest, path: Path) -> None:
+    """Write the manifest as ``{location: {size, sha256}}`` JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest.model_dump()['files'], indent=2, sort_keys=True), encoding='utf-8')
+
+
+def load_manifest(path: Path) -> Manifest:
+    """Read a manifest written by :func:`save_manifest` (empty if missing)."""
+    if not path.is_file():
+        return Manifest()
+    return Manifest(files=json.loads(path.read_text(encoding='utf-8')))
+
+
+def save_manifest_diff(diff: ManifestDiff, base_url: str, path: Path) -> None:
+    """Write the delta (files to upload / delete and URLs to purge) as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        'added': list(diff.added),
+        'changed': list(diff.changed),
+        'removed': list(diff.removed),
+        'purge': urls_to_purge(diff, base_url),
+    }
+    path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
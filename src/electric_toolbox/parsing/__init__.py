@@ -5,11 +5,15 @@ from .components.navigation import ViewModelNavigationMenu
 from .models import ViewModelWebsite, Website
 from .parse import main as parse_website
 from .sections import ViewModelBlog, ViewModelBlogPost, ViewModelHomePage
+from .stream import StreamedWebsite, stream_website
+from .validate import ValidationReport, format_report, validate_website
 from .view import create_website_view_model
 
 __all__ = [
+    'StreamedWebsite',
     'TargetFiles',
     'Template',
+    'ValidationReport',
     'ViewModelBlog',
     'ViewModelBlogPost',
     'ViewModelHomePage',
@@ -17,5 +21,8 @@ __all__ = [
     'ViewModelWebsite',
     'Website',
     'create_website_view_model',
+    'format_report',
     'parse_website',
+    'stream_website',
+    'validate_website',
 ]
@@ -8,6 +8,13 @@ from pydantic import BaseModel, ConfigDict
 from electric_toolbox.constants import ExistingTemplates
 
 
+def slug(text: str) -> str:
+    """URL-friendly slug of ``text`` (python-slugify, imported on first use)."""
+    from slugify import slugify  # noqa: PLC0415 -- lazy: ~20 ms at import
+
+    return slugify(text)
+
+
 def isoformat_with_tz(value: datetime) -> str:
     """Return an ISO 8601 string that always carries a timezone offset.
 
@@ -30,9 +37,66 @@ class Template(BaseModel):
     extension: str
 
 
+# Folder (under the site root) holding the htmx fragment of every page.
+FRAGMENTS_DIRECTORY = '_fragments'
+
+
 class TargetFiles(BaseModel):
-    """The single output document for a page (one file per page under hx-boost)."""
+    """The output documents of a page."""
 
     model_config = ConfigDict(frozen=True)
     complete: Template
+    # Title + #body-content only, fetched by boosted navigation.
+    fragment: Optional[Template] = None
+    # Plain Markdown version of the page, for crawlers and agents (see llms.txt).
     llm: Optional[str] = None
+
+
+def fragment_destination(destination: str) -> str:
+    """Where the fragment of the page written to ``destination`` goes.
+
+    ``/posts/a.html`` -> ``/_fragments/posts/a.html``; the client maps page
+    URLs to fragment URLs the same way (see ``body.html``).
+    """
+    return f'/{FRAGMENTS_DIRECTORY}/{destination.lstrip("/")}'
+
+
+def llm_destination(destination: str) -> str:
+    """Where the Markdown version of the page written to ``destination`` goes.
+
+    ``/posts/a.html`` -> ``/posts/a.html.md``, the llms.txt convention.
+    """
+    return f'{destination}.md'
+
+
+def fragment_template(template: ExistingTemplates) -> ExistingTemplates:
+    """The fragment counterpart of a full-page template."""
+    match template:
+        case ExistingTemplates.INDEX | ExistingTemplates.INDEX_FRAGMENT:
+            return ExistingTemplates.INDEX_FRAGMENT
+        case ExistingTemplates.BLOG_INDEX | ExistingTemplates.BLOG_INDEX_FRAGMENT:
+            return ExistingTemplates.BLOG_INDEX_FRAGMENT
+        case ExistingTemplates.BLOG_ARTICLE | ExistingTemplates.BLOG_ARTICLE_FRAGMENT:
+            return ExistingTemplates.BLOG_ARTICLE_FRAGMENT
+
+
+def page_targets(destination: str, template: ExistingTemplates, extension: str = 'html') -> TargetFiles:
+    """The full document of a page, its htmx fragment and its Markdown version.
+
+    Args:
+        destination: Where the full document is written.
+        template: The full-page template.
+        extension: The file extension.
+
+    Returns:
+        The targets.
+    """
+    return TargetFiles(
+        complete=Template(destination=destination, template=template, extension=extension),
+        fragment=Template(
+            destination=fragment_destination(destination),
+            template=fragment_template(template),
+            extension=extension,
+        ),
+        llm=llm_destination(destination),
+    )
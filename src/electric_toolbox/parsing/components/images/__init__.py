@@ -0,0 +1,12 @@
+"""Image loading component."""
+
+from .functions import optimise_images
+from .headers import image_size, read_image_size
+from .models import ImageSize
+
+__all__ = [
+    'ImageSize',
+    'image_size',
+    'optimise_images',
+    'read_image_size',
+]
@@ -0,0 +1,85 @@
+"""Loading hints for the images of a converted post.
+
+Markdown images become bare ``<img>`` tags: the browser reserves no space for
+them (the text jumps when they arrive) and fetches them all at once, in
+document order, whether they are on screen or not. :func:`optimise_images`
+rewrites the tags of the HTML a post converts to:
+
+* the first image, the likeliest to be on screen (and the largest paint), is
+  fetched with ``fetchpriority="high"``;
+* every other image is ``loading="lazy"`` and ``decoding="async"``;
+* a local image (a path relative to the post, e.g. next to it) gets its
+  intrinsic ``width`` and ``height``, so its box is laid out before it loads.
+
+Attributes written by the author (``![..](..){: width=300 }``) are kept.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from urllib.parse import unquote, urlsplit
+
+from .headers import image_size
+
+_IMG = re.compile(r'<img\b(?P<attributes>[^>]*?)(?P<end>\s*/?>)', re.IGNORECASE)
+_ATTRIBUTE = re.compile(r'\s([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+
+
+def _attributes(text: str) -> Dict[str, str]:
+    """The attributes of a tag, by lowercase name."""
+    return {
+        match.group(1).lower(): next((value for value in match.groups()[1:] if value is not None), '')
+        for match in _ATTRIBUTE.finditer(text)
+    }
+
+
+def _local_image(src: str, directory: Optional[Path]) -> Optional[Path]:
+    """The file an image ``src`` relative to the post points to, if any."""
+    parts = urlsplit(src)
+    if directory is None or parts.scheme or parts.netloc or not parts.path or parts.path.startswith('/'):
+        return None
+    path = directory / unquote(parts.path)
+    return path if path.is_file() else None
+
+
+def _hints(attributes: Dict[str, str], first: bool, directory: Optional[Path]) -> List[str]:
+    """The attributes to add to an image."""
+    present: Set[str] = set(attributes)
+    hints = []
+    if not present & {'width', 'height'}:
+        path = _local_image(attributes.get('src', ''), directory)
+        size = image_size(path) if path is not None else None
+        if size is not None:
+            hints += [f'width="{size.width}"', f'height="{size.height}"']
+    if first:
+        if not present & {'fetchpriority', 'loading'}:
+            hints.append('fetchpriority="high"')
+    else:
+        hints += [
+            f'{name}="{value}"' for name, value in (('loading', 'lazy'), ('decoding', 'async')) if name not in present
+        ]
+    return hints
+
+
+def optimise_images(html: str, directory: Optional[Path] = None) -> str:
+    """Add the loading hints and intrinsic sizes to the images of a post.
+
+    Args:
+        html: The post, converted to HTML.
+        directory: The folder of the post's Markdown file, which relative
+            image paths are resolved from. ``None`` sizes no image.
+
+    Returns:
+        The HTML, with the same images.
+    """
+    seen = 0
+
+    def rewrite(match: re.Match[str]) -> str:
+        nonlocal seen
+        hints = _hints(_attributes(match.group('attributes')), seen == 0, directory)
+        seen += 1
+        if not hints:
+            return match.group()
+        return f'<img{match.group("attributes")} {" ".join(hints)}{match.group("end")}'
+
+    return _IMG.sub(rewrite, html)
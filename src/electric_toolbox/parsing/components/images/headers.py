@@ -0,0 +1,113 @@
+"""Intrinsic image dimensions, read from the file headers.
+
+Only the first bytes of a file are read (a JPEG is walked segment by segment up
+to its frame header), so measuring every image of a site costs a few reads per
+file, and no imaging library is needed. PNG, GIF, JPEG, WebP and SVG (its
+``width``/``height``, else its ``viewBox``) are understood; anything else has
+no known size.
+"""
+
+import functools
+import re
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from .models import ImageSize
+
+_HEADER_BYTES = 32  # enough for every header but JPEG's
+_MARKER = 2  # JPEG segment marker: 0xFF, then its type
+_SEGMENT_HEADER = 7  # JPEG segment length (2 bytes), then a frame's precision and height/width
+_SVG_BYTES = 4096
+# JPEG start-of-frame markers (the others of 0xC0-0xCF are DHT, JPG and DAC).
+_JPEG_FRAMES = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_STANDALONE = frozenset({0x01, *range(0xD0, 0xD8)})  # TEM and RSTn: no length
+_SVG_TAG = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE)
+_SVG_LENGTH = r'\b{}\s*=\s*["\']\s*([0-9.]+)\s*(?:px)?\s*["\']'
+_SVG_VIEWBOX = re.compile(rb'\bviewBox\s*=\s*["\']\s*[-0-9.]+[\s,]+[-0-9.]+[\s,]+([0-9.]+)[\s,]+([0-9.]+)\s*["\']')
+
+
+def _jpeg_size(handle: BinaryIO) -> Optional[ImageSize]:
+    handle.seek(len(b'\xff\xd8'))  # past the start-of-image marker
+    while True:
+        marker = handle.read(_MARKER)
+        if len(marker) < _MARKER or marker[:1] != b'\xff':
+            return None
+        if marker[1:] == b'\xff':  # fill byte
+            handle.seek(-1, 1)
+            continue
+        if marker[1] in _JPEG_STANDALONE:
+            continue
+        header = handle.read(_SEGMENT_HEADER)
+        if len(header) < _SEGMENT_HEADER:
+            return None
+        (length,) = struct.unpack('>H', header[:2])
+        if marker[1] in _JPEG_FRAMES:
+            height, width = struct.unpack('>HH', header[3:7])
+            return ImageSize(width, height)
+        handle.seek(length - _SEGMENT_HEADER, 1)
+
+
+def _svg_size(head: bytes) -> Optional[ImageSize]:
+    tag = _SVG_TAG.search(head)
+    if tag is None:
+        return None
+    width = re.search(_SVG_LENGTH.format('width').encode(), tag.group())
+    height = re.search(_SVG_LENGTH.format('height').encode(), tag.group())
+    if width is not None and height is not None:
+        return ImageSize(round(float(width.group(1))), round(float(height.group(1))))
+    viewbox = _SVG_VIEWBOX.search(tag.group())
+    if viewbox is not None:
+        return ImageSize(round(float(viewbox.group(1))), round(float(viewbox.group(2))))
+    return None
+
+
+def _webp_size(head: bytes) -> Optional[ImageSize]:
+    match head[12:16]:
+        case b'VP8 ':
+            width, height = struct.unpack('<HH', head[26:30])
+            return ImageSize(width & 0x3FFF, height & 0x3FFF)
+        case b'VP8L':
+            b = head[21:25]
+            return ImageSize(1 + (((b[1] & 0x3F) << 8) | b[0]), 1 + (((b[3] & 0xF) << 10) | (b[2] << 2) | (b[1] >> 6)))
+        case b'VP8X':
+            return ImageSize(1 + int.from_bytes(head[24:27], 'little'), 1 + int.from_bytes(head[27:30], 'little'))
+    return None
+
+
+def _size_from_header(handle: BinaryIO, head: bytes, suffix: str) -> Optional[ImageSize]:
+    if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+        return ImageSize(*struct.unpack('>II', head[16:24]))
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return ImageSize(*struct.unpack('<HH', head[6:10]))
+    if head.startswith(b'\xff\xd8'):
+        return _jpeg_size(handle)
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return _webp_size(head)
+    if suffix == '.svg':
+        return _svg_size(head + handle.read(_SVG_BYTES))
+    return None
+
+
+def read_image_size(path: Path) -> Optional[ImageSize]:
+    """The intrinsic size of an image file, if its format is known and its header is valid."""
+    try:
+        with path.open('rb') as handle:
+            return _size_from_header(handle, handle.read(_HEADER_BYTES), path.suffix.lower())
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_image_size(path: Path, size: int, mtime_ns: int) -> Optional[ImageSize]:
+    """Keyed by the file's size and modification time too, so an edited image is read again."""
+    return read_image_size(path)
+
+
+def image_size(path: Path) -> Optional[ImageSize]:
+    """:func:`read_image_size`, read once per version of the file in this process."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _cached_image_size(path, stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,10 @@
+"""Models for the image post-processing."""
+
+from typing import NamedTuple
+
+
+class ImageSize(NamedTuple):
+    """Intrinsic dimensions of an image, in pixels."""
+
+    width: int
+    height: int
@@ -1,17 +1,15 @@
 """Opengraph Component."""
 
-from .article_functions import create_opengraph_article, create_opengraph_article_view_model
+from .article_functions import create_opengraph_article_view_model
 from .models import Author, OpenGraph, OpenGraphArticle, ViewModelOpenGraph
-from .page_functions import create_opengraph_typed_article, create_opengraph_typed_website, create_opengraph_view_model
+from .page_functions import create_opengraph_typed_website, create_opengraph_view_model
 
 __all__ = [
     'Author',
     'OpenGraph',
     'OpenGraphArticle',
     'ViewModelOpenGraph',
-    'create_opengraph_article',
     'create_opengraph_article_view_model',
-    'create_opengraph_typed_article',
     'create_opengraph_typed_website',
     'create_opengraph_view_model',
 ]
@@ -1,21 +1,11 @@
 """Article functions."""
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, Generator
-
-import frontmatter  # type: ignore
-from expression import Error, Ok, Result, Some, effect
+from expression import Ok, Result, Some
 from expression.collections import Block
-from expression.extra.result.traversable import traverse
 from pydantic import HttpUrl
 
-from electric_toolbox.exceptions import ParsingError
-from electric_toolbox.parsing.common import isoformat_with_tz
-
 from .models import Author, OpenGraphArticle, ViewModelOpenGraph
 
-MarkdownMetadata = dict[str, Any]
-
 
 def default_author() -> Result[Block[Author], Exception]:
     """Default author."""
@@ -35,144 +25,6 @@ def default_author() -> Result[Block[Author], Exception]:
     )
 
 
-def _parse_publication_time(data: MarkdownMetadata, add_time: timedelta = timedelta(days=0)) -> Result[str, Exception]:
-    """Parses the publish date from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-        add_time: The time to add to the publish date.
-
-    Returns:
-        Result[Option[datetime], Exception]: Ok(Option[datetime]) containing the publish date if present and valid,
-            Error(Exception) if the publish date is invalid.
-    """
-    date_obj = data.get('publication_time')
-    match date_obj:
-        case datetime():
-            return Ok(isoformat_with_tz(date_obj + add_time))
-        case _:
-            return Error(Exception('Frontmatter `publication_time` must be an ISO8601 datetime string'))
-
-
-def _parse_modification_time(data: MarkdownMetadata, add_time: timedelta = timedelta(days=0)) -> Result[str, Exception]:
-    """Parses the publish date from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-        add_time: The time to add to the publish date.
-
-    Returns:
-        Result[Option[datetime], Exception]: Ok(Option[datetime]) containing the publish date if present and valid,
-            Error(Exception) if the publish date is invalid.
-    """
-    date_obj = data.get('modified_time', data.get('publication_time'))
-    match date_obj:
-        case datetime():
-            return Ok(isoformat_with_tz(date_obj + add_time))
-        case _:
-            return Error(
-                ParsingError(
-                    message='Frontmatter `modified_time` must be an ISO8601 datetime string',
-                    cause=ValueError(),
-                )
-            )
-
-
-def _parse_author(data: Dict[str, Any]) -> Result[Author, Exception]:
-    """Parses the author information from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[Author, Exception]: Ok(Author) if the author information is present and valid,
-            Error(Exception) otherwise.
-    """
-    try:
-        return Ok(Author(**data))
-    except Exception as e:
-        return Error(Exception('Author frontmatter incorrect.', e))
-
-
-@effect.result[Block[Author], Exception]()
-def _parse_authors(data: MarkdownMetadata) -> Generator[Any, Any, Block[Author]]:
-    """Parses the author information from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[Author, Exception]: Ok(Author) if the author information is present and valid,
-            Error(Exception) otherwise.
-    """
-    if data.get('authors', False):
-        return (yield from traverse(_parse_author, Block.of_seq(xs=data['authors'])))
-    else:
-        return (yield from default_author())
-
-
-def _parse_tags(data: MarkdownMetadata) -> Result[Block[str], Exception]:
-    """Parses the tags from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[Block[str], Exception]: Ok(Block[str]) containing the tags if present and valid,
-            Error(Exception) if the tags are invalid.
-    """
-    tags = data.get('tags')
-    if tags is None:
-        return Ok(Block[str].empty())
-    match tags:
-        case list() if all(isinstance(tag, str) for tag in tags):
-            return Ok(Block.of_seq(tags))
-        case _:
-            return Error(Exception('Tags must be a list of strings'))
-
-
-def _parse_section(
-    data: MarkdownMetadata,
-) -> Result[str, Exception]:
-    """Parses the content type from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-        default: The default content type if not specified in the metadata.
-
-    Returns:
-        Result[ContentType, Exception]: Ok(ContentType) containing the content type if present and valid,
-            Error(Exception) if the content type is invalid.
-    """
-    content_type = data.get('section', False)
-    if data.get('section', False):
-        try:
-            return Ok(str(content_type))
-        except ValueError:
-            return Error(Exception('Invalid content type'))
-    return Error(Exception(f'Invalid content type: {content_type}'))
-
-
-@effect.result[OpenGraphArticle, Exception]()
-def create_opengraph_article(data: frontmatter.Post) -> Generator[Any, Any, OpenGraphArticle]:
-    """Create the OpenGraph for an Article.
-
-    Args:
-        data: The frontmatter data.
-
-    Returns:
-        OpenGraphArticle: The OpenGraphArticle.
-    """
-    return OpenGraphArticle(
-        publication_time=(yield from _parse_publication_time(data.metadata)),
-        modified_time=(yield from _parse_modification_time(data.metadata)),
-        expiration_time=(yield from _parse_publication_time(data.metadata, add_time=timedelta(days=731))),
-        authors=(yield from _parse_authors(data.metadata)),
-        tags=(yield from _parse_tags(data.metadata)),
-        section=(yield from _parse_section(data.metadata)),
-    )
-
-
 def _render_author(author: Author) -> str:
     """Renders a single author tag."""
     return f'<meta property="og:article:author" content="{author.url}">'
@@ -1,122 +1,11 @@
 """Opengraph functions for the whole page. (Non specific)."""
 
-from typing import Any, Generator
-
-import frontmatter  # type: ignore
-from expression import Error, Nothing, Ok, Option, Result, Some, effect
+from expression import Error, Ok, Option, Result, Some
 from expression.collections import Block
 from pydantic import HttpUrl, ValidationError
 
-from electric_toolbox.exceptions import ParsingError
-
 from .models import OpenGraph, ViewModelOpenGraph
 
-MarkdownMetadata = dict[str, Any]
-
-
-def _parse_title(data: MarkdownMetadata) -> Result[str, ParsingError]:
-    """Parses the title from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[str, Exception]: Ok(str) containing the title if present,
-            Error(Exception) if the title is missing.
-    """
-    title = data.get('title')
-    if title is not None:
-        return Ok(title)
-    else:
-        return Error(
-            ParsingError(
-                message='Title not found',
-                cause=ValueError(),
-                context={
-                    'function': 'electric_toolbox.parsing.components.opengraph.page_functions._parse_title',
-                },
-            )
-        )
-
-
-def _parse_image(data: MarkdownMetadata) -> Result[str, Exception]:
-    """Parses the image from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[str, Exception]: Ok(str) containing the image if present and valid,
-            Error(Exception) if the image is invalid.
-    """
-    image = data.get('image', False)
-    if image:
-        return Ok(image if isinstance(image, str) else image.get('src', ''))
-    else:
-        return Error(Exception('Image not found'))
-
-
-def _parse_language(data: MarkdownMetadata, default: str = 'en') -> Result[str, Exception]:
-    """Parses the language from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-        default: The default language if not specified in the metadata.
-
-    Returns:
-        Result[str, Exception]: Ok(str) containing the language if present and valid,
-            Error(Exception) if the language is invalid.
-    """
-    language = data.get('language', default)
-    if isinstance(language, str):
-        return Ok(language)
-    return Error(Exception('Language must be a string'))
-
-
-def _parse_description(data: MarkdownMetadata) -> Result[Option[str], Exception]:
-    """Parses the description from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[Option[str], Exception]: Ok(Option[str]) containing the description if present and valid,
-            Error(Exception) if the description is invalid.
-    """
-    description = data.get('description', Nothing)
-    match description:
-        case str(desc):
-            return Ok(Some(desc))
-        case Option(none=None):
-            return Ok(Nothing)
-        case _:
-            return Error(Exception('Description must be a string'))
-
-
-@effect.result[OpenGraph, Exception]()
-def create_opengraph_typed_article(
-    data: frontmatter.Post,
-    url: str,
-) -> Generator[Any, Any, OpenGraph]:
-    """Parses the OpenGraph metadata from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-        url: The URL of the post.
-
-    Returns:
-        Result[OpenGraph, Exception]: Ok(OpenGraph) if the metadata is valid
-        Error(Exception) otherwise.
-    """
-    return OpenGraph(
-        title=(yield from _parse_title(data.metadata)),
-        ogtype='article',
-        image=(yield from _parse_image(data.metadata)),
-        locale=(yield from _parse_language(data.metadata)),
-        description=(yield from _parse_description(data.metadata)),
-        url=HttpUrl(url),
-    )
-
 
 def create_opengraph_typed_website(
     title: str,
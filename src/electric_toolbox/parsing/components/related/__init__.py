@@ -0,0 +1,12 @@
+"""Related posts component."""
+
+from .functions import RelatedDocument, document_terms, related_from_terms, related_posts
+from .models import RelatedPost
+
+__all__ = [
+    'RelatedDocument',
+    'RelatedPost',
+    'document_terms',
+    'related_from_terms',
+    'related_posts',
+]
@@ -0,0 +1,222 @@
+"""Top-k similar posts from a sparse tag/term matrix.
+
+Each post becomes a sparse, L2-normalised TF-IDF row over its words and tags
+(tags weigh more). Cosine similarity of every pair would be quadratic, so the
+matrix is also kept column-wise as an inverted index: a post's scores are the
+sparse row times the sparse matrix, touching only the posts sharing at least
+one term with it. Terms present in a single post (they relate nothing) or in
+most posts (they relate everything) are dropped, and every row keeps only its
+strongest terms, which keeps the posting lists short. Rows are processed in
+chunks, so only one chunk of score vectors is alive at a time.
+
+With the ``related`` extra (NumPy and SciPy) installed, the same matrix is
+built and multiplied as a ``scipy.sparse`` CSR matrix; without it, the pure
+Python dictionaries below do the work.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # the ``related`` extra is not installed
+    VECTORIZED = False
+else:
+    VECTORIZED = True
+
+_WORD_RE = re.compile(r'[a-z0-9]{3,}')
+_STOP_WORDS = frozenset(
+    'the and for are but not you all any can had her was one our out has his how its may new now old see two who '
+    'did get him let put say she too use that with have this will your from they been more when what were which '
+    'their there than then them these some would could other into only also just like over such very'.split()
+)
+
+SparseRow = Dict[str, float]
+
+
+class RelatedDocument(NamedTuple):
+    """What the similarity is computed from."""
+
+    tags: Sequence[str]
+    text: str
+
+
+def document_terms(document: RelatedDocument, tag_weight: float = 3.0) -> Dict[str, float]:
+    """Raw term weights: word counts plus boosted ``tag:`` terms.
+
+    This is all :func:`related_from_terms` needs from a document, so a caller
+    streaming the posts can keep these instead of the text.
+    """
+    counts: Dict[str, float] = dict(Counter(w for w in _WORD_RE.findall(document.text.lower()) if w not in _STOP_WORDS))
+    for tag in document.tags:
+        counts[f'tag:{tag.lower()}'] = counts.get(f'tag:{tag.lower()}', 0.0) + tag_weight
+    return counts
+
+
+def _tfidf_rows(
+    counts: Sequence[Dict[str, float]],
+    max_df: float,
+    max_terms: int,
+) -> List[SparseRow]:
+    """L2-normalised, sublinear TF-IDF rows with uninformative terms dropped."""
+    total = len(counts)
+    df: Counter[str] = Counter(term for row in counts for term in row)
+    idf = {term: math.log(total / n) + 1.0 for term, n in df.items() if 1 < n <= max(2, max_df * total)}
+
+    rows: List[SparseRow] = []
+    for row in counts:
+        weighted = dict(
+            heapq.nlargest(
+                max_terms,
+                ((term, (1.0 + math.log(tf)) * idf[term]) for term, tf in row.items() if term in idf and tf > 0),
+                key=lambda item: item[1],
+            )
+        )
+        norm = math.sqrt(sum(w * w for w in weighted.values())) or 1.0
+        rows.append({term: w / norm for term, w in weighted.items()})
+    return rows
+
+
+def _inverted_index(rows: Sequence[SparseRow]) -> Dict[str, List[Tuple[int, float]]]:
+    """Column view of the matrix: term -> [(row, weight)]."""
+    index: Dict[str, List[Tuple[int, float]]] = {}
+    for i, row in enumerate(rows):
+        for term, weight in row.items():
+            index.setdefault(term, []).append((i, weight))
+    return index
+
+
+def _chunks(size: int, chunk_size: int) -> Iterator[range]:
+    for start in range(0, size, chunk_size):
+        yield range(start, min(start + chunk_size, size))
+
+
+def _tfidf_matrix(counts: Sequence[Dict[str, float]], max_df: float, max_terms: int) -> 'sparse.csr_array':
+    """:func:`_tfidf_rows` as a CSR matrix, one row per document."""
+    vocabulary = {term: column for column, term in enumerate(dict.fromkeys(chain.from_iterable(counts)))}
+    columns = np.fromiter(map(vocabulary.__getitem__, chain.from_iterable(counts)), dtype=np.int64)
+    tfs = np.fromiter(chain.from_iterable(row.values() for row in counts), dtype=np.float64, count=len(columns))
+    rows = np.repeat(np.arange(len(counts)), [len(row) for row in counts])
+
+    total = len(counts)
+    df = np.bincount(columns, minlength=len(vocabulary))
+    keep = (tfs > 0) & (df[columns] > 1) & (df[columns] <= max(2, max_df * total))
+    columns, tfs, rows = columns[keep], tfs[keep], rows[keep]
+    weights = (1.0 + np.log(tfs)) * (np.log(total / df[columns]) + 1.0)
+
+    # Highest weights first within each row; the stable sort keeps the first
+    # of equal weights, as heapq.nlargest does.
+    order = np.lexsort((-weights, rows))
+    columns, weights, rows = columns[order], weights[order], rows[order]
+    starts = np.searchsorted(rows, rows)
+    strongest = np.arange(len(rows)) - starts < max_terms
+    columns, weights, rows = columns[strongest], weights[strongest], rows[strongest]
+
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=total))
+    norms[norms == 0] = 1.0
+    return sparse.csr_array((weights / norms[rows], (rows, columns)), shape=(total, len(vocabulary)))
+
+
+def _related_vectorized(
+    terms: Sequence[Dict[str, float]],
+    k: int,
+    max_df: float,
+    max_terms: int,
+    chunk_size: int,
+) -> List[List[Tuple[int, float]]]:
+    """:func:`related_from_terms` with the chunks scored by a sparse matrix product."""
+    matrix = _tfidf_matrix(terms, max_df, max_terms)
+    transposed = matrix.T.tocsr()
+    results: List[List[Tuple[int, float]]] = []
+    for chunk in _chunks(matrix.shape[0], chunk_size):
+        scores = (matrix[chunk.start : chunk.stop] @ transposed).tocsr()
+        for offset, i in enumerate(chunk):
+            start, stop = scores.indptr[offset], scores.indptr[offset + 1]
+            others, values = scores.indices[start:stop], scores.data[start:stop]
+            keep = others != i
+            others, values = others[keep], values[keep]
+            if len(values) > k:
+                kth = np.partition(values, len(values) - k)[len(values) - k]
+                keep = values >= kth
+                others, values = others[keep], values[keep]
+            best = np.lexsort((others, -values))[:k]
+            results.append([(int(others[j]), round(float(values[j]), 6)) for j in best])
+    return results
+
+
+def related_from_terms(
+    terms: Sequence[Dict[str, float]],
+    *,
+    k: int = 3,
+    max_df: float = 0.5,
+    max_terms: int = 32,
+    chunk_size: int = 512,
+) -> List[List[Tuple[int, float]]]:
+    """Top-``k`` most similar documents for every document.
+
+    Args:
+        terms: Every document's :func:`document_terms`.
+        k: How many related posts to keep per post.
+        max_df: Terms in more than this fraction of the posts are ignored.
+        max_terms: Terms kept per post (the highest TF-IDF weights).
+        chunk_size: Rows scored together (bounds the live score vectors).
+
+    Returns:
+        For each document (same order), ``(index, cosine similarity)`` pairs,
+        most similar first. Documents sharing nothing are not listed.
+    """
+    if VECTORIZED:
+        return _related_vectorized(terms, k, max_df, max_terms, chunk_size)
+    rows = _tfidf_rows(terms, max_df, max_terms)
+    index = _inverted_index(rows)
+    results: List[List[Tuple[int, float]]] = []
+    for chunk in _chunks(len(rows), chunk_size):
+        scores: List[Dict[int, float]] = [{} for _ in chunk]
+        for offset, i in enumerate(chunk):
+            acc = scores[offset]
+            for term, weight in rows[i].items():
+                for j, other in index[term]:
+                    if j != i:
+                        acc[j] = acc.get(j, 0.0) + weight * other
+        results.extend(
+            [(j, round(score, 6)) for j, score in heapq.nlargest(k, acc.items(), key=lambda item: (item[1], -item[0]))]
+            for acc in scores
+        )
+    return results
+
+
+def related_posts(  # noqa: PLR0913
+    documents: Sequence[RelatedDocument],
+    *,
+    k: int = 3,
+    tag_weight: float = 3.0,
+    max_df: float = 0.5,
+    max_terms: int = 32,
+    chunk_size: int = 512,
+) -> List[List[Tuple[int, float]]]:
+    """Top-``k`` most similar documents for every document.
+
+    Args:
+        documents: The posts' tags and plain text.
+        k: How many related posts to keep per post.
+        tag_weight: Weight of a shared tag relative to a single word occurrence.
+        max_df: Terms in more than this fraction of the posts are ignored.
+        max_terms: Terms kept per post (the highest TF-IDF weights).
+        chunk_size: Rows scored together (bounds the live score vectors).
+
+    Returns:
+        For each document (same order), ``(index, cosine similarity)`` pairs,
+        most similar first. Documents sharing nothing are not listed.
+    """
+    return related_from_terms(
+        [document_terms(document, tag_weight) for document in documents],
+        k=k,
+        max_df=max_df,
+        max_terms=max_terms,
+        chunk_size=chunk_size,
+    )
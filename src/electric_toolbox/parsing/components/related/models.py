@@ -0,0 +1,13 @@
+"""Models for related posts."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RelatedPost(BaseModel):
+    """A link to a post similar to the current one."""
+
+    model_config = ConfigDict(frozen=True)
+    title: str
+    href: str  # root-relative; htmx-boost handles the swap
+    date: str  # iso8601
+    score: float
@@ -0,0 +1,33 @@
+"""Plain-text extraction component."""
+
+from typing import TYPE_CHECKING, Any
+
+from .cache import ConversionCache, conversion_fingerprint
+from .chunks import CHUNKED_THRESHOLD, split_markdown, stitch_chunks
+from .functions import excerpt
+from .models import Heading, PlainText
+
+if TYPE_CHECKING:
+    from .extension import PlainTextExtension
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Markdown extension (and so ``markdown``) on first use."""
+    if name == 'PlainTextExtension':
+        from .extension import PlainTextExtension  # noqa: PLC0415
+
+        return PlainTextExtension
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+__all__ = [
+    'CHUNKED_THRESHOLD',
+    'ConversionCache',
+    'Heading',
+    'PlainText',
+    'PlainTextExtension',
+    'conversion_fingerprint',
+    'excerpt',
+    'split_markdown',
+    'stitch_chunks',
+]
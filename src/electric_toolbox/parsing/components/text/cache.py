@@ -0,0 +1,78 @@
+"""Persistent cache of the Markdown conversions.
+
+The HTML and plain text of a post only depend on its Markdown body, on the
+Markdown extensions (and their configuration) and on the library versions. An
+edit to a template or to ``compile.config.toml`` used to send every post back
+through the converter all the same; with the cache, a conversion is looked up
+by the hash of those inputs first. The entries are content-addressed JSON files,
+written atomically, so parallel workers can share a cache directory.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+from .models import PlainText
+
+# Bump when the conversion code itself (not a library) changes its output.
+CONVERSION_VERSION = 1
+
+
+def _version(package: str) -> str:
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return ''
+
+
+def conversion_fingerprint(settings: Any, packages: Sequence[str]) -> str:
+    """Identifies a converter: its settings (JSON-serialisable) and the versions of ``packages``."""
+    identity = [CONVERSION_VERSION, settings, {package: _version(package) for package in packages}]
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class ConversionCache:
+    """``<directory>/<2 hex digits>/<sha256>.json`` entries: HTML and plain text by input.
+
+    ``hits`` and ``misses`` count the lookups made in this process.
+
+    Args:
+        directory (Path): Where the entries are stored (created when needed).
+        fingerprint (str): The converter's :func:`conversion_fingerprint`.
+    """
+
+    def __init__(self, directory: Path, fingerprint: str):
+        """Conversion cache."""
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, contents: str) -> Path:
+        key = hashlib.sha256(f'{self.fingerprint}\0{contents}'.encode('utf-8')).hexdigest()
+        return self.directory / key[:2] / f'{key}.json'
+
+    def get(self, contents: str) -> Optional[Tuple[str, PlainText]]:
+        """The cached conversion of ``contents``, if any (an unreadable entry is a miss)."""
+        try:
+            entry = json.loads(self._path(contents).read_text(encoding='utf-8'))
+            result = entry['html'], PlainText.model_validate(entry['plain_text'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, contents: str, html: str, plain_text: PlainText) -> None:
+        """Store the conversion of ``contents``."""
+        path = self._path(contents)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(f'.{os.getpid()}.tmp')
+        partial.write_text(
+            json.dumps({'html': html, 'plain_text': plain_text.model_dump(mode='json')}), encoding='utf-8'
+        )
+        os.replace(partial, path)
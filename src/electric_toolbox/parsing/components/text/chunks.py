@@ -0,0 +1,225 @@
+"""Splitting a very large Markdown document, and stitching its converted parts.
+
+A single ``Markdown.convert`` call runs on one core and holds the element tree
+of the whole document (several times the size of the source) in memory. Above
+:data:`CHUNKED_THRESHOLD` characters the source is cut at safe top-level block
+boundaries into parts of about :data:`CHUNK_SIZE`, the parts are converted on
+their own (in parallel) and the results are joined back as one document:
+
+* a part starts after a blank line, at a heading or a paragraph, never inside a
+  code fence or a raw HTML block, nor between two references to the same
+  footnote;
+* reference link definitions are repeated in every part, and each footnote
+  definition goes with the part that references it;
+* heading ids are made unique across the parts (``toc`` only sees its own part),
+  and the footnotes are renumbered and gathered into a single list at the end
+  (numbered in reading order of the parts).
+
+Nothing here imports ``markdown``: the parts are plain strings in, HTML out.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from expression.collections import Block
+
+from .functions import excerpt
+from .models import Heading, PlainText
+
+# Documents shorter than this (in characters) are converted in one go.
+CHUNKED_THRESHOLD = 1_000_000
+# Target size of a part (a part only ends at a safe boundary, so may be longer).
+CHUNK_SIZE = 256_000
+
+_FENCE_RE = re.compile(r'^\s*(`{3,}|~{3,})')
+_FOOTNOTE_DEFINITION_RE = re.compile(r'^ {0,3}\[\^([^\]]+)\]:')
+_FOOTNOTE_REFERENCE_RE = re.compile(r'\[\^([^\]]+)\](?!:)')
+_LINK_DEFINITION_RE = re.compile(r'^ {0,3}\[(?!\^)[^\]]+\]:\s*\S')
+_PART_START_RE = re.compile(r'^(#{1,6}\s|[^\W\d_])')
+_HTML_OPEN_RE = re.compile(r'<(div|section|article|aside|details|figure|table|blockquote)\b', re.IGNORECASE)
+_HTML_CLOSE_RE = re.compile(r'</(div|section|article|aside|details|figure|table|blockquote)\s*>', re.IGNORECASE)
+_ID_COUNT_RE = re.compile(r'^(.*)_([0-9]+)$')  # the ``toc`` extension's
+_FOOTNOTES_OPEN = '<div class="footnote">\n<hr />\n<ol>\n'
+_FOOTNOTES_CLOSE = '</ol>\n</div>'
+_FOOTNOTE_NUMBER_RE = re.compile(
+    r'(<a class="footnote-ref" href="#fn:[^"]*">|Jump back to footnote )(\d+)(?=</a>| in the text)'
+)
+
+
+def _indented(line: str) -> bool:
+    return line.startswith(('    ', '\t'))
+
+
+def _fence(line: str, open_fence: Optional[str]) -> Optional[str]:
+    """The fence open after ``line``, given the one open before it."""
+    match = _FENCE_RE.match(line)
+    if match is None:
+        return open_fence
+    if open_fence is None:
+        return match.group(1)
+    marker = match.group(1)
+    closes = marker[0] == open_fence[0] and len(marker) >= len(open_fence) and not line.strip()[len(marker) :]
+    return None if closes else open_fence
+
+
+def _scan(lines: List[str]) -> Tuple[List[str], List[int], Dict[str, str], List[str]]:
+    """Separate the definitions from the body and find where a part may start.
+
+    Returns:
+        The body lines, the indices (in the body) a part may start at, the
+        footnote definitions by label (in document order) and the reference
+        link definitions.
+    """
+    body: List[str] = []
+    starts: List[int] = []
+    footnotes: Dict[str, str] = {}
+    links: List[str] = []
+    fence: Optional[str] = None
+    html_depth = 0
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if fence is None and html_depth == 0:
+            if match := _FOOTNOTE_DEFINITION_RE.match(line):
+                end = i + 1
+                while end < len(lines) and (not lines[end].strip() or _indented(lines[end])):
+                    end += 1
+                while end > i + 1 and not lines[end - 1].strip():
+                    end -= 1
+                footnotes[match.group(1)] = '\n'.join(lines[i:end])
+                i = end
+                continue
+            if _LINK_DEFINITION_RE.match(line):
+                links.append(line)
+                i += 1
+                continue
+            if body and not body[-1].strip() and _PART_START_RE.match(line):
+                starts.append(len(body))
+        was_open = fence is not None
+        fence = _fence(line, fence)
+        if not was_open and fence is None:
+            html_depth = max(0, html_depth + len(_HTML_OPEN_RE.findall(line)) - len(_HTML_CLOSE_RE.findall(line)))
+        body.append(line)
+        i += 1
+    return body, starts, footnotes, links
+
+
+def _shared_footnotes(body: List[str], starts: List[int]) -> Set[int]:
+    """Part starts that would separate two references to the same footnote."""
+    first: Dict[str, int] = {}
+    last: Dict[str, int] = {}
+    for index, line in enumerate(body):
+        for label in _FOOTNOTE_REFERENCE_RE.findall(line):
+            first.setdefault(label, index)
+            last[label] = index
+    return {start for start in starts for label in first if first[label] < start <= last[label]}
+
+
+def split_markdown(contents: str, chunk_size: int = CHUNK_SIZE) -> List[str]:
+    """Cut ``contents`` into parts that convert on their own.
+
+    Args:
+        contents: The Markdown source.
+        chunk_size: Target size of a part, in characters.
+
+    Returns:
+        The parts, in order (a single one when there is no safe boundary).
+    """
+    body, starts, footnotes, links = _scan(contents.split('\n'))
+    blocked = _shared_footnotes(body, starts)
+    cuts = [0]
+    size = 0
+    previous = 0
+    for start in [*starts, len(body)]:
+        size += sum(len(line) + 1 for line in body[previous:start])
+        previous = start
+        if size >= chunk_size and start not in blocked and start < len(body):
+            cuts.append(start)
+            size = 0
+
+    sections = [body[begin:end] for begin, end in zip(cuts, [*cuts[1:], len(body)])]
+    referenced = [set(_FOOTNOTE_REFERENCE_RE.findall('\n'.join(section))) for section in sections]
+    orphans = set(footnotes).difference(*referenced)
+    parts = []
+    for index, (section, labels) in enumerate(zip(sections, referenced)):
+        last = index == len(sections) - 1
+        notes = [text for label, text in footnotes.items() if label in labels or (last and label in orphans)]
+        parts.append('\n\n'.join(['\n'.join(section).rstrip('\n'), *notes, *links]))
+    return parts
+
+
+def _unique(id_: str, used: Set[str]) -> str:
+    """Same as the ``toc`` extension: ``id``, else ``id_1``, ``id_2``..."""
+    while id_ in used or not id_:
+        match = _ID_COUNT_RE.match(id_)
+        id_ = f'{match.group(1)}_{int(match.group(2)) + 1}' if match else f'{id_}_1'
+    used.add(id_)
+    return id_
+
+
+def _rename_ids(html: str, renames: Dict[str, str]) -> str:
+    if not renames:
+        return html
+    pattern = re.compile(r'(id="|href="#)(' + '|'.join(map(re.escape, renames)) + r')"')
+    return pattern.sub(lambda match: f'{match.group(1)}{renames[match.group(2)]}"', html)
+
+
+def _split_footnotes(html: str) -> Tuple[str, str]:
+    """A part's body and its footnote list items."""
+    index = html.rfind(_FOOTNOTES_OPEN)
+    if index == -1 or not html.endswith(_FOOTNOTES_CLOSE):
+        return html, ''
+    return html[:index].rstrip('\n'), html[index + len(_FOOTNOTES_OPEN) : -len(_FOOTNOTES_CLOSE)]
+
+
+def _renumber(html: str, offset: int) -> str:
+    if not offset:
+        return html
+    return _FOOTNOTE_NUMBER_RE.sub(lambda match: f'{match.group(1)}{int(match.group(2)) + offset}', html)
+
+
+def _excerpt(parts: Sequence[Tuple[str, PlainText]]) -> str:
+    """The leading text runs on into the next part until an excerpt was cut short."""
+    lead = ''
+    for _, plain in parts:
+        if plain.excerpt.endswith('…'):
+            return excerpt(f'{lead} {plain.excerpt}') if lead else plain.excerpt
+        lead = f'{lead} {plain.excerpt}'.strip()
+    return excerpt(lead)
+
+
+def stitch_chunks(parts: Sequence[Tuple[str, PlainText]]) -> Tuple[str, PlainText]:
+    """Join the converted parts of a document as if it had been converted whole.
+
+    Args:
+        parts: The HTML and plain text of every part, in order.
+
+    Returns:
+        The HTML and plain text of the document.
+    """
+    used: Set[str] = set()
+    bodies: List[str] = []
+    notes: List[str] = []
+    outline: List[Heading] = []
+    offset = 0
+    for html, plain in parts:
+        renames: Dict[str, str] = {}
+        for heading in plain.outline:
+            unique = _unique(heading.id, used)
+            if unique != heading.id:
+                renames[heading.id] = unique
+            outline.append(Heading(level=heading.level, id=unique, title=heading.title))
+        body, items = _split_footnotes(_rename_ids(html, renames))
+        bodies.append(_renumber(body, offset))
+        notes.append(_renumber(items, offset))
+        offset += items.count('<li id="fn:')
+
+    footnotes = ''.join(notes)
+    html = '\n'.join(bodies) + (f'\n{_FOOTNOTES_OPEN}{footnotes}{_FOOTNOTES_CLOSE}' if footnotes else '')
+    texts = [plain.text for _, plain in parts if plain.text]
+    return html, PlainText(
+        text=' '.join(texts),
+        word_count=sum(plain.word_count for _, plain in parts),
+        excerpt=_excerpt(parts),
+        outline=Block.of_seq(outline),
+    )
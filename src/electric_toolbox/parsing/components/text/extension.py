@@ -0,0 +1,47 @@
+"""The Markdown extension recording the :class:`PlainText` of a conversion.
+
+Kept apart from :mod:`.functions` so that importing the component does not
+import ``markdown``: only a conversion needs it.
+"""
+
+import xml.etree.ElementTree as etree
+from typing import Any, List, Optional
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+from .functions import extract_plain_text
+from .models import PlainText
+
+
+class _PlainTextTreeprocessor(Treeprocessor):
+    def __init__(self, md: Markdown, extension: 'PlainTextExtension'):
+        super().__init__(md)
+        self.extension = extension
+
+    def run(self, root: etree.Element) -> None:
+        toc_tokens: List[dict[str, Any]] = getattr(self.md, 'toc_tokens', [])
+        self.extension.result = extract_plain_text(root, toc_tokens, self.extension.getConfig('excerpt_limit'))
+
+
+class PlainTextExtension(Extension):
+    """Records the :class:`PlainText` of every conversion in :attr:`result`.
+
+    Runs after ``toc`` (so heading ids and the token tree exist) and before
+    the tree is serialised.
+    """
+
+    def __init__(self, **kwargs: Any):
+        """Plain-text extension (``excerpt_limit`` configures the excerpt length)."""
+        self.config = {'excerpt_limit': [160, 'Excerpt length, in characters']}
+        super().__init__(**kwargs)
+        self.result: Optional[PlainText] = None
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        """Register the tree walker right after ``toc`` (priority 5)."""
+        md.treeprocessors.register(_PlainTextTreeprocessor(md, self), 'plain_text', 4)
+
+    def reset(self) -> None:
+        """Forget the previous document."""
+        self.result = None
@@ -0,0 +1,96 @@
+"""Plain text, word count, excerpt and outline from the Markdown element tree.
+
+:class:`~.extension.PlainTextExtension` hooks into the conversion that produces
+the HTML: once the element tree is complete it is walked a single time, so the
+body is never re-scanned with regexes or parsed again. Code (blocks and spans),
+raw HTML, images, footnotes and the ``toc`` permalinks are left out of the text.
+"""
+
+import re
+import xml.etree.ElementTree as etree
+from typing import Any, Iterator, List
+
+from expression.collections import Block
+
+from .models import Heading, PlainText
+
+_WORD_RE = re.compile(r'\w+')
+_WS_RE = re.compile(r'\s+')
+# Placeholders left by the HTML stash (code blocks, raw HTML).
+_PLACEHOLDER_RE = re.compile('\x02[^\x03]*\x03')
+_HEADINGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+_BLOCKS = frozenset({'p', 'div', 'li', 'ul', 'ol', 'blockquote', 'table', 'tr', 'td', 'th', 'dt', 'dd', 'hr', 'br'})
+_SKIPPED_TAGS = frozenset({'code', 'pre', 'script', 'style', 'img'})
+_SKIPPED_CLASSES = frozenset({'headerlink', 'footnote', 'footnote-ref', 'footnote-backref'})
+
+
+def excerpt(text: str, limit: int = 160) -> str:
+    """Cut ``text`` at a word boundary, adding an ellipsis if it was longer than ``limit``."""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0].rstrip() + '…'
+
+
+def _skipped(element: etree.Element) -> bool:
+    if element.tag in _SKIPPED_TAGS:
+        return True
+    classes = element.get('class')
+    return classes is not None and not _SKIPPED_CLASSES.isdisjoint(classes.split())
+
+
+class _Collector:
+    """Text pieces in document order; block boundaries add a space, inline elements are joined as they are."""
+
+    def __init__(self, excerpt_limit: int):
+        self.pieces: List[str] = []
+        self.lead: List[str] = []  # the first paragraphs, for the excerpt
+        self.lead_budget = excerpt_limit * 2
+
+    def add(self, piece: str, heading: bool) -> None:
+        self.pieces.append(piece)
+        if not heading and self.lead_budget > 0:
+            self.lead.append(piece)
+            self.lead_budget -= len(piece)
+
+    def walk(self, element: etree.Element, heading: bool = False) -> None:
+        if element.text:
+            self.add(element.text, heading)
+        for child in element:
+            boundary = child.tag in _BLOCKS or child.tag in _HEADINGS
+            if boundary:
+                self.add(' ', heading)
+            if not _skipped(child):
+                self.walk(child, heading or child.tag in _HEADINGS)
+            if boundary:
+                self.add(' ', heading)
+            if child.tail:
+                self.add(child.tail, heading)
+
+
+def _outline(tokens: List[dict[str, Any]]) -> Iterator[Heading]:
+    for token in tokens:
+        yield Heading(level=token['level'], id=token['id'], title=token['name'])
+        yield from _outline(token['children'])
+
+
+def extract_plain_text(root: etree.Element, toc_tokens: List[dict[str, Any]], excerpt_limit: int = 160) -> PlainText:
+    """Walk the element tree once.
+
+    Args:
+        root: The converted document.
+        toc_tokens: The heading tree built by the ``toc`` extension.
+        excerpt_limit: Excerpt length, in characters.
+
+    Returns:
+        The plain text, its word count, the excerpt and the heading outline.
+    """
+    collector = _Collector(excerpt_limit)
+    collector.walk(root)
+    text = _WS_RE.sub(' ', _PLACEHOLDER_RE.sub(' ', ''.join(collector.pieces))).strip()
+    lead = _WS_RE.sub(' ', _PLACEHOLDER_RE.sub(' ', ''.join(collector.lead))).strip()
+    return PlainText(
+        text=text,
+        word_count=sum(1 for _ in _WORD_RE.finditer(text)),
+        excerpt=excerpt(lead, excerpt_limit),
+        outline=Block.of_seq(_outline(toc_tokens)),
+    )
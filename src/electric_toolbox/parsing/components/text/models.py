@@ -0,0 +1,23 @@
+"""Models for the plain-text extraction."""
+
+from expression.collections import Block
+from pydantic import BaseModel, ConfigDict
+
+
+class Heading(BaseModel):
+    """One entry of a document outline."""
+
+    model_config = ConfigDict(frozen=True)
+    level: int
+    id: str  # the anchor set by the ``toc`` extension
+    title: str
+
+
+class PlainText(BaseModel):
+    """What the text of a document gives once its markup is stripped."""
+
+    model_config = ConfigDict(frozen=True)
+    text: str = ''  # headings and paragraphs, no code
+    word_count: int = 0
+    excerpt: str = ''  # leading paragraphs only (no headings)
+    outline: Block[Heading] = Block.empty()
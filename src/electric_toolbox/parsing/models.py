@@ -1,8 +1,12 @@
 """Website models."""
 
+from typing import Dict, Iterator
+
 from pydantic import BaseModel, ConfigDict
 
-from .sections.blog import Blog, ViewModelBlog
+from electric_toolbox.configs import WebsiteInfo
+
+from .sections.blog import Blog, ViewModelBlog, ViewModelBlogPost
 from .sections.home import HomePage, ViewModelHomePage
 
 
@@ -10,13 +14,22 @@ class Website(BaseModel):
     """Home page data."""
 
     model_config = ConfigDict(frozen=True)
-    homepage: HomePage
-    blog: Blog
+    base_url: str
+    website_info: WebsiteInfo
+    pages: Dict[str, HomePage]  # singular sections, by name
+    collections: Dict[str, Blog]  # plural sections, by name
 
 
 class ViewModelWebsite(BaseModel):
     """Website view model."""
 
     model_config = ConfigDict(frozen=True)
-    homepage: ViewModelHomePage
-    blog: ViewModelBlog
+    base_url: str
+    website_info: WebsiteInfo
+    pages: Dict[str, ViewModelHomePage]
+    collections: Dict[str, ViewModelBlog]
+
+    def posts(self) -> Iterator[ViewModelBlogPost]:
+        """The posts of every collection."""
+        for collection in self.collections.values():
+            yield from collection.posts
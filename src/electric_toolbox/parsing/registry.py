@@ -0,0 +1,110 @@
+"""Section registry: which reader builds each kind of section.
+
+The site used to hard-wire two sections, ``read_blog('blog')`` and
+``read_homepage('home')``. A section is now read according to its
+``read_from.type``, so any number of sections of either kind can be declared in
+``compile.config.toml``:
+
+* ``singular`` sections are standalone pages (the homepage is the one at
+  ``url = "index"``);
+* ``plural`` sections are collections of posts (a blog, reading notes, ...).
+
+Collections are independent of each other, and reading one (markdown to HTML
+for every post) is where the parsing time goes, so when there are several they
+are read in parallel processes; the parsed models are plain pydantic objects and
+travel back pickled.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from expression import Error, Ok, Result
+
+from electric_toolbox.configs import SiteConfigs
+
+from .sections import read_blog, read_homepage
+from .sections.blog import Blog
+from .sections.home import HomePage, home_breadcrumbs
+
+
+class SectionType(NamedTuple):
+    """How a kind of section is read."""
+
+    collection: bool  # many posts (read in parallel) rather than a single page
+    read: Callable[[str, SiteConfigs], Result[Any, Exception]]  # (section name, configs)
+
+
+def _read_page(name: str, configs: SiteConfigs) -> Result[HomePage, Exception]:
+    return read_homepage(
+        sections=configs.sections,
+        website_info=configs.website,
+        home_crumb=home_breadcrumbs(),
+        base_url=configs.base_url,
+        section=name,
+    )
+
+
+def _read_collection(name: str, configs: SiteConfigs) -> Result[Blog, Exception]:
+    return read_blog(
+        sections=configs.sections,
+        website_info=configs.website,
+        base_url=configs.base_url,
+        section=name,
+    )
+
+
+# Keyed by ``read_from.type``.
+SECTION_TYPES: Dict[str, SectionType] = {
+    'singular': SectionType(collection=False, read=_read_page),
+    'plural': SectionType(collection=True, read=_read_collection),
+}
+
+
+class Sections(NamedTuple):
+    """Every parsed section, by name, in configuration order."""
+
+    pages: Dict[str, HomePage]
+    collections: Dict[str, Blog]
+
+
+def _read_collections(
+    names: Tuple[str, ...],
+    configs: SiteConfigs,
+    workers: Optional[int],
+) -> Dict[str, Result[Blog, Exception]]:
+    if workers == 1 or len(names) <= 1:
+        return {name: _read_collection(name, configs) for name in names}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(names, pool.map(_read_collection, names, [configs] * len(names))))
+
+
+def read_sections(configs: SiteConfigs, workers: Optional[int] = None) -> Result[Sections, Exception]:
+    """Read every configured section.
+
+    Args:
+        configs: Website configurations.
+        workers: Processes reading the collections. ``None`` uses every CPU;
+            ``1`` reads them in this process (a single collection always is).
+
+    Returns:
+        The parsed sections, or the first error in configuration order.
+    """
+    kinds: Dict[str, SectionType] = {}
+    for name, section in configs.sections.items():
+        kind = SECTION_TYPES.get(section.read_from.type)
+        if kind is None:
+            return Error(Exception(f'Unknown read_from type: {section.read_from.type} (section {name})'))
+        kinds[name] = kind
+
+    collections = _read_collections(tuple(name for name, kind in kinds.items() if kind.collection), configs, workers)
+    pages: Dict[str, HomePage] = {}
+    blogs: Dict[str, Blog] = {}
+    for name, kind in kinds.items():
+        match collections[name] if kind.collection else kind.read(name, configs):
+            case Result(tag='ok', ok=Blog() as blog):
+                blogs[name] = blog
+            case Result(tag='ok', ok=HomePage() as page):
+                pages[name] = page
+            case Result(error=error):
+                return Error(error)
+    return Ok(Sections(pages=pages, collections=blogs))
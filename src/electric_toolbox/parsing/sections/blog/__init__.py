@@ -1,9 +1,16 @@
 """Parsing for blog section."""
 
-from .article_functions import read_post
-from .blog_functions import read_blog
+from .article_functions import read_post, use_conversion_cache, validate_posts
+from .blog_functions import iter_blog_posts, read_blog, validate_blog
 from .models import Blog, BlogPost, ViewModelBlog, ViewModelBlogPost, ViewModelTag
-from .view import create_blog_to_view_model, create_blogpost_view_model
+from .view import (
+    create_blog_to_view_model,
+    create_blogpost_view_model,
+    related_link,
+    related_links,
+    related_terms,
+    summarise_blogpost_view_model,
+)
 
 __all__ = [
     'Blog',
@@ -13,6 +20,14 @@ __all__ = [
     'ViewModelTag',
     'create_blog_to_view_model',
     'create_blogpost_view_model',
+    'iter_blog_posts',
     'read_blog',
     'read_post',
+    'related_link',
+    'related_links',
+    'related_terms',
+    'summarise_blogpost_view_model',
+    'use_conversion_cache',
+    'validate_blog',
+    'validate_posts',
 ]
@@ -1,31 +1,34 @@
 """Functions for parsing blog posts."""
 
-import re
-from datetime import datetime, timedelta
-from typing import Any, Generator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, List, Optional, Sequence, Tuple
 
-import frontmatter  # type: ignore
-from expression import Error, Nothing, Ok, Option, Result, Some, effect
-from markdown import Markdown
+from expression import Option, Result, effect
 from pydantic import HttpUrl
-from pymdownx.highlight import HighlightExtension  # type: ignore
-from pymdownx.superfences import SuperFencesCodeExtension  # type: ignore
-from slugify import slugify
 
-from electric_toolbox.configs import FileData, WebsiteInfo
+from electric_toolbox.configs import FileData, WebsiteInfo, create_file_data
 from electric_toolbox.constants import ExistingTemplates
 from electric_toolbox.exceptions import ParsingError
-from electric_toolbox.parsing.common import TargetFiles, Template, isoformat_with_tz
+from electric_toolbox.parsing.common import TargetFiles, Template, page_targets, slug
 from electric_toolbox.parsing.components.breadcrumbs import Breadcrumbs, get_push_url, to_json_ld
-from electric_toolbox.parsing.components.opengraph import (
-    OpenGraph,
-    OpenGraphArticle,
-    create_opengraph_article,
-    create_opengraph_typed_article,
-)
+from electric_toolbox.parsing.components.images import optimise_images
+from electric_toolbox.parsing.components.opengraph import OpenGraph, OpenGraphArticle
 from electric_toolbox.parsing.components.seo import HeadMeta, blogposting_json_ld, build_head_meta
+from electric_toolbox.parsing.components.text import (
+    CHUNKED_THRESHOLD,
+    ConversionCache,
+    PlainText,
+    conversion_fingerprint,
+    split_markdown,
+    stitch_chunks,
+)
 
 from .models import BlogPost
+from .schema import frontmatter_errors, parse_frontmatter, post_article_opengraph, post_opengraph, post_thumbnail
+
+if TYPE_CHECKING:
+    import frontmatter  # type: ignore
 
 MarkdownMetadata = dict[str, Any]
 ONE_HOUR = 60
@@ -41,20 +44,31 @@ def _to_slug(file_name: str) -> str:
         Slug: A URL-friendly slug.
     """
     name_without_extension = file_name.split('.', maxsplit=1)[0]
-    return slugify(name_without_extension)
+    return slug(name_without_extension)
+
+
+def _load_frontmatter(contents: str) -> 'frontmatter.Post':
+    """Split a post into metadata and body (python-frontmatter and PyYAML are imported on first use)."""
+    import frontmatter  # noqa: PLC0415
+
+    return frontmatter.loads(contents)
 
 
-def _estimate_reading_time(text: str, WPM: int = 200) -> str:
+def preload_frontmatter() -> None:
+    """Import the frontmatter parser now, e.g. once before forking workers rather than in each of them."""
+    _load_frontmatter('')
+
+
+def _estimate_reading_time(total_words: int, WPM: int = 200) -> str:
     """Estimate the reading time of a text.
 
     Args:
-        text: The text to estimate the reading time of.
+        total_words: The number of words of the text.
         WPM: The words per minute to use.
 
     Returns:
         The estimated reading time.
     """
-    total_words = len(re.findall(r'\w+', text))
     time_minute = total_words // WPM + 1
     if time_minute == 0:
         time_minute = 1
@@ -63,97 +77,108 @@ def _estimate_reading_time(text: str, WPM: int = 200) -> str:
     return str(time_minute) + ' min'
 
 
-def _parse_title(data: MarkdownMetadata) -> Result[str, ParsingError]:
-    """Parses the title from the post's metadata.
-
-    Args:
-        data: The metadata dictionary.
-
-    Returns:
-        Result[str, Exception]: Ok(str) containing the title if present,
-            Error(Exception) if the title is missing.
-    """
-    title = data.get('title')
-    if title is not None:
-        return Ok(title)
-    return Error(
-        ParsingError(
-            message='Title is missing',
-            cause=ValueError(),
-            context={
-                'function': 'electric_toolbox.parsing.sections.blog.article_functions._parse_title',
-            },
-        )
-    )
-
+# The conversion settings; with the library versions, they key the conversion cache.
+_MARKDOWN_EXTENSIONS = ('attr_list', 'tables', 'footnotes', 'md_in_html', 'toc')
+_EXTENSION_CONFIGS = {'toc': {'permalink': True, 'permalink_title': 'Link to this section'}}
+_HIGHLIGHT_CONFIG = {'css_class': 'code-block', 'guess_lang': False, 'use_pygments': True}
+_SUPERFENCES_CONFIG = {'css_class': 'code-block'}
+_MARKDOWN_PACKAGES = ('markdown', 'pymdown-extensions', 'pygments')
 
-def _parse_date(data: MarkdownMetadata, add_time: timedelta = timedelta(days=0)) -> Result[str, Exception]:
-    """Parses the publish date from the post's metadata.
+_conversion_cache: Optional[ConversionCache] = None
 
-    Args:
-        data: The metadata dictionary.
-        add_time: The time to add to the publish date.
-
-    Returns:
-        Result[Option[datetime], Exception]: Ok(Option[datetime]) containing the publish date if present and valid,
-            Error(Exception) if the publish date is invalid.
-    """
-    date_obj = data.get('publication_time')
-    match date_obj:
-        case datetime():
-            return Ok(isoformat_with_tz(date_obj + add_time))
-        case _:
-            return Error(Exception('Frontmatter `publication_time` must be an ISO8601 datetime string'))
 
+def use_conversion_cache(directory: Optional[Path]) -> Optional[ConversionCache]:
+    """Look the conversions up in (and add them to) a cache under ``directory`` from now on.
 
-def _parse_thumbnail(data: MarkdownMetadata) -> Result[Option[str], Exception]:
-    """Parses the thumbnail from the post's metadata.
+    Worker processes forked afterwards inherit the setting.
 
     Args:
-        data: The metadata dictionary.
+        directory: The cache directory; ``None`` turns the cache off.
 
     Returns:
-        Option[str]: The thumbnail URL if present, None otherwise.
+        The cache in use, if any.
     """
-    match data.get('thumbnail', Nothing):
-        case str(thumbnail):
-            return Ok(Some(thumbnail))
-        case Option(tag='none'):
-            return Ok(Nothing)
-        case _:
-            return Error(Exception('Frontmatter `thumbnail` must be a string or "none"'))
+    global _conversion_cache
+    settings = [_MARKDOWN_EXTENSIONS, _EXTENSION_CONFIGS, _HIGHLIGHT_CONFIG, _SUPERFENCES_CONFIG]
+    fingerprint = conversion_fingerprint(settings, _MARKDOWN_PACKAGES) if directory is not None else ''
+    _conversion_cache = ConversionCache(directory, fingerprint) if directory is not None else None
+    return _conversion_cache
 
 
-def _md_to_html(contents: str) -> str:
+def _convert_markdown(contents: str) -> Tuple[str, PlainText]:
     """Converts Markdown content to HTML using the `markdown` library.
 
     Uses the pymdownx ``highlight`` + ``superfences`` pair (the supported
     combination) for Pygments syntax highlighting instead of mixing
     ``codehilite`` with ``superfences``, which fight over fenced blocks.
     Headings get stable slug ids (``toc``) so they can be deep-linked, and
-    tables / footnotes / inline HTML are enabled for richer posts.
+    tables / footnotes / inline HTML are enabled for richer posts. The plain
+    text (excerpt, word count, outline) is taken from the same element tree.
 
     Args:
         contents: The Markdown content.
 
     Returns:
-        str: The HTML representation of the Markdown content.
+        Tuple[str, PlainText]: The HTML representation of the Markdown content
+            and its plain text.
     """
+    # Imported here: markdown, pymdownx and Pygments take ~70 ms to import and
+    # only a conversion needs them (not config checks or validation).
+    from markdown import Markdown  # noqa: PLC0415
+    from pymdownx.highlight import HighlightExtension  # type: ignore # noqa: PLC0415
+    from pymdownx.superfences import SuperFencesCodeExtension  # type: ignore # noqa: PLC0415
+
+    from electric_toolbox.parsing.components.text.extension import PlainTextExtension  # noqa: PLC0415
+
+    plain_text = PlainTextExtension()
     md = Markdown(
         extensions=[
-            'attr_list',
-            'tables',
-            'footnotes',
-            'md_in_html',
-            'toc',
-            HighlightExtension(css_class='code-block', guess_lang=False, use_pygments=True),
-            SuperFencesCodeExtension(css_class='code-block'),
+            *_MARKDOWN_EXTENSIONS,
+            HighlightExtension(**_HIGHLIGHT_CONFIG),
+            SuperFencesCodeExtension(**_SUPERFENCES_CONFIG),
+            plain_text,
         ],
-        extension_configs={
-            'toc': {'permalink': True, 'permalink_title': 'Link to this section'},
-        },
+        extension_configs=_EXTENSION_CONFIGS,
     )
-    return md.convert(contents)
+    html = md.convert(contents)
+    return html, plain_text.result or PlainText()
+
+
+def _md_to_html(contents: str, workers: Optional[int] = None) -> Tuple[str, PlainText]:
+    """Converts Markdown content to HTML (see :func:`_convert_markdown`).
+
+    The conversion cache (:func:`use_conversion_cache`) is consulted first. A
+    document longer than ``CHUNKED_THRESHOLD`` characters is split at safe
+    block boundaries and its parts are converted in parallel processes, then
+    stitched back (unique heading ids, one footnote list).
+
+    Args:
+        contents: The Markdown content.
+        workers: Processes converting the parts of a large document. ``None``
+            uses every CPU; ``1`` converts them in this process.
+
+    Returns:
+        Tuple[str, PlainText]: The HTML representation of the Markdown content
+            and its plain text.
+    """
+    cache = _conversion_cache
+    cached = cache.get(contents) if cache is not None else None
+    if cached is not None:
+        return cached
+    html, plain_text = _convert_document(contents, workers)
+    if cache is not None:
+        cache.put(contents, html, plain_text)
+    return html, plain_text
+
+
+def _convert_document(contents: str, workers: Optional[int]) -> Tuple[str, PlainText]:
+    parts = split_markdown(contents) if len(contents) >= CHUNKED_THRESHOLD else [contents]
+    if len(parts) == 1:
+        return _convert_markdown(contents)
+    if workers == 1:
+        return stitch_chunks(list(map(_convert_markdown, parts)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return stitch_chunks(list(pool.map(_convert_markdown, parts)))
 
 
 def _option_to_optional(value: Option[str]) -> str | None:
@@ -165,29 +190,6 @@ def _option_to_optional(value: Option[str]) -> str | None:
             return None
 
 
-_HEADING_RE = re.compile(r'^#{1,6}.*$', re.MULTILINE)
-_FENCE_RE = re.compile(r'```.*?```', re.DOTALL)
-_INLINE_CODE_RE = re.compile(r'`[^`]*`')
-_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
-_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
-_MD_SYMBOLS_RE = re.compile(r'[*_>~]')
-_WS_RE = re.compile(r'\s+')
-
-
-def _excerpt(markdown: str, limit: int = 160) -> str:
-    """Derive a plain-text summary from markdown for the meta description fallback."""
-    text = _FENCE_RE.sub(' ', markdown)
-    text = _HEADING_RE.sub(' ', text)
-    text = _IMAGE_RE.sub(' ', text)
-    text = _LINK_RE.sub(r'\1', text)
-    text = _INLINE_CODE_RE.sub(' ', text)
-    text = _MD_SYMBOLS_RE.sub('', text)
-    text = _WS_RE.sub(' ', text).strip()
-    if len(text) <= limit:
-        return text
-    return text[:limit].rsplit(' ', 1)[0].rstrip() + '…'
-
-
 def _build_post_seo(  # noqa: PLR0913
     title: str,
     url: str,
@@ -256,7 +258,8 @@ def read_post(
 ) -> Generator[Any, Any, BlogPost]:
     """Reads a post from a `FileData` object.
 
-    Parses the front matter and converts the Markdown content to HTML.
+    Parses the front matter and converts the Markdown content to HTML, then
+    adds the loading hints and sizes of its images.
 
     Args:
         file: The `FileData` object containing the post file.
@@ -274,8 +277,9 @@ def read_post(
             extension='html',
         ),
     )
-    md_file_decomposed: frontmatter.Post = frontmatter.loads(file.contents)
-    title = yield from _parse_title(md_file_decomposed.metadata)
+    md_file_decomposed: frontmatter.Post = _load_frontmatter(file.contents)
+    metadata = yield from parse_frontmatter(md_file_decomposed.metadata)
+    title = metadata.title
     breadcrumbs = _create_breadcrumbs(
         file_name=file.file_name,
         title=title,
@@ -284,27 +288,32 @@ def read_post(
     )
     url = get_push_url(breadcrumbs, base_url=base_url)
     resource_path = get_push_url(breadcrumbs, base_url='')
-    opengraph = yield from create_opengraph_typed_article(data=md_file_decomposed, url=url)
-    article_opengraph = yield from create_opengraph_article(data=md_file_decomposed)
+    opengraph = post_opengraph(metadata, url=url)
+    article_opengraph = post_article_opengraph(metadata)
+    html, plain_text = _md_to_html(md_file_decomposed.content)
+    # After the (cached) conversion: the image sizes come from the image files.
+    html = optimise_images(html, file.path.parent)
     # Always have a description: frontmatter `description` if present, otherwise
     # a plain-text excerpt of the content (so every page has a meta description).
-    description = _option_to_optional(opengraph.description) or _excerpt(md_file_decomposed.content)
+    description = _option_to_optional(opengraph.description) or plain_text.excerpt
     return BlogPost(
         title=title,
-        date=(yield from _parse_date(md_file_decomposed.metadata)),
-        thumbnail=(yield from _parse_thumbnail(md_file_decomposed.metadata)),
-        contents=_md_to_html(md_file_decomposed.content),
+        date=article_opengraph.publication_time,
+        thumbnail=post_thumbnail(metadata),
+        contents=html,
         base_url=HttpUrl(base_url),
         resource_path=resource_path,
         url=url,
-        targets=TargetFiles(
-            complete=Template(
-                destination=get_push_url(crumb=breadcrumbs, base_url=''),
-                template=breadcrumbs.targets.complete.template,
-                extension=breadcrumbs.targets.complete.extension,
-            ),
+        targets=page_targets(
+            destination=get_push_url(crumb=breadcrumbs, base_url=''),
+            template=breadcrumbs.targets.complete.template,
+            extension=breadcrumbs.targets.complete.extension,
         ),
-        reading_time=_estimate_reading_time(md_file_decomposed.content),
+        reading_time=_estimate_reading_time(plain_text.word_count),
+        text=plain_text.text,
+        markdown=md_file_decomposed.content,
+        word_count=plain_text.word_count,
+        outline=plain_text.outline,
         breadcrumbs=breadcrumbs,
         opengraph=opengraph,
         article_opengraph=article_opengraph,
@@ -320,3 +329,46 @@ def read_post(
             base_url=base_url,
         ),
     )
+
+
+def _with_file(error: Exception, path: Path) -> ParsingError:
+    """The error as a ParsingError naming the post file."""
+    match error:
+        case ParsingError():
+            return ParsingError(message=error.message, cause=error.cause, context={**error.context, 'file': str(path)})
+        case _:
+            return ParsingError(message=str(error) or type(error).__name__, cause=error, context={'file': str(path)})
+
+
+def validate_posts(paths: Sequence[Path]) -> List[List[ParsingError]]:
+    """Every frontmatter problem of some posts, without converting their bodies.
+
+    Unlike :func:`read_post`, which stops at the first error, each part of the
+    frontmatter (title, date, thumbnail, Open Graph page and article data) is
+    checked independently and all the failures are returned. The frontmatter
+    of all the posts is validated in one call (see :func:`frontmatter_errors`).
+
+    Args:
+        paths: The post files.
+
+    Returns:
+        The errors of each post, each with the post file in its context. Empty if valid.
+    """
+    results: List[List[ParsingError]] = []
+    batch: List[Tuple[int, MarkdownMetadata]] = []
+    for path in paths:
+        results.append([])
+        match create_file_data(path):
+            case Result(tag='ok', ok=file):
+                pass
+            case Result(error=error):
+                results[-1].append(_with_file(error, path))
+                continue
+        try:
+            batch.append((len(results) - 1, _load_frontmatter(file.contents).metadata))
+        except Exception as error:
+            results[-1].append(_with_file(ParsingError(message='Invalid frontmatter', cause=error), path))
+
+    for (index, _), errors in zip(batch, frontmatter_errors([metadata for _, metadata in batch])):
+        results[index] = [_with_file(error, paths[index]) for error in errors]
+    return results
@@ -1,20 +1,22 @@
 """Functions for parsing blog section."""
 
-from typing import Any, Dict, Generator, Literal
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 
 from expression import Error, Result, Some, effect
 from expression.collections import Block
 from expression.extra.result.traversable import traverse
 
-from electric_toolbox.configs import FileData, ReadFromPlural, Section, WebsiteInfo
+from electric_toolbox.configs import FileData, ReadFromPlural, Section, WebsiteInfo, create_file_data
 from electric_toolbox.constants import ExistingTemplates
-from electric_toolbox.parsing.common import TargetFiles, Template
+from electric_toolbox.exceptions import ParsingError
+from electric_toolbox.parsing.common import TargetFiles, Template, page_targets
 from electric_toolbox.parsing.components.breadcrumbs import Breadcrumbs, get_push_url, to_json_ld
 from electric_toolbox.parsing.components.navigation import NavigationMenu, create_navigation_menu
 from electric_toolbox.parsing.components.opengraph import create_opengraph_typed_website
 from electric_toolbox.parsing.components.seo import build_head_meta, website_json_ld
 
-from .article_functions import read_post
+from .article_functions import preload_frontmatter, read_post, validate_posts
 from .models import Blog, BlogPost
 
 
@@ -50,12 +52,10 @@ def _read_blog(
         base_url=base_url,
         resource_path=section.resource_path,
         breadcrumbs=breadcrumbs,
-        targets=TargetFiles(
-            complete=Template(
-                destination=get_push_url(crumb=breadcrumbs, base_url=''),
-                template=breadcrumbs.targets.complete.template,
-                extension=breadcrumbs.targets.complete.extension,
-            ),
+        targets=page_targets(
+            destination=get_push_url(crumb=breadcrumbs, base_url=''),
+            template=breadcrumbs.targets.complete.template,
+            extension=breadcrumbs.targets.complete.extension,
         ),
         posts=(yield from traverse(_curried_read_post, files)),
         navigation=navigation_menu,
@@ -80,14 +80,101 @@ def _read_blog(
                 to_json_ld(breadcrumbs, base_url=base_url),
             ],
         ),
+        prefetch=section.prefetch,
     )
 
 
+def _blog_breadcrumbs(section_data: Section) -> Breadcrumbs:
+    """The blog index crumb, parent of every post."""
+    return Breadcrumbs(
+        path=section_data.resource_path,
+        title=section_data.title,
+        targets=TargetFiles(
+            complete=Template(
+                destination=section_data.resource_path,
+                template=ExistingTemplates.BLOG_INDEX,
+                extension='html',
+            ),
+        ),
+    )
+
+
+def iter_blog_posts(
+    sections: Dict[str, Section],
+    website_info: WebsiteInfo,
+    base_url: str = '',
+    section: str = 'blog',
+) -> Iterator[Result[BlogPost, Exception]]:
+    """Read the posts one at a time, loading each file only when it is reached.
+
+    Used by the streaming build, so at most one post body is held in memory
+    (the section may have been configured without loading the file contents).
+
+    Args:
+        sections: The sections.
+        website_info: Site-wide identity used to build the structured data.
+        base_url: The base URL.
+        section: The section name.
+
+    Yields:
+        Each parsed post (or its error), in file order.
+    """
+    section_data = sections[section]
+    match section_data.read_from:
+        case ReadFromPlural(files=files):
+            breadcrumbs = _blog_breadcrumbs(section_data)
+            for file in files:
+                yield create_file_data(file.path).bind(
+                    lambda data: read_post(data, Some(breadcrumbs), website_info, base_url)
+                )
+        case _:
+            yield Error(Exception(f'Unknown read_from type: {section_data.read_from}'))
+
+
+def validate_blog(
+    sections: Dict[str, Section],
+    section: str = 'blog',
+    workers: Optional[int] = None,
+) -> Tuple[int, List[ParsingError]]:
+    """Check the frontmatter of every post, collecting all the errors.
+
+    Nothing is converted or rendered. The posts are checked in batches, in
+    parallel processes (each one reads its own files).
+
+    Args:
+        sections: The sections.
+        section: The section name.
+        workers: Processes to use. ``None`` uses every CPU; ``1`` checks the
+            posts in this process.
+
+    Returns:
+        The number of posts checked and every error found, in file order.
+    """
+    section_data = sections[section]
+    match section_data.read_from:
+        case ReadFromPlural(files=files):
+            paths = [file.path for file in files]
+        case _:
+            return 0, [ParsingError(message=f'Unknown read_from type: {section_data.read_from}', cause=ValueError())]
+
+    if workers == 1:
+        results = validate_posts(paths)
+    else:
+        # One batch per task: each worker validates its posts' frontmatter in a single call.
+        size = max(1, len(paths) // 64)
+        batches = [paths[start : start + size] for start in range(0, len(paths), size)]
+        preload_frontmatter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [errors for batch in pool.map(validate_posts, batches) for errors in batch]
+    return len(paths), [error for errors in results for error in errors]
+
+
 def read_blog(
     sections: Dict[str, Section],
     website_info: WebsiteInfo,
     base_url: str = '',
-    section: Literal['blog'] = 'blog',
+    section: str = 'blog',
+    with_posts: bool = True,
 ) -> Result[Blog, Exception]:
     """Read blog section.
 
@@ -96,23 +183,14 @@ def read_blog(
         website_info: Site-wide identity used to build the structured data.
         base_url: The base URL.
         section: The section name.
+        with_posts: Read the posts too. Without them, the blog only carries the
+            index metadata (see :func:`iter_blog_posts`).
 
     Returns:
         The parsed blog.
     """
     section_data = sections[section]
-    targets = TargetFiles(
-        complete=Template(
-            destination=section_data.resource_path,
-            template=ExistingTemplates.BLOG_INDEX,
-            extension='html',
-        ),
-    )
-    breadcrumbs = Breadcrumbs(
-        path=section_data.resource_path,
-        title=section_data.title,
-        targets=targets,
-    )
+    breadcrumbs = _blog_breadcrumbs(section_data)
 
     match section_data.read_from:
         case ReadFromPlural():
@@ -120,7 +198,7 @@ def read_blog(
                 section=section_data,
                 breadcrumbs=breadcrumbs,
                 website_info=website_info,
-                files=section_data.read_from.files,
+                files=section_data.read_from.files if with_posts else Block.empty(),
                 base_url=base_url,
                 navigation_menu=create_navigation_menu(
                     sections=sections,
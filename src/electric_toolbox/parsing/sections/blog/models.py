@@ -4,11 +4,14 @@ from expression import Nothing, Option
 from expression.collections import Block
 from pydantic import BaseModel, ConfigDict, HttpUrl
 
+from electric_toolbox.configs import DEFAULT_PREFETCH
 from electric_toolbox.parsing.common import TargetFiles
 from electric_toolbox.parsing.components.breadcrumbs import Breadcrumbs, ViewModelBreadcrumb
 from electric_toolbox.parsing.components.navigation import NavigationMenu, ViewModelNavigationMenu
 from electric_toolbox.parsing.components.opengraph import OpenGraph, OpenGraphArticle, ViewModelOpenGraph
+from electric_toolbox.parsing.components.related import RelatedPost
 from electric_toolbox.parsing.components.seo import HeadMeta
+from electric_toolbox.parsing.components.text import Heading
 
 
 class BlogPost(BaseModel):
@@ -29,6 +32,10 @@ class BlogPost(BaseModel):
     article_opengraph: OpenGraphArticle
     summary: Option[str] = Nothing
     seo: HeadMeta = HeadMeta()
+    text: str = ''  # plain text, for indexing and related posts
+    markdown: str = ''  # the Markdown body, for the Markdown version of the page
+    word_count: int = 0
+    outline: Block[Heading] = Block.empty()
 
 
 class ViewModelTag(BaseModel):
@@ -59,8 +66,11 @@ class ViewModelBlogPost(BaseModel):
     summary: Option[str] = Nothing
     seo: HeadMeta = HeadMeta()
     byline: str = ''
+    modified_time: str = ''  # iso8601, sitemap <lastmod> / feed <updated>
     tags: Block[str] = Block.empty()  # display names
     tag_slugs: Block[str] = Block.empty()  # slugs, for the client-side ?tag= filter
+    related: Block[RelatedPost] = Block.empty()  # most similar posts first
+    markdown: str = ''  # the Markdown body, as written (no frontmatter)
 
 
 class Blog(BaseModel):
@@ -75,6 +85,7 @@ class Blog(BaseModel):
     navigation: NavigationMenu
     opengraph: OpenGraph
     seo: HeadMeta = HeadMeta()
+    prefetch: int = DEFAULT_PREFETCH
 
 
 class ViewModelBlog(BaseModel):
@@ -92,3 +103,4 @@ class ViewModelBlog(BaseModel):
     tags: Block[ViewModelTag] = Block.empty()
     # Href for the "All posts" reset control in the tag filter bar.
     all_href: str = ''
+    prefetch: int = DEFAULT_PREFETCH  # likely next pages each blog page prefetches
@@ -0,0 +1,185 @@
+"""The frontmatter of a post, as one declarative schema.
+
+Every key a post reads from its frontmatter is declared once, on
+:class:`PostFrontmatter`. Its validator is compiled when this module is
+imported, and a whole batch of posts is checked with a single call
+(:func:`frontmatter_errors`) instead of a dozen ``Result`` functions per post,
+several of which looked up the same keys.
+
+A post gets one error per failing key, in the order the keys are declared.
+"""
+
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Dict, List, Optional, Sequence
+
+from expression import Error, Nothing, Ok, Option, Result, Some
+from expression.collections import Block
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    HttpUrl,
+    Strict,
+    StrictStr,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from electric_toolbox.exceptions import ParsingError
+from electric_toolbox.parsing.common import isoformat_with_tz
+from electric_toolbox.parsing.components.opengraph import Author, OpenGraph, OpenGraphArticle
+from electric_toolbox.parsing.components.opengraph.article_functions import default_author
+
+MarkdownMetadata = dict[str, Any]
+EXPIRATION = timedelta(days=731)
+
+
+def _image_source(image: Any) -> str:
+    """An ``image`` is a URL, or a mapping with its URL under ``src``."""
+    match image:
+        case str() if image:
+            return image
+        case dict() if image:
+            return str(image.get('src', ''))
+        case _:
+            raise ValueError('Image not found')
+
+
+def _section_name(section: Any) -> str:
+    if not section:
+        raise ValueError(f'Invalid content type: {section}')
+    return str(section)
+
+
+class PostFrontmatter(BaseModel):
+    """The frontmatter keys of a post (any other key is ignored)."""
+
+    model_config = ConfigDict(frozen=True)
+    title: StrictStr
+    publication_time: Annotated[datetime, Strict()]
+    modified_time: Optional[Annotated[datetime, Strict()]] = None  # defaults to publication_time
+    thumbnail: Optional[StrictStr] = None
+    image: Annotated[Any, AfterValidator(_image_source)]
+    language: StrictStr = 'en'
+    description: Optional[StrictStr] = None
+    authors: Optional[List[Author]] = None  # defaults to the site author
+    tags: Optional[List[StrictStr]] = None
+    section: Annotated[Any, AfterValidator(_section_name)]
+
+    @field_validator('thumbnail', 'modified_time', 'language', 'description', mode='before')
+    @classmethod
+    def _not_null(cls, value: Any) -> Any:
+        """These keys may be left out, not set to null."""
+        if value is None:
+            raise ValueError('null')
+        return value
+
+    @field_validator('authors', mode='before')
+    @classmethod
+    def _default_authors(cls, value: Any) -> Any:
+        return value or None
+
+
+# Compiled once, at import.
+_BATCH = TypeAdapter(List[PostFrontmatter])
+
+_FIELD_MESSAGES: Dict[str, str] = {
+    'title': 'Title is missing',
+    'publication_time': 'Frontmatter `publication_time` must be an ISO8601 datetime string',
+    'modified_time': 'Frontmatter `modified_time` must be an ISO8601 datetime string',
+    'thumbnail': 'Frontmatter `thumbnail` must be a string or "none"',
+    'image': 'Image not found',
+    'language': 'Language must be a string',
+    'description': 'Description must be a string',
+    'authors': 'Author frontmatter incorrect.',
+    'tags': 'Tags must be a list of strings',
+    'section': 'Invalid content type: {section}',
+}
+_TITLE_TYPE = 'Title must be a string'
+
+
+def _failures(error: ValidationError) -> Dict[int, Dict[str, str]]:
+    """Post index -> failing key -> pydantic's description of its first problem."""
+    failures: Dict[int, Dict[str, str]] = {}
+    for details in error.errors(include_url=False, include_context=False):
+        index, key = details['loc'][:2]
+        failures.setdefault(int(index), {}).setdefault(str(key), details['msg'])
+    return failures
+
+
+def _report(metadata: MarkdownMetadata, failing: Dict[str, str]) -> List[ParsingError]:
+    """One error per failing key, in the order of :class:`PostFrontmatter`."""
+    errors = []
+    for key in PostFrontmatter.model_fields:
+        if key not in failing:
+            continue
+        message = _FIELD_MESSAGES[key]
+        if key == 'title' and metadata.get('title') is not None:
+            message = _TITLE_TYPE
+        errors.append(
+            ParsingError(
+                message=message.format(section=metadata.get('section', False)),
+                cause=ValueError(failing[key]),
+                context={'field': key},
+            )
+        )
+    return errors
+
+
+def frontmatter_errors(batch: Sequence[MarkdownMetadata]) -> List[List[ParsingError]]:
+    """Check the frontmatter of many posts in one validation call.
+
+    Args:
+        batch: The metadata of every post.
+
+    Returns:
+        The errors of each post (in the order of ``batch``); empty when valid.
+    """
+    try:
+        _BATCH.validate_python(batch)
+    except ValidationError as error:
+        failures = _failures(error)
+    else:
+        failures = {}
+    return [_report(metadata, failures.get(index, {})) for index, metadata in enumerate(batch)]
+
+
+def parse_frontmatter(metadata: MarkdownMetadata) -> Result[PostFrontmatter, ParsingError]:
+    """The frontmatter of a post, or the error of its first failing key."""
+    try:
+        return Ok(_BATCH.validate_python([metadata])[0])
+    except ValidationError as error:
+        return Error(_report(metadata, _failures(error)[0])[0])
+
+
+def post_opengraph(frontmatter: PostFrontmatter, url: str) -> OpenGraph:
+    """The Open Graph data of the post page."""
+    return OpenGraph(
+        title=frontmatter.title,
+        ogtype='article',
+        image=frontmatter.image,
+        locale=frontmatter.language,
+        description=Nothing if frontmatter.description is None else Some(frontmatter.description),
+        url=HttpUrl(url),
+    )
+
+
+def post_article_opengraph(frontmatter: PostFrontmatter) -> OpenGraphArticle:
+    """The Open Graph article data of the post."""
+    published = frontmatter.publication_time
+    return OpenGraphArticle(
+        publication_time=isoformat_with_tz(published),
+        modified_time=isoformat_with_tz(frontmatter.modified_time or published),
+        expiration_time=isoformat_with_tz(published + EXPIRATION),
+        authors=Block.of_seq(frontmatter.authors)
+        if frontmatter.authors
+        else default_author().default_value(Block.empty()),
+        tags=Block.of_seq(frontmatter.tags or []),
+        section=frontmatter.section,
+    )
+
+
+def post_thumbnail(frontmatter: PostFrontmatter) -> Option[str]:
+    """The thumbnail of the post, if any."""
+    return Nothing if frontmatter.thumbnail is None else Some(frontmatter.thumbnail)
@@ -1,8 +1,10 @@
 """Views for the blog."""
 
+from typing import Dict, Iterable, List, Optional, Sequence
+
 from expression.collections import Block
-from slugify import slugify
 
+from electric_toolbox.parsing.common import slug
 from electric_toolbox.parsing.components.breadcrumbs import create_breadcrumbs_view_model
 from electric_toolbox.parsing.components.navigation import create_navigation_view_model
 from electric_toolbox.parsing.components.opengraph import (
@@ -10,16 +12,29 @@ from electric_toolbox.parsing.components.opengraph import (
     create_opengraph_article_view_model,
     create_opengraph_view_model,
 )
+from electric_toolbox.parsing.components.related import (
+    RelatedDocument,
+    RelatedPost,
+    document_terms,
+    related_from_terms,
+)
+from electric_toolbox.parsing.components.seo import HeadMeta
 
 from .models import Blog, BlogPost, ViewModelBlog, ViewModelBlogPost, ViewModelTag
 
+# How many related posts each article links to.
+RELATED_POSTS = 3
+# The index card falls back to ``contents | truncate(200)`` without a summary;
+# this much of the body is enough for that filter to give the same result.
+_CARD_CONTENTS = 256
+
 
 def _byline(post: BlogPost) -> str:
     """Comma-joined author names for the article header."""
     return ', '.join(f'{a.first_name} {a.last_name}'.strip() for a in post.article_opengraph.authors)
 
 
-def _collect_tags(blog: Blog) -> Block[ViewModelTag]:
+def _collect_tags(resource_path: str, posts: Iterable[ViewModelBlogPost]) -> Block[ViewModelTag]:
     """Builds the unique, ordered tag list used by the filter bar.
 
     Each tag is a plain ``/<resource>.html?tag=<slug>`` link. Filtering happens
@@ -28,8 +43,8 @@ def _collect_tags(blog: Blog) -> Block[ViewModelTag]:
     """
     counts: dict[str, int] = {}
     order: list[str] = []
-    for post in blog.posts:
-        for tag in post.article_opengraph.tags:
+    for post in posts:
+        for tag in post.tags:
             if tag not in counts:
                 counts[tag] = 0
                 order.append(tag)
@@ -37,14 +52,71 @@ def _collect_tags(blog: Blog) -> Block[ViewModelTag]:
     return Block.of_seq(
         ViewModelTag(
             name=tag,
-            slug=slugify(tag),
-            href=f'/{blog.resource_path}.html?tag={slugify(tag)}',
+            slug=slug(tag),
+            href=f'/{resource_path}.html?tag={slug(tag)}',
             count=counts[tag],
         )
         for tag in order
     )
 
 
+def related_terms(post: BlogPost) -> Dict[str, float]:
+    """What the related posts of ``post`` are computed from: its tags, title and text."""
+    return document_terms(RelatedDocument(tags=list(post.article_opengraph.tags), text=f'{post.title} {post.text}'))
+
+
+def related_links(
+    links: Sequence[RelatedPost],
+    terms: Sequence[Dict[str, float]],
+    k: int = RELATED_POSTS,
+) -> List[Block[RelatedPost]]:
+    """Top-``k`` related posts for every post.
+
+    Args:
+        links: Every post's link (the score is filled in).
+        terms: Every post's :func:`related_terms`, in the same order.
+        k: How many related posts each article links to.
+
+    Returns:
+        The related posts, in the same order as ``links``.
+    """
+    return [
+        Block.of_seq(links[j].model_copy(update={'score': score}) for j, score in similar)
+        for similar in related_from_terms(terms, k=k)
+    ]
+
+
+def related_link(title: str, href: str, date: str) -> RelatedPost:
+    """Link to a post, before it is scored against another one."""
+    return RelatedPost(title=title, href=href, date=date, score=0.0)
+
+
+def _related(blog: Blog) -> List[Block[RelatedPost]]:
+    """Related posts for every post of the blog, in order."""
+    posts = list(blog.posts)
+    return related_links(
+        [related_link(post.title, post.resource_path, post.date) for post in posts],
+        [related_terms(post) for post in posts],
+    )
+
+
+def summarise_blogpost_view_model(view: ViewModelBlogPost) -> ViewModelBlogPost:
+    """What the index, feed and sitemap need once the post page is written.
+
+    The body (beyond what the index card may show), the head metadata and the
+    related links are dropped, so a streaming build can keep one per post.
+    """
+    return view.model_copy(
+        update={
+            'contents': view.contents[:_CARD_CONTENTS] if view.summary.is_none() else '',
+            'opengraph': ViewModelOpenGraph(parts=Block.empty()),
+            'seo': HeadMeta(),
+            'related': Block.empty(),
+            'markdown': '',
+        }
+    )
+
+
 def _join_opengraph_views(
     opengraph_views: Block[ViewModelOpenGraph],
 ) -> ViewModelOpenGraph:
@@ -68,12 +140,13 @@ def _join_opengraph_views(
 
 def create_blogpost_view_model(
     post: BlogPost,
+    related: Block[RelatedPost] = Block.empty(),
 ) -> ViewModelBlogPost:
     """Prepares the view model for a blog post.
 
     Args:
         post: The blog post.
-        base_url: The base URL of the site.
+        related: The most similar posts, linked below the article.
 
     Returns:
         The view model for the blog post.
@@ -100,23 +173,31 @@ def create_blogpost_view_model(
         summary=post.summary,
         seo=post.seo,
         byline=_byline(post),
+        modified_time=post.article_opengraph.modified_time,
         tags=post.article_opengraph.tags,
-        tag_slugs=post.article_opengraph.tags.map(slugify),
+        tag_slugs=post.article_opengraph.tags.map(slug),
+        related=related,
+        markdown=post.markdown,
     )
 
 
 def create_blog_to_view_model(
     blog: Blog,
+    posts: Optional[Block[ViewModelBlogPost]] = None,
 ) -> ViewModelBlog:
     """Prepares the view model for the blog.
 
     Args:
         blog: The blog.
-        base_url: The base URL of the site.
+        posts: Post view models prepared by the caller (e.g. the summaries of a
+            streaming build). Defaults to the views of ``blog.posts``.
 
     Returns:
         The view model for the blog.
     """
+    post_views = (
+        posts if posts is not None else Block.of_seq(map(create_blogpost_view_model, blog.posts, _related(blog)))
+    )
     return ViewModelBlog(
         title=blog.title,
         base_url=blog.base_url,
@@ -127,9 +208,10 @@ def create_blog_to_view_model(
             base_url=str(blog.base_url),
         ),
         navigation=create_navigation_view_model(blog.navigation),
-        posts=blog.posts.map(create_blogpost_view_model),
+        posts=post_views,
         opengraph=create_opengraph_view_model(blog.opengraph),
         seo=blog.seo,
-        tags=_collect_tags(blog),
+        tags=_collect_tags(blog.resource_path, post_views),
         all_href=f'/{blog.resource_path}.html',
+        prefetch=blog.prefetch,
     )
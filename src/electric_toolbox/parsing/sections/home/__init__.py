@@ -1,12 +1,14 @@
 """Home section parsing."""
 
-from .functions import read_homepage
+from .functions import HOME_RESOURCE, home_breadcrumbs, read_homepage
 from .models import HomePage, ViewModelHomePage
 from .view import create_homepage_view_model
 
 __all__ = [
+    'HOME_RESOURCE',
     'HomePage',
     'ViewModelHomePage',
     'create_homepage_view_model',
+    'home_breadcrumbs',
     'read_homepage',
 ]
@@ -1,12 +1,13 @@
 """Homepage functions."""
 
-from typing import Dict, Literal
+from typing import Dict
 
-from expression import Error, Result
+from expression import Error, Nothing, Result
 from pydantic import HttpUrl
 
 from electric_toolbox.configs import ReadFromSingular, Section, WebsiteInfo
-from electric_toolbox.parsing.common import TargetFiles, Template
+from electric_toolbox.constants import ExistingTemplates
+from electric_toolbox.parsing.common import TargetFiles, Template, page_targets
 from electric_toolbox.parsing.components.breadcrumbs import Breadcrumbs
 from electric_toolbox.parsing.components.navigation import create_navigation_menu
 from electric_toolbox.parsing.components.opengraph import create_opengraph_typed_website
@@ -14,16 +15,43 @@ from electric_toolbox.parsing.components.seo import build_head_meta, website_jso
 
 from .models import HomePage
 
+# ``url`` of the singular section written to the site root.
+HOME_RESOURCE = 'index'
+
+
+def home_breadcrumbs() -> Breadcrumbs:
+    """The root crumb of the website."""
+    return Breadcrumbs(
+        path='/index',
+        title='Home',
+        targets=TargetFiles(
+            complete=Template(
+                destination='index',
+                template=ExistingTemplates.INDEX,
+                extension='html',
+            ),
+        ),
+        previous_crumb=Nothing,
+    )
+
 
 def read_homepage(
     sections: Dict[str, Section],
     website_info: WebsiteInfo,
     home_crumb: Breadcrumbs,
     base_url: str = '',
-    section: Literal['home'] = 'home',
+    section: str = 'home',
 ) -> Result[HomePage, Exception]:
-    """Create a view model for the home page."""
+    """Read a singular section: the homepage, or another standalone page.
+
+    The section whose ``url`` is ``index`` is the homepage (``index.html``,
+    with the site-wide title and structured data); any other singular section
+    becomes ``<url>.html``.
+    """
     section_data = sections[section]
+    resource = section_data.resource_path.strip('/')
+    is_home = resource == HOME_RESOURCE
+    root_url = base_url if base_url.endswith('/') else base_url + '/'
 
     match section_data.read_from:
         case ReadFromSingular():
@@ -38,12 +66,10 @@ def read_homepage(
                 lambda opengraph: HomePage(
                     title=section_data.title,
                     resource_path=section_data.resource_path,
-                    targets=TargetFiles(
-                        complete=Template(
-                            destination='index.html',
-                            template=home_crumb.targets.complete.template,
-                            extension=home_crumb.targets.complete.extension,
-                        ),
+                    targets=page_targets(
+                        destination=f'{resource}.html',
+                        template=home_crumb.targets.complete.template,
+                        extension=home_crumb.targets.complete.extension,
                     ),
                     contents=a.file.contents,
                     navigation=create_navigation_menu(
@@ -54,14 +80,15 @@ def read_homepage(
                     opengraph=opengraph,
                     base_url=HttpUrl(base_url),
                     seo=build_head_meta(
-                        title=website_info.title,
-                        description=website_info.description,
-                        canonical=base_url if base_url.endswith('/') else base_url + '/',
+                        title=website_info.title if is_home else section_data.title,
+                        description=website_info.description if is_home else section_data.description,
+                        canonical=root_url if is_home else f'{root_url}{resource}.html',
                         image=website_info.image,
                         website_info=website_info,
                         twitter_card='summary',
-                        json_ld_objects=[website_json_ld(website_info, base_url)],
+                        json_ld_objects=[website_json_ld(website_info, base_url)] if is_home else [],
                     ),
+                    prefetch=section_data.prefetch,
                 )
             )
 
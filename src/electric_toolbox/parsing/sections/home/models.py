@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, ConfigDict, HttpUrl
 
+from electric_toolbox.configs import DEFAULT_PREFETCH
 from electric_toolbox.parsing.common import TargetFiles
 from electric_toolbox.parsing.components.navigation import NavigationMenu, ViewModelNavigationMenu
 from electric_toolbox.parsing.components.opengraph import OpenGraph, ViewModelOpenGraph
@@ -20,6 +21,7 @@ class HomePage(BaseModel):
     opengraph: OpenGraph
     base_url: HttpUrl
     seo: HeadMeta = HeadMeta()
+    prefetch: int = DEFAULT_PREFETCH
 
 
 class ViewModelHomePage(BaseModel):
@@ -33,3 +35,4 @@ class ViewModelHomePage(BaseModel):
     opengraph: ViewModelOpenGraph
     base_url: HttpUrl
     seo: HeadMeta = HeadMeta()
+    prefetch: int = DEFAULT_PREFETCH
@@ -28,4 +28,5 @@ def create_homepage_view_model(
         opengraph=create_opengraph_view_model(homepage.opengraph),
         base_url=homepage.base_url,
         seo=homepage.seo,
+        prefetch=homepage.prefetch,
     )
@@ -0,0 +1,100 @@
+"""Streaming website parsing, for a bounded-memory build.
+
+:func:`parse_website` holds every post (with its HTML) and the view model then
+builds a second full copy. Here the posts are read in two passes over the files,
+one post at a time:
+
+1. each post is parsed and reduced to its summary (what the blog index, feed and
+   sitemap show) and its related-posts terms; the body is dropped;
+2. once the related posts are known, :attr:`StreamedWebsite.posts` parses each
+   post of a collection again and yields its full view model, to be rendered
+   and written before the next one is read.
+
+Only the summaries outlive a post, so peak memory no longer grows with the size
+of the bodies.
+"""
+
+from typing import Any, Callable, Dict, Generator, Iterator, List, NamedTuple
+
+from expression import Result, effect
+from expression.collections import Block
+
+from electric_toolbox.configs import ReadFromPlural, SiteConfigs
+
+from .components.related import RelatedPost
+from .models import ViewModelWebsite
+from .registry import SECTION_TYPES
+from .sections import ViewModelBlog, ViewModelBlogPost, ViewModelHomePage, read_blog
+from .sections.blog import (
+    create_blog_to_view_model,
+    create_blogpost_view_model,
+    iter_blog_posts,
+    related_link,
+    related_links,
+    related_terms,
+    summarise_blogpost_view_model,
+)
+from .sections.home import create_homepage_view_model
+
+
+class StreamedWebsite(NamedTuple):
+    """The website view model, with the posts produced on demand."""
+
+    website: ViewModelWebsite  # the collections' ``posts`` hold the post summaries
+    posts: Callable[[str], Iterator[ViewModelBlogPost]]  # full views of a collection, parsed one at a time
+
+
+@effect.result[StreamedWebsite, Exception]()
+def stream_website(configs: SiteConfigs) -> Generator[Any, Any, StreamedWebsite]:
+    """Parse the website, keeping only post summaries.
+
+    Args:
+        configs: Website configurations (the post files need not be loaded).
+
+    Returns:
+        The view model (with post summaries) and the full post views generator.
+    """
+    pages: Dict[str, ViewModelHomePage] = {}
+    collections: Dict[str, ViewModelBlog] = {}
+    related: Dict[str, List[Block[RelatedPost]]] = {}
+    for name, section in configs.sections.items():
+        if not isinstance(section.read_from, ReadFromPlural):
+            page = yield from SECTION_TYPES[section.read_from.type].read(name, configs)
+            pages[name] = create_homepage_view_model(page)
+            continue
+
+        blog = yield from read_blog(
+            sections=configs.sections,
+            website_info=configs.website,
+            base_url=configs.base_url,
+            section=name,
+            with_posts=False,
+        )
+        summaries: List[ViewModelBlogPost] = []
+        terms: List[dict[str, float]] = []
+        for parsed in iter_blog_posts(configs.sections, configs.website, configs.base_url, section=name):
+            post = yield from parsed
+            summaries.append(summarise_blogpost_view_model(create_blogpost_view_model(post)))
+            terms.append(related_terms(post))
+        related[name] = related_links([related_link(s.title, s.resource_path, s.date) for s in summaries], terms)
+        collections[name] = create_blog_to_view_model(blog, posts=Block.of_seq(summaries))
+
+    def _posts(name: str) -> Iterator[ViewModelBlogPost]:
+        posts = iter_blog_posts(configs.sections, configs.website, configs.base_url, section=name)
+        for parsed, links in zip(posts, related[name]):
+            match parsed:
+                case Result(tag='ok', ok=post):
+                    yield create_blogpost_view_model(post, links)
+                case Result(error=error):
+                    # Parsed fine in the first pass: the file changed in between.
+                    raise error
+
+    return StreamedWebsite(
+        website=ViewModelWebsite(
+            base_url=configs.base_url,
+            website_info=configs.website,
+            pages=pages,
+            collections=collections,
+        ),
+        posts=_posts,
+    )
@@ -0,0 +1,56 @@
+"""Collect-all-errors validation of the content, without rendering.
+
+A normal build stops at the first invalid post. For a large content import that
+means one build per error; :func:`validate_website` instead checks every post
+and reports all the problems at once, so CI can gate on a single fast pass.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from electric_toolbox.configs import ReadFromPlural, SiteConfigs
+from electric_toolbox.exceptions import ParsingError
+
+from .sections.blog import validate_blog
+
+
+class ValidationReport(NamedTuple):
+    """Outcome of a validation run."""
+
+    checked: int  # number of files checked
+    errors: Tuple[ParsingError, ...]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every file is valid."""
+        return not self.errors
+
+
+def validate_website(configs: SiteConfigs, workers: Optional[int] = None) -> ValidationReport:
+    """Check the frontmatter of every post, in every collection.
+
+    Args:
+        configs: Website configurations (the post files need not be loaded).
+        workers: Processes to use (``None``: one per CPU, ``1``: in process).
+
+    Returns:
+        How many files were checked and every error found.
+    """
+    checked = 0
+    errors: List[ParsingError] = []
+    for name, section in configs.sections.items():
+        if isinstance(section.read_from, ReadFromPlural):
+            count, found = validate_blog(configs.sections, section=name, workers=workers)
+            checked += count
+            errors.extend(found)
+    return ValidationReport(checked=checked, errors=tuple(errors))
+
+
+def format_report(report: ValidationReport) -> str:
+    """Human-readable report: one line per error, grouped by file, then a total."""
+    lines = []
+    for error in sorted(report.errors, key=lambda e: str(e.context.get('file', ''))):
+        cause = f' ({type(error.cause).__name__}: {error.cause})' if str(error.cause) else ''
+        lines.append(f'{error.context.get("file", "?")}: {error.message}{cause}')
+    files = len({error.context.get('file') for error in report.errors})
+    lines.append(f'{report.checked} files checked, {len(report.errors)} errors in {files} files')
+    return '\n'.join(lines)
@@ -1,3 +1,5 @@
+"""View model for the whole website."""
+
 from electric_toolbox.parsing.sections.blog import create_blog_to_view_model
 from electric_toolbox.parsing.sections.home import create_homepage_view_model
 
@@ -16,6 +18,8 @@ def create_website_view_model(
         The view model for the website.
     """
     return ViewModelWebsite(
-        homepage=create_homepage_view_model(website.homepage),
-        blog=create_blog_to_view_model(website.blog),
+        base_url=website.base_url,
+        website_info=website.website_info,
+        pages={name: create_homepage_view_model(page) for name, page in website.pages.items()},
+        collections={name: create_blog_to_view_model(blog) for name, blog in website.collections.items()},
     )
@@ -0,0 +1,101 @@
+"""Render-once cache for the partials every page shares.
+
+The header (with the navigation menu and the theme toggle), the footer and the
+script block of ``body.html`` come out the same for every page of a section,
+yet Jinja used to execute them again for each page. Wrapped in a ``cached``
+block, a partial is rendered the first time and its HTML is spliced into every
+later page::
+
+    {% cached navigation %}{% include 'blocks/header.html' %}{% endcached %}
+
+The cache key is the template, the position of the block and the values listed
+after ``cached`` (the context the partial depends on, e.g. the navigation menu,
+which marks the active section). Environment globals (icons, site name...) are
+not part of the key: they do not change during a build, and :func:`generate`
+empties the cache at the start of every build.
+
+The environment needs the extension: ``Environment(extensions=[PartialCache])``.
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from jinja2 import Environment, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+
+
+class RenderedPartials:
+    """Rendered partials by key, with what the cache saved.
+
+    ``hits`` and ``misses`` count the lookups; ``saved`` is the time (in
+    seconds) the hits would have spent rendering, estimated from the first
+    render of each partial.
+    """
+
+    def __init__(self) -> None:
+        """Empty cache."""
+        self._entries: Dict[Hashable, Tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+
+    def __len__(self) -> int:
+        """Number of rendered partials."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget the partials and the counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+        self.saved = 0.0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """The partial stored under ``key``, rendered (and stored) if missing.
+
+        ``render`` is the block's caller: its ``Markup`` (with autoescape) is
+        kept as is, so the stored HTML is not escaped again when spliced in.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.saved += entry[1]
+            return entry[0]
+        self.misses += 1
+        start = time.perf_counter()
+        html = render()
+        self._entries[key] = html, time.perf_counter() - start
+        return html
+
+
+class PartialCache(Extension):
+    """The ``{% cached key, ... %}...{% endcached %}`` tag (see the module docstring)."""
+
+    tags = {'cached'}  # noqa: RUF012 -- jinja2's attribute
+
+    def __init__(self, environment: Environment):
+        """Attach an empty :class:`RenderedPartials` to the environment, as ``rendered_partials``."""
+        super().__init__(environment)
+        environment.extend(rendered_partials=RenderedPartials())
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        """Parse the keys and the body of the block."""
+        lineno = next(parser.stream).lineno
+        keys: List[nodes.Expr] = []
+        while parser.stream.current.type != 'block_end':
+            if keys:
+                parser.stream.expect('comma')
+            keys.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcached',), drop_needle=True)
+        call = self.call_method('_cached', [nodes.Const(f'{parser.name}:{lineno}'), nodes.List(keys)])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _cached(self, where: str, keys: List[Any], caller: Callable[[], str]) -> str:
+        partials: RenderedPartials = getattr(self.environment, 'rendered_partials')
+        return partials.get_or_render((where, repr(keys)), caller)
+
+
+def rendered_partials(env: Environment) -> RenderedPartials:
+    """The partials cache of ``env`` (a detached, unused one without the extension)."""
+    partials = getattr(env, 'rendered_partials', None)
+    return partials if isinstance(partials, RenderedPartials) else RenderedPartials()
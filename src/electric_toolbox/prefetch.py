@@ -0,0 +1,63 @@
+"""Build-time navigation graph: which pages a reader most likely opens next.
+
+The pages only prefetch a link on their own once the pointer is over it. The
+build knows more: from the blog index and the homepage readers go to the newest
+posts, and from a post to its neighbours in time, to its related posts, or back
+to the index (where its tags filter the list). Each page lists its top
+candidates as ``<link rel="prefetch">`` hints, so the browser fetches them
+while idle.
+
+Candidates are the pages' htmx fragments when they have one: boosted
+navigation requests the fragment, not the full document, and a prefetched
+fragment is then served from the HTTP cache.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from expression.collections import Block
+
+from .parsing import TargetFiles
+
+
+class PrefetchPage(NamedTuple):
+    """A page that can be prefetched."""
+
+    page: str  # where the full document lives (a post's resource path)
+    href: str  # what to prefetch (see :func:`prefetch_href`)
+    date: str  # iso8601, orders the posts
+
+
+def prefetch_href(targets: TargetFiles) -> str:
+    """What navigating to a page fetches: its fragment, else the full document."""
+    destination = (targets.fragment or targets.complete).destination
+    return destination if destination.startswith('/') else f'/{destination}'
+
+
+def newest(pages: Iterable[PrefetchPage]) -> List[str]:
+    """Hrefs of ``pages``, newest first."""
+    return [page.href for page in sorted(pages, key=lambda page: page.date, reverse=True)]
+
+
+def adjacent(pages: Sequence[PrefetchPage]) -> Dict[str, List[str]]:
+    """Next (newer) and previous (older) post of every post, by page."""
+    ordered = sorted(pages, key=lambda page: page.date)
+    return {
+        page.page: [
+            *([ordered[i + 1].href] if i + 1 < len(ordered) else []),
+            *([ordered[i - 1].href] if i > 0 else []),
+        ]
+        for i, page in enumerate(ordered)
+    }
+
+
+def ranked(candidates: Iterable[Optional[str]], limit: int, exclude: str = '') -> Block[str]:
+    """The first ``limit`` distinct candidates, in order, without ``exclude`` (the page itself)."""
+    seen = {exclude}
+    hints: List[str] = []
+    for href in candidates:
+        if len(hints) >= limit:
+            break
+        if href and href not in seen:
+            seen.add(href)
+            hints.append(href)
+    return Block.of_seq(hints)
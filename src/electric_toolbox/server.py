@@ -0,0 +1,311 @@
+"""Static server for the generated ``website/`` folder.
+
+A production-like local server, standard library only:
+
+* the files are indexed once at start-up; the strong ``ETag`` of a file is its
+  sha256 from the deploy manifest (see :mod:`electric_toolbox.manifest`) when
+  it has the size recorded there and was not modified after the manifest was
+  saved, so nothing is hashed per request; ``If-None-Match`` (weak or strong,
+  one tag or a list) is answered with a 304;
+* ``.br`` / ``.gz`` siblings of a file (see :func:`precompress`) are served
+  instead of it when the ``Accept-Encoding`` of the request allows them, unless
+  they are older than the file; their ``ETag`` is the file's, suffixed;
+* a single ``Range`` (with ``If-Range``) is answered with a 206;
+* bodies go straight from the file to the socket (``os.sendfile``), and every
+  connection (HTTP/1.1 keep-alive) has its own thread.
+
+Only indexed files are served: the request path never reaches the file system.
+"""
+
+import gzip
+import mimetypes
+import os
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .manifest import ManifestEntry, load_manifest
+
+# Content encodings, most preferred first, with the suffix of their sibling files.
+ENCODINGS: Tuple[Tuple[str, str], ...] = (('br', '.br'), ('gzip', '.gz'))
+# Types worth compressing; images and fonts are compressed already.
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.xml', '.txt', '.svg', '.map', '.webmanifest')
+_TEXT_TYPES = ('text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml')
+
+
+class Representation(NamedTuple):
+    """One file as sent: the identity, or a precompressed sibling."""
+
+    path: Path
+    size: int
+    etag: str
+    encoding: Optional[str] = None  # Content-Encoding
+
+
+class StaticFile(NamedTuple):
+    """A servable location: its type and representations (identity first)."""
+
+    content_type: str
+    representations: Tuple[Representation, ...]
+
+
+def _content_type(location: str) -> str:
+    content_type = mimetypes.guess_type(location)[0] or 'application/octet-stream'
+    return f'{content_type}; charset=utf-8' if content_type.startswith(_TEXT_TYPES) else content_type
+
+
+def _etag(path: Path, entry: Optional[ManifestEntry], saved_ns: int) -> Tuple[int, str]:
+    """Size and ETag of a file: its manifest hash, else (not built, or changed since) size and mtime.
+
+    The hash is only trusted for a file of the recorded size, last modified
+    before the manifest was saved (at ``saved_ns``).
+    """
+    stat = path.stat()
+    if entry is not None and entry.size == stat.st_size and stat.st_mtime_ns <= saved_ns:
+        return stat.st_size, f'"{entry.sha256[:32]}"'
+    return stat.st_size, f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def index_site(directory: Path, manifest: Optional[Path] = None) -> Dict[str, StaticFile]:
+    """Every file of ``directory`` by location (``/`` separated, relative), with its representations.
+
+    Args:
+        directory: The site root.
+        manifest: The deploy manifest of the build, if any: its hashes become
+            the ETags of the files not modified since it was saved.
+
+    Returns:
+        The locations (precompressed siblings are representations, not locations).
+    """
+    known = load_manifest(manifest).files if manifest is not None else {}
+    saved_ns = manifest.stat().st_mtime_ns if manifest is not None and manifest.is_file() else -1
+    files: Dict[str, StaticFile] = {}
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for path in sorted(directory.rglob('*')):
+        if not path.is_file() or path.suffix in suffixes:
+            continue
+        location = path.relative_to(directory).as_posix()
+        size, etag = _etag(path, known.get(location), saved_ns)
+        representations = [Representation(path=path, size=size, etag=etag)]
+        modified = path.stat().st_mtime_ns
+        for encoding, suffix in ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            # Older than the file (re-rendered since it was compressed): stale, not served.
+            if sibling.is_file() and sibling.stat().st_mtime_ns >= modified:
+                representation = Representation(sibling, sibling.stat().st_size, f'{etag[:-1]}-{encoding}"', encoding)
+                representations.append(representation)
+        files[location] = StaticFile(content_type=_content_type(location), representations=tuple(representations))
+    return files
+
+
+def precompress(directory: Path, minimum: int = 1024) -> int:
+    """Write a ``.gz`` sibling next to every compressible file that lacks an up-to-date one.
+
+    Args:
+        directory: The site root.
+        minimum: Smaller files (in bytes) are left alone.
+
+    Returns:
+        How many files were compressed.
+    """
+    count = 0
+    for path in directory.rglob('*'):
+        if path.suffix not in COMPRESSIBLE or not path.is_file() or path.stat().st_size < minimum:
+            continue
+        sibling = path.with_name(f'{path.name}.gz')
+        if sibling.is_file() and sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            continue
+        sibling.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+        count += 1
+    return count
+
+
+def _accepted(header: Optional[str]) -> Dict[str, float]:
+    """``Accept-Encoding`` as coding -> q-value."""
+    accepted: Dict[str, float] = {}
+    for item in (header or '').split(','):
+        coding, _, parameters = item.strip().partition(';')
+        quality = 1.0
+        name, _, value = parameters.strip().partition('=')
+        if name.strip() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+def negotiate(static: StaticFile, accept_encoding: Optional[str]) -> Representation:
+    """The representation to send: the preferred acceptable encoding, else the identity."""
+    accepted = _accepted(accept_encoding)
+    for representation in static.representations[1:]:
+        if accepted.get(representation.encoding or '', accepted.get('*', 0.0)) > 0:
+            return representation
+    return static.representations[0]
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` list holds ``etag``, or ``*`` (weak comparison: ``W/`` is ignored)."""
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """The first and last byte of a single ``bytes=`` range (``None``: send everything).
+
+    Raises:
+        ValueError: The range cannot be satisfied.
+    """
+    unit, _, spec = (header or '').partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        return None  # Multiple ranges are not supported: the whole file is sent.
+    first, _, last = spec.strip().partition('-')
+    try:
+        if not first:
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start, end = int(first), min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise ValueError(spec)
+    return start, end
+
+
+def _send(connection: Any, output: Any, source: BinaryIO, offset: int, count: int) -> None:
+    """Copy ``count`` bytes of ``source`` from ``offset`` to the client, with ``sendfile`` when possible."""
+    try:
+        while count > 0:
+            sent = os.sendfile(connection.fileno(), source.fileno(), offset, count)
+            if sent == 0:
+                return
+            offset, count = offset + sent, count - sent
+    except OSError:  # No sendfile for this socket or file: copy what is left.
+        source.seek(offset)
+        while count > 0:
+            chunk = source.read(min(count, 1 << 16))
+            if not chunk:
+                return
+            output.write(chunk)
+            count -= len(chunk)
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    """Serves the files of ``server.files`` (a :func:`index_site` mapping)."""
+
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body go out in separate writes: without TCP_NODELAY
+    # the body waits for the client's delayed ACK (~40 ms) on every request.
+    disable_nagle_algorithm = True
+    server: 'StaticServer'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Access log, unless the server is quiet."""
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def do_HEAD(self) -> None:
+        """Headers only."""
+        self._respond(body=False)
+
+    def do_GET(self) -> None:
+        """Serve a file."""
+        self._respond(body=True)
+
+    def _lookup(self) -> Optional[StaticFile]:
+        location = unquote(urlsplit(self.path).path).lstrip('/')
+        if location == '' or location.endswith('/'):
+            location += 'index.html'
+        return self.server.files.get(location)
+
+    def _respond(self, body: bool) -> None:
+        static = self._lookup()
+        if static is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        representation = negotiate(static, self.headers.get('Accept-Encoding'))
+        headers: List[Tuple[str, str]] = [('ETag', representation.etag), ('Cache-Control', 'no-cache')]
+        if len(static.representations) > 1:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if representation.encoding is not None:
+            headers.append(('Content-Encoding', representation.encoding))
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None and etag_matches(if_none_match, representation.etag):
+            self._headers(HTTPStatus.NOT_MODIFIED, headers)
+            return
+
+        status, start, length = HTTPStatus.OK, 0, representation.size
+        if_range = self.headers.get('If-Range')
+        if if_range is None or if_range.strip() == representation.etag:
+            try:
+                selected = byte_range(self.headers.get('Range'), representation.size)
+            except ValueError:
+                self._headers(
+                    HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                    [*headers, ('Content-Range', f'bytes */{representation.size}'), ('Content-Length', '0')],
+                )
+                return
+            if selected is not None:
+                status, start, length = HTTPStatus.PARTIAL_CONTENT, selected[0], selected[1] - selected[0] + 1
+                headers.append(('Content-Range', f'bytes {selected[0]}-{selected[1]}/{representation.size}'))
+
+        headers += [('Content-Type', static.content_type), ('Content-Length', str(length)), ('Accept-Ranges', 'bytes')]
+        self._headers(status, headers)
+        if body and length:
+            with representation.path.open('rb') as source:
+                _send(self.connection, self.wfile, source, start, length)
+
+    def _headers(self, status: HTTPStatus, headers: List[Tuple[str, str]]) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+
+class StaticServer(ThreadingHTTPServer):
+    """A thread per connection, over the files of :func:`index_site`.
+
+    Args:
+        address: Host and port (port ``0`` picks a free one).
+        files: The indexed site.
+        quiet: No access log.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], files: Dict[str, StaticFile], quiet: bool = False):
+        """Bind the server."""
+        self.files = files
+        self.quiet = quiet
+        super().__init__(address, StaticHandler)
+
+
+def make_server(
+    directory: Path,
+    host: str = '127.0.0.1',
+    port: int = 8080,
+    manifest: Optional[Path] = None,
+    quiet: bool = False,
+) -> StaticServer:
+    """Index ``directory`` and bind a server for it (call ``serve_forever`` to start it).
+
+    Args:
+        directory: The site root, e.g. ``website/``.
+        host: The interface to listen on.
+        port: The port (``0`` picks a free one).
+        manifest: The deploy manifest file of the build, for the ETags.
+        quiet: No access log.
+
+    Returns:
+        The bound server.
+    """
+    return StaticServer((host, port), index_site(directory, manifest), quiet=quiet)
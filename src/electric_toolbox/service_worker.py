@@ -0,0 +1,110 @@
+"""The service worker: repeat visits from the browser's cache, and offline reading.
+
+Every build writes ``sw.js`` with a precache list: the standalone pages, the
+collection indexes and the newest posts (each with its htmx fragment, which is
+what boosted navigation fetches), and the vendored scripts. The stylesheet is
+inlined into the pages, so it is cached with them. Each entry carries the
+revision of what was just written: the manifest hash of the page (see
+:func:`electric_toolbox.manifest.manifest_entry`) or the script's SRI hash.
+
+A deploy that changes any entry changes ``sw.js``, so browsers install the new
+worker, which downloads the entries whose revision changed and only those.
+Posts that are not precached are served stale-while-revalidate; any other
+request goes to the network first and falls back to the cache when offline.
+Each of these two runtime caches keeps its last :data:`RUNTIME_CACHE_ENTRIES`
+responses; older ones are dropped as new ones are stored.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple
+
+from jinja2 import Environment
+
+from .manifest import manifest_entry
+from .parsing import ViewModelWebsite
+from .parsing.common import FRAGMENTS_DIRECTORY
+from .sinks import OutputSink, WrittenFile, normalise_location
+from .vendor import ScriptTag
+
+SERVICE_WORKER_LOCATION = 'sw.js'
+SERVICE_WORKER_TEMPLATE = 'service_worker.js'
+# How many of the newest posts of each collection are precached.
+PRECACHED_POSTS = 5
+# Responses kept in each runtime cache (posts, other pages).
+RUNTIME_CACHE_ENTRIES = 50
+# The revision is a prefix of the manifest's sha256: plenty to tell versions apart.
+_REVISION_LENGTH = 16
+
+
+class PrecacheEntry(NamedTuple):
+    """A URL downloaded when the service worker installs, and the version of its contents."""
+
+    url: str  # absolute path on the site
+    revision: str
+
+
+def precached_pages(website: ViewModelWebsite, posts: int = PRECACHED_POSTS) -> List[str]:
+    """The destinations of the pages to precache: standalone pages, collection indexes, newest posts.
+
+    Args:
+        website: The website (a streaming build's summaries are enough).
+        posts: How many of the newest posts of each collection.
+
+    Returns:
+        The destinations of their full documents and fragments, as the pages
+        are rendered (see :func:`electric_toolbox.generate.website_pages`).
+    """
+    targets = [page.targets for page in website.pages.values()]
+    for blog in website.collections.values():
+        targets.append(blog.targets)
+        targets += [post.targets for post in sorted(blog.posts, key=lambda post: post.date, reverse=True)[:posts]]
+    return [
+        template.destination
+        for target in targets
+        for template in (target.complete, target.fragment)
+        if template is not None
+    ]
+
+
+def page_entry(destination: str, written: WrittenFile) -> PrecacheEntry:
+    """The precache entry of the page rendered to ``destination``, from the file written."""
+    revision = manifest_entry(written['contents'].encode('utf-8')).sha256[:_REVISION_LENGTH]
+    return PrecacheEntry(url=f'/{normalise_location(destination)}', revision=revision)
+
+
+def _post_prefixes(website: ViewModelWebsite) -> List[str]:
+    """Path prefixes of the posts of every collection, and of their fragments."""
+    prefixes = []
+    for blog in website.collections.values():
+        resource = blog.resource_path.strip('/')
+        prefixes += [f'/{resource}/', f'/{FRAGMENTS_DIRECTORY}/{resource}/']
+    return prefixes
+
+
+def write_service_worker(
+    sink: OutputSink,
+    env: Environment,
+    website: ViewModelWebsite,
+    pages: Iterable[PrecacheEntry],
+) -> WrittenFile:
+    """Write ``sw.js``.
+
+    Args:
+        sink: Where the file is written to.
+        env: The Jinja2 environment (the worker is a template). Its
+            ``vendor_scripts`` are precached too.
+        website: The website, for the paths of its posts.
+        pages: The precache entries of the pages.
+
+    Returns:
+        The written file.
+    """
+    entries: Dict[str, str] = {entry.url: entry.revision for entry in pages}
+    scripts = env.globals.get('vendor_scripts')
+    if isinstance(scripts, list):
+        entries.update({script.src: script.integrity for script in scripts if isinstance(script, ScriptTag)})
+    contents = env.get_template(SERVICE_WORKER_TEMPLATE).render(
+        precache=[{'url': url, 'revision': revision} for url, revision in sorted(entries.items())],
+        post_prefixes=_post_prefixes(website),
+        runtime_cache_entries=RUNTIME_CACHE_ENTRIES,
+    )
+    return sink.write(SERVICE_WORKER_LOCATION, contents)
@@ -0,0 +1,223 @@
+"""Output sinks: where rendered files end up.
+
+``generate`` renders pages and hands each one to a sink. The sink decides what
+"writing" means:
+
+* :class:`DirectorySink` — one file per page under a folder (``website/``).
+* :class:`MemorySink` — a ``{location: contents}`` map, for tests and the dev
+  server; nothing touches the disk.
+* :class:`ArchiveSink` — the whole site streamed into a single ``.zip`` /
+  ``.tar`` / ``.tar.gz`` in one sequential pass, ready for deployment.
+
+Large generated files (sitemaps, feeds) are written incrementally through
+``open``, so they never have to be materialised as one string.
+"""
+
+import io
+import tarfile
+import tempfile
+import time
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import ContextManager, Dict, Iterator, Optional, Protocol, Self, TypedDict
+
+# Streamed tar members are spooled in memory up to this size, then on disk.
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class WrittenFile(TypedDict):
+    """TypedDict representing a written file."""
+
+    path: Path
+    contents: str
+
+
+class TextWriter(Protocol):
+    """The part of a text file handle the streaming writers need."""
+
+    def write(self, s: str, /) -> int:
+        """Write ``s`` and return the number of characters written."""
+        ...
+
+
+class OutputSink(Protocol):
+    """Destination for the generated files."""
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Store ``contents`` at ``location`` (relative to the site root)."""
+        ...
+
+    def open(self, location: str) -> ContextManager[TextWriter]:
+        """Stream a file to ``location``; it is stored when the context exits."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release any underlying resource."""
+        ...
+
+
+def normalise_location(location: str) -> str:
+    """Site-root relative location without a leading slash (``/a/b.html`` -> ``a/b.html``)."""
+    return location.removeprefix('/')
+
+
+class _SinkContext:
+    """Context-manager support shared by the sinks (``with`` closes the sink)."""
+
+    def close(self) -> None:
+        """Nothing to release by default."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class DirectorySink(_SinkContext):
+    """Writes every file below ``base_path``."""
+
+    def __init__(self, base_path: Path):
+        """Directory sink.
+
+        Args:
+            base_path (Path): The folder the website is written to.
+        """
+        self.base_path = base_path
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Write ``contents`` to ``base_path / location``, creating folders as needed."""
+        full_path = self.base_path / normalise_location(location)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, 'w') as f:
+            f.write(contents)
+        return WrittenFile(path=full_path, contents=contents)
+
+    @contextmanager
+    def open(self, location: str) -> Iterator[TextWriter]:
+        """Stream straight into ``base_path / location``."""
+        full_path = self.base_path / normalise_location(location)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, 'w') as f:
+            yield f
+
+
+class MemorySink(_SinkContext):
+    """Keeps every file in memory, keyed by its normalised location."""
+
+    def __init__(self) -> None:
+        """In-memory sink."""
+        self.files: Dict[str, str] = {}
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Store ``contents`` under ``location``, replacing any previous version."""
+        key = normalise_location(location)
+        self.files[key] = contents
+        return WrittenFile(path=Path(key), contents=contents)
+
+    @contextmanager
+    def open(self, location: str) -> Iterator[TextWriter]:
+        """Buffer the stream and store it under ``location`` once complete."""
+        buffer = io.StringIO()
+        yield buffer
+        self.write(location, buffer.getvalue())
+
+
+class ArchiveSink(_SinkContext):
+    """Streams every file into a single archive, chosen by the path suffix.
+
+    ``.zip`` is deflate-compressed; ``.tar`` is uncompressed and ``.tar.gz`` /
+    ``.tgz`` is gzip-compressed. Tar archives are opened in stream mode, so the
+    site is written in one sequential pass without seeking.
+    """
+
+    def __init__(self, path: Path):
+        """Archive sink.
+
+        Args:
+            path (Path): The archive to create (overwritten if it exists).
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+        if path.name.endswith('.zip'):
+            self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        elif path.name.endswith(('.tar.gz', '.tgz')):
+            self._tar = tarfile.open(str(path), 'w|gz')
+        elif path.name.endswith('.tar'):
+            self._tar = tarfile.open(str(path), 'w|')
+        else:
+            raise ValueError(f'Unsupported archive type: {path.name} (use .zip, .tar, .tar.gz or .tgz)')
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Append ``contents`` to the archive as ``location``."""
+        name = normalise_location(location)
+        data = contents.encode('utf-8')
+        if self._zip is not None:
+            self._zip.writestr(name, data)
+        elif self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(data))
+        else:
+            raise ValueError(f'Archive {self.path} is already closed')
+        return WrittenFile(path=Path(name), contents=contents)
+
+    @contextmanager
+    def open(self, location: str) -> Iterator[TextWriter]:
+        """Stream a member into the archive.
+
+        Zip members are compressed as they are written. A tar header needs the
+        member size up front, so tar members are spooled (in memory up to
+        1 MiB, then in a temporary file) and appended once complete.
+        """
+        name = normalise_location(location)
+        if self._zip is not None:
+            with io.TextIOWrapper(self._zip.open(name, 'w'), encoding='utf-8') as member:
+                yield member
+        elif self._tar is not None:
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+                text = io.TextIOWrapper(spool, encoding='utf-8')
+                yield text
+                text.flush()
+                info = tarfile.TarInfo(name)
+                info.size = spool.tell()
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                spool.seek(0)
+                self._tar.addfile(info, spool)
+                text.detach()
+        else:
+            raise ValueError(f'Archive {self.path} is already closed')
+
+    def add_file(self, location: str, source: Path) -> None:
+        """Copy the file ``source`` into the archive as ``location`` (e.g. a static asset)."""
+        name = normalise_location(location)
+        if self._zip is not None:
+            self._zip.write(source, name)
+        elif self._tar is not None:
+            info = self._tar.gettarinfo(str(source), arcname=name)
+            info.mode = 0o644
+            with source.open('rb') as handle:
+                self._tar.addfile(info, handle)
+        else:
+            raise ValueError(f'Archive {self.path} is already closed')
+
+    def close(self) -> None:
+        """Finish the archive (writes the zip central directory / tar end blocks)."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
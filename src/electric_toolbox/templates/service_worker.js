@@ -0,0 +1,100 @@
+{#
+    The service worker (see electric_toolbox.service_worker). Rendered once per
+    build: the precache list and its revisions change with every deploy that
+    changes a precached file, which is what makes browsers update the worker.
+#}
+'use strict';
+
+const PRECACHE = 'precache';
+const POSTS = 'posts';
+const PAGES = 'pages';
+const ENTRIES = {{ precache | tojson }};
+const POST_PREFIXES = {{ post_prefixes | tojson }};
+const RUNTIME_CACHE_ENTRIES = {{ runtime_cache_entries | tojson }};
+
+// Each entry is cached under its URL and revision, so an install only
+// downloads the entries whose revision is not cached yet.
+function cacheKey(entry) {
+    return new URL(`${entry.url}?__revision=${encodeURIComponent(entry.revision)}`, self.location.origin).href;
+}
+
+const KEYS = new Map(ENTRIES.map((entry) => [entry.url, cacheKey(entry)]));
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE);
+        const cached = new Set((await cache.keys()).map((request) => request.url));
+        await Promise.all(ENTRIES.filter((entry) => !cached.has(cacheKey(entry))).map(async (entry) => {
+            const response = await fetch(entry.url, { cache: 'reload' });
+            if (!response.ok) throw new Error(`${entry.url}: ${response.status}`);
+            await cache.put(cacheKey(entry), response);
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        const current = new Set(KEYS.values());
+        const cache = await caches.open(PRECACHE);
+        await Promise.all((await cache.keys())
+            .filter((request) => !current.has(request.url))
+            .map((request) => cache.delete(request)));
+        await self.clients.claim();
+    })());
+});
+
+function pagePath(url) {
+    return url.pathname.endsWith('/') ? `${url.pathname}index.html` : url.pathname;
+}
+
+// The runtime caches keep the RUNTIME_CACHE_ENTRIES responses stored last.
+// keys() lists a cache in insertion order and put() re-inserts a URL it
+// replaces, so the first keys are the oldest.
+async function putAndTrim(cache, request, response) {
+    await cache.put(request, response);
+    const keys = await cache.keys();
+    await Promise.all(keys.slice(0, Math.max(0, keys.length - RUNTIME_CACHE_ENTRIES)).map((key) => cache.delete(key)));
+}
+
+async function staleWhileRevalidate(event, request) {
+    const cache = await caches.open(POSTS);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    const fresh = fetch(request).then(async (response) => {
+        if (response.ok) await putAndTrim(cache, request, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(fresh.catch(() => undefined));
+        return cached;
+    }
+    return fresh;
+}
+
+async function networkFirst(request) {
+    const cache = await caches.open(PAGES);
+    try {
+        const response = await fetch(request);
+        if (response.ok) await putAndTrim(cache, request, response.clone());
+        return response;
+    } catch (error) {
+        const cached = await cache.match(request, { ignoreSearch: request.mode === 'navigate' });
+        if (cached) return cached;
+        if (request.mode === 'navigate' && KEYS.has('/index.html')) return caches.match(KEYS.get('/index.html'));
+        throw error;
+    }
+}
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+    const key = KEYS.get(pagePath(url));
+    if (key) {
+        event.respondWith(caches.match(key).then((cached) => cached || fetch(request)));
+    } else if (POST_PREFIXES.some((prefix) => url.pathname.startsWith(prefix))) {
+        event.respondWith(staleWhileRevalidate(event, request));
+    } else {
+        event.respondWith(networkFirst(request));
+    }
+});
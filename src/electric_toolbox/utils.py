@@ -1,31 +1,34 @@
 """Functions for managing the website folder. Mainly used for recreate."""
 
 from pathlib import Path
+from typing import AbstractSet
 
 
-def remove_directory_tree(start_directory: Path) -> None:
+def remove_directory_tree(start_directory: Path, keep: AbstractSet[Path] = frozenset()) -> None:
     """Recursively and permanently removes the specified directory files.
 
-    All of its subdirectories, and every file contained in any of those folders.
+    All of its subdirectories, and every file contained in any of those folders,
+    but the files in ``keep`` (and the folders holding them).
     """
     for path in start_directory.iterdir():
         if path.is_file():
-            if path.suffix == '.css':
-                continue
-            else:
+            if path not in keep:
                 path.unlink()
         else:
-            remove_directory_tree(path)
-            path.rmdir()
+            remove_directory_tree(path, keep)
+            if not any(path.iterdir()):
+                path.rmdir()
 
 
-def clean_or_create(directory: Path) -> None:
+def clean_or_create(directory: Path, keep: AbstractSet[Path] = frozenset()) -> None:
     """Will Cleanup the directory if exists, and then (re)create it.
 
     Args:
         directory (Path): The desired directory path.
+        keep (AbstractSet[Path]): Files under ``directory`` to leave in place,
+            e.g. the static assets synced into it again after the build.
     """
     if directory.exists():
-        remove_directory_tree(start_directory=directory)
+        remove_directory_tree(start_directory=directory, keep=keep)
     else:
         directory.mkdir()
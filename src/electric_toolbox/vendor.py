@@ -0,0 +1,116 @@
+"""Self-hosted, fingerprinted third-party scripts.
+
+Alpine.js and htmx used to come from two CDNs, costing a DNS lookup and a TLS
+handshake each on a first visit. They are now read from the pinned copies
+committed in ``resources/vendor/`` (the build needs no network), checked against
+the upstream checksums in ``resources/vendor/SHA256SUMS``, written into the site
+under a content-hashed name (cacheable forever, a new version gets a new URL)
+and referenced with a Subresource Integrity hash computed at build time.
+Optionally they are concatenated into one bundle, a single request for both.
+
+The templates get the result as the ``vendor_scripts`` Jinja global: a list of
+:class:`ScriptTag` to emit, in order, as deferred ``<script>`` tags.
+"""
+
+import base64
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+from .sinks import OutputSink
+
+# Folder (under the site root) holding the vendored scripts.
+VENDOR_DIRECTORY = 'vendor'
+# ``sha256sum`` output for the pinned copies (``just vendor-scripts`` checks it too).
+CHECKSUMS = Path('resources/vendor/SHA256SUMS')
+
+
+class VendorScript(NamedTuple):
+    """A third-party script and the local file it is read from."""
+
+    name: str
+    source: Path
+
+
+class ScriptTag(NamedTuple):
+    """What a ``<script>`` tag needs: where the script is and its SRI hash."""
+
+    src: str  # absolute path on the site
+    integrity: str  # sha384-<base64>
+
+
+# Execution order: deferred scripts run in document order.
+DEFAULT_SCRIPTS = (
+    VendorScript('alpine', Path('resources/vendor/alpinejs-3.14.7.min.js')),
+    VendorScript('htmx', Path('resources/vendor/htmx-2.0.3.min.js')),
+)
+
+
+def subresource_integrity(contents: bytes) -> str:
+    """The ``integrity`` attribute value of ``contents`` (sha384)."""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(contents).digest()).decode('ascii')
+
+
+def fingerprinted_location(name: str, contents: bytes) -> str:
+    """``vendor/<name>.<first 10 hex digits of the sha256>.js``."""
+    return f'{VENDOR_DIRECTORY}/{name}.{hashlib.sha256(contents).hexdigest()[:10]}.js'
+
+
+def read_checksums(path: Path = CHECKSUMS) -> Dict[str, str]:
+    """File name -> sha256 (hex), from ``sha256sum`` output."""
+    checksums = {}
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line.strip():
+            digest, name = line.split(maxsplit=1)
+            checksums[name.lstrip('*')] = digest.lower()
+    return checksums
+
+
+def _verified(script: VendorScript, checksums: Path) -> str:
+    """The contents of ``script``, if they are the pinned ones."""
+    contents = script.source.read_bytes()
+    expected = read_checksums(checksums).get(script.source.name)
+    if expected is None:
+        raise ValueError(f'{script.source} has no checksum in {checksums}')
+    if hashlib.sha256(contents).hexdigest() != expected:
+        raise ValueError(f'{script.source} does not match its checksum in {checksums}')
+    return contents.decode('utf-8')
+
+
+def _write(sink: OutputSink, name: str, contents: str) -> ScriptTag:
+    encoded = contents.encode('utf-8')
+    location = fingerprinted_location(name, encoded)
+    sink.write(location, contents)
+    return ScriptTag(src=f'/{location}', integrity=subresource_integrity(encoded))
+
+
+def _bundle(sources: Iterable[str]) -> str:
+    """Concatenated scripts; a ``;`` and a newline keep one from running into the next."""
+    return ''.join(f'{source.rstrip()}\n;\n' for source in sources)
+
+
+def write_vendor_scripts(
+    sink: OutputSink,
+    scripts: Sequence[VendorScript] = DEFAULT_SCRIPTS,
+    bundle: bool = False,
+    checksums: Path = CHECKSUMS,
+) -> List[ScriptTag]:
+    """Copy the scripts into the site under fingerprinted names.
+
+    Args:
+        sink: Where the site is written to.
+        scripts: The scripts, in execution order.
+        bundle: Write a single ``vendor/bundle.<hash>.js`` instead of one file per script.
+        checksums: The ``sha256sum`` list every script must match.
+
+    Returns:
+        The script tags to emit, in order.
+
+    Raises:
+        FileNotFoundError: If a pinned copy is missing.
+        ValueError: If a script has no checksum or does not match it.
+    """
+    sources = [_verified(script, checksums) for script in scripts]
+    if bundle:
+        return [_write(sink, 'bundle', _bundle(sources))]
+    return [_write(sink, script.name, source) for script, source in zip(scripts, sources)]
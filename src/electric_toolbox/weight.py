@@ -0,0 +1,269 @@
+"""Page weight: where the bytes of each generated page go, and budgets for them.
+
+Every page carries more than its article: the inlined stylesheet, the Open
+Graph / Twitter meta tags, the JSON-LD structured data, inline SVG icons and
+inline scripts. :func:`page_weight` attributes the bytes of a page to those
+categories (the rest of ``<main>`` is the page's ``content``, everything else
+is ``markup``) and measures each one three ways:
+
+* ``raw`` — as written;
+* ``minified`` — after the build's minifier (and JSON-LD without whitespace),
+  so ``raw - minified`` is what is left to gain by minifying;
+* ``compressed`` — gzip (level 9), as served. A category is compressed on its
+  own, so the categories of a page do not add up to its compressed total.
+
+Like the deploy manifest, the weights are recorded while the site is written
+(:class:`WeightSink`), or measured afterwards from a built folder
+(:func:`weights_of_directory`). :func:`over_budget` checks them against the
+``[budgets]`` table of ``compile.config.toml``.
+"""
+
+import gzip
+import json
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from .generate import minify_page
+from .sinks import OutputSink, TextWriter, WrittenFile, normalise_location
+
+# In report order; the last two take whatever the others do not.
+CATEGORIES: Tuple[str, ...] = ('css', 'social_meta', 'json_ld', 'icons', 'scripts', 'content', 'markup')
+
+# One match per element, left to right, so nested matches are impossible (an
+# icon in a script string is the script's). JSON-LD is tried before scripts.
+_ELEMENTS = re.compile(
+    r'(?P<json_ld><script\b[^>]*\bapplication/ld\+json\b[^>]*>.*?</script\s*>)'
+    r'|(?P<scripts><script\b.*?</script\s*>)'
+    r'|(?P<css><style\b.*?</style\s*>)'
+    r'|(?P<icons><svg\b.*?</svg\s*>)'
+    r'|(?P<social_meta><meta\b[^>]*\b(?:property|name)=["\']?(?:og|article|twitter):[^>]*>)',
+    re.IGNORECASE | re.DOTALL,
+)
+_MAIN = re.compile(r'<main\b.*?</main\s*>', re.IGNORECASE | re.DOTALL)
+_JSON_LD_BODY = re.compile(r'(<script\b[^>]*>)(.*?)(</script\s*>)', re.IGNORECASE | re.DOTALL)
+
+
+class Size(NamedTuple):
+    """Bytes of a page, or of one category of it."""
+
+    raw: int
+    minified: int
+    compressed: int
+
+
+class PageWeight(BaseModel):
+    """The size of a page, in total and by category."""
+
+    model_config = ConfigDict(frozen=True)
+    location: str
+    total: Size
+    categories: Dict[str, Size]
+
+
+class WeightBudget(BaseModel):
+    """Upper bounds for every page, in bytes; unset bounds are not checked."""
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    compressed: Optional[int] = None  # the whole page, as served
+    raw: Optional[int] = None  # the whole page, as written
+    categories: Dict[str, int] = {}  # raw bytes of a category
+
+    @field_validator('categories')
+    @classmethod
+    def _known_categories(cls, categories: Dict[str, int]) -> Dict[str, int]:
+        unknown = sorted(categories.keys() - set(CATEGORIES))
+        if unknown:
+            raise ValueError(f'Unknown page weight categories {unknown}, expected some of {list(CATEGORIES)}')
+        return categories
+
+
+class BudgetViolation(NamedTuple):
+    """A page over one of its budgets."""
+
+    location: str
+    measure: str  # 'compressed', 'raw' or a category
+    size: int
+    limit: int
+
+
+def _compressed(data: bytes) -> int:
+    return len(gzip.compress(data, compresslevel=9, mtime=0)) if data else 0
+
+
+def _compact_json_ld(element: str) -> str:
+    """The JSON-LD script without the whitespace of its JSON (unchanged if it is not valid JSON)."""
+    match = _JSON_LD_BODY.fullmatch(element)
+    if match is None:
+        return element
+    try:
+        data = json.loads(match.group(2))
+    except ValueError:
+        return element
+    return f'{match.group(1)}{json.dumps(data, ensure_ascii=False, separators=(",", ":"))}{match.group(3)}'
+
+
+def _split(html: str) -> Dict[str, List[str]]:
+    """The text of a page, by category."""
+    pieces: Dict[str, List[str]] = {category: [] for category in CATEGORIES}
+    main = _MAIN.search(html)
+    main_start, main_end = main.span() if main is not None else (0, 0)
+
+    def between(start: int, end: int) -> None:
+        inner_start, inner_end = max(start, main_start), min(end, main_end)
+        if inner_start < inner_end:
+            pieces['markup'].append(html[start:inner_start])
+            pieces['content'].append(html[inner_start:inner_end])
+            pieces['markup'].append(html[inner_end:end])
+        else:
+            pieces['markup'].append(html[start:end])
+
+    position = 0
+    for match in _ELEMENTS.finditer(html):
+        between(position, match.start())
+        pieces[match.lastgroup or 'markup'].append(match.group())
+        position = match.end()
+    between(position, len(html))
+    return pieces
+
+
+def _size(text: str, minified: str) -> Size:
+    return Size(
+        raw=len(text.encode('utf-8')),
+        minified=len(minified.encode('utf-8')),
+        compressed=_compressed(text.encode('utf-8')),
+    )
+
+
+def page_weight(location: str, html: str) -> PageWeight:
+    """Measure a page, in total and by category.
+
+    Args:
+        location: The page's location (relative to the site root).
+        html: The page, as written.
+
+    Returns:
+        The raw, minified and compressed size of the page and of each category.
+    """
+    categories: Dict[str, Size] = {}
+    for category, pieces in _split(html).items():
+        text = ''.join(pieces)
+        if category == 'json_ld':
+            minified = ''.join(_compact_json_ld(piece) for piece in pieces)
+        else:
+            minified = minify_page(text) if text else ''
+        categories[category] = _size(text, minified)
+    return PageWeight(
+        location=normalise_location(location),
+        total=_size(html, minify_page(html)),
+        categories=categories,
+    )
+
+
+class WeightSink:
+    """Sink wrapper measuring every HTML page it forwards.
+
+    Args:
+        inner (OutputSink): The sink that actually stores the files.
+    """
+
+    def __init__(self, inner: OutputSink):
+        """Weight-recording sink."""
+        self.inner = inner
+        self._pages: Dict[str, PageWeight] = {}
+
+    def write(self, location: str, contents: str) -> WrittenFile:
+        """Measure ``contents`` if it is a page and forward it to the inner sink."""
+        if location.endswith('.html'):
+            weight = page_weight(location, contents)
+            self._pages[weight.location] = weight
+        return self.inner.write(location, contents)
+
+    @contextmanager
+    def open(self, location: str) -> Iterator[TextWriter]:
+        """Forward the stream to the inner sink (pages are written whole; the streams are feeds)."""
+        with self.inner.open(location) as handle:
+            yield handle
+
+    def close(self) -> None:
+        """Close the inner sink."""
+        self.inner.close()
+
+    @property
+    def weights(self) -> List[PageWeight]:
+        """The weight of every page written so far, by location."""
+        return [self._pages[location] for location in sorted(self._pages)]
+
+
+def weights_of_directory(directory: Path) -> List[PageWeight]:
+    """Measure the pages of an existing output folder."""
+    weights = [
+        page_weight(path.relative_to(directory).as_posix(), path.read_text(encoding='utf-8'))
+        for path in directory.rglob('*.html')
+        if path.is_file()
+    ]
+    return sorted(weights, key=lambda weight: weight.location)
+
+
+def over_budget(weights: Iterable[PageWeight], budget: WeightBudget) -> List[BudgetViolation]:
+    """The budgets every page exceeds, page by page."""
+    violations = []
+    for weight in weights:
+        limits = [('compressed', weight.total.compressed, budget.compressed), ('raw', weight.total.raw, budget.raw)]
+        limits += [(category, weight.categories[category].raw, limit) for category, limit in budget.categories.items()]
+        violations += [
+            BudgetViolation(weight.location, measure, size, limit)
+            for measure, size, limit in limits
+            if limit is not None and size > limit
+        ]
+    return violations
+
+
+def _kb(size: int) -> str:
+    return f'{size / 1024:.1f}'
+
+
+def format_weight_report(weights: List[PageWeight], violations: List[BudgetViolation], top: int = 10) -> str:
+    """Human-readable report: the heaviest pages, where the bytes go, the budgets exceeded, then a total.
+
+    Args:
+        weights: The measured pages.
+        violations: Their budgets exceeded (see :func:`over_budget`).
+        top: How many of the heaviest pages (compressed) to list.
+    """
+    lines = [f'Heaviest pages (KiB raw / minified / gzip; raw KiB by category: {", ".join(CATEGORIES)}):']
+    for weight in sorted(weights, key=lambda w: (-w.total.compressed, w.location))[:top]:
+        total = ' / '.join(_kb(size) for size in weight.total)
+        by_category = ' '.join(_kb(weight.categories[category].raw) for category in CATEGORIES)
+        lines.append(f'  {weight.location}: {total} | {by_category}')
+
+    raw = sum(weight.total.raw for weight in weights) or 1
+    lines.append('All pages, by category (raw share, KiB raw / minified / gzip):')
+    for category in CATEGORIES:
+        sizes = [weight.categories[category] for weight in weights]
+        total = ' / '.join(_kb(sum(size[i] for size in sizes)) for i in range(3))
+        lines.append(f'  {category}: {sum(size.raw for size in sizes) / raw:.0%} {total}')
+
+    for violation in violations:
+        lines.append(
+            f'{violation.location}: {violation.measure} {violation.size} bytes, over the {violation.limit} bytes budget'
+        )
+    pages = len({violation.location for violation in violations})
+    lines.append(f'{len(weights)} pages measured, {pages} over budget')
+    return '\n'.join(lines)
+
+
+def save_weights(weights: Iterable[PageWeight], path: Path) -> None:
+    """Write the weights as ``{location: {total, categories}}`` JSON, sizes as ``{raw, minified, compressed}``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        weight.location: {
+            'total': weight.total._asdict(),
+            'categories': {category: size._asdict() for category, size in weight.categories.items()},
+        }
+        for weight in weights
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding='utf-8')
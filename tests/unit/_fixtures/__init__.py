@@ -1,8 +1,11 @@
 """Fixtures for unit tests."""
 
 from .list_folder_files import sample_01_list_folder_files, sample_02_list_folder_files
+from .site import jinja_env, sample_site_configs
 
 __all__ = [
+    'jinja_env',
     'sample_01_list_folder_files',
     'sample_02_list_folder_files',
+    'sample_site_configs',
 ]
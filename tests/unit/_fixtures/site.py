@@ -0,0 +1,75 @@
+"""A small on-disk site (config + content) for end-to-end generation tests."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jinja2 import Environment, PackageLoader
+
+from electric_toolbox.icons import load_icons
+from electric_toolbox.partials import PartialCache
+
+
+def sample_post(title: str, day: int, tags: list[str]) -> str:
+    """A post with valid frontmatter."""
+    tag_lines = ''.join(f'\n  - {tag}' for tag in tags)
+    return f"""---
+title: "{title}"
+image: "https://example.com/{day}.png"
+publication_time: 2024-01-{day:02d} 10:00:00
+section: "Programming"
+tags:{tag_lines}
+---
+
+# {title}
+
+Some words about {title.lower()} and a [link](https://example.com).
+"""
+
+
+@pytest.fixture
+def sample_site_configs(tmp_path: Path) -> Dict[str, Any]:
+    """Raw (TOML-shaped) configs pointing at a home page and three posts."""
+    content = tmp_path / 'content'
+    posts = content / 'posts'
+    posts.mkdir(parents=True)
+    (content / 'index.md').write_text('Hello, this is home.')
+    (posts / 'first-post.md').write_text(sample_post('First Post', 1, ['python', 'testing']))
+    (posts / 'second-post.md').write_text(sample_post('Second Post', 2, ['python']))
+    (posts / 'third-post.md').write_text(sample_post('Third Post', 3, ['rust']))
+    return {
+        'base_url': 'https://example.com',
+        'website': {
+            'name': 'Example',
+            'title': 'Example',
+            'description': 'An example site',
+            'image': 'https://example.com/og.png',
+            'locale': 'en_US',
+        },
+        'settings': {'include_drafts': False},
+        'sections': {
+            'home': {
+                'title': 'Home',
+                'description': 'Home Page',
+                'url': 'index',
+                'read_from': {'type': 'singular', 'path': str(content / 'index.md')},
+            },
+            'blog': {
+                'title': 'Posts',
+                'description': 'Blog Posts',
+                'url': 'posts',
+                'read_from': {'type': 'plural', 'each': 'singular', 'path': str(posts)},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def jinja_env() -> Environment:
+    """The package templates, with the globals the build script provides."""
+    env = Environment(loader=PackageLoader('electric_toolbox', 'templates'), autoescape=True, extensions=[PartialCache])
+    env.globals['icons'] = load_icons(Path('resources/icons'))
+    env.globals['site_name'] = 'Example'
+    env.globals['build_year'] = 2024
+    env.globals['inline_css'] = ''
+    return env
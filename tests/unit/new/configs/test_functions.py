@@ -7,6 +7,7 @@ from typing import Any, Dict
 from expression.collections import Block
 
 from electric_toolbox.configs import (
+    DEFAULT_PREFETCH,
     ConfigSettings,
     FileData,
     ReadFromPlural,
@@ -26,6 +27,8 @@ def test_parse_website_config_valid() -> None:
         file1.write_text('Content of file 1')
         file2 = Path(tmpdirname) / 'file2.md'
         file2.write_text('# Markdown Content')
+        # An image shown by a post, not a post.
+        (Path(tmpdirname) / 'figure.PNG').write_bytes(b'\x89PNG\r\n\x1a\n')
 
         config_data = {
             'settings': {
@@ -200,3 +203,35 @@ def test_parse_website_config_singular() -> None:
 
         assert result.is_ok()
         assert result.ok == expected_config
+
+
+def test_parse_website_config_prefetch(tmp_path: Path) -> None:
+    """A section's prefetch count defaults to DEFAULT_PREFETCH and must be a non-negative integer."""
+    page = tmp_path / 'index.md'
+    page.write_text('Home')
+
+    def _config(**extra: Any) -> Dict[str, Any]:
+        return {
+            'settings': {'include_drafts': False},
+            'base_url': 'https://example.com',
+            'website': {
+                'title': 'Example Website',
+                'description': 'Description',
+                'image': 'https://example.com/image.png',
+                'locale': 'en_US',
+            },
+            'sections': {
+                'home': {
+                    'title': 'Home',
+                    'description': 'Home page',
+                    'url': 'index',
+                    'read_from': {'type': 'singular', 'path': str(page)},
+                    **extra,
+                }
+            },
+        }
+
+    assert parse_website_config(_config()).ok.sections['home'].prefetch == DEFAULT_PREFETCH
+    assert parse_website_config(_config(prefetch=5)).ok.sections['home'].prefetch == 5
+    assert parse_website_config(_config(prefetch=-1)).is_error()
+    assert parse_website_config(_config(prefetch='3')).is_error()
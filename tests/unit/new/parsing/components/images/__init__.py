@@ -0,0 +1 @@
+"""Image loading unit tests."""
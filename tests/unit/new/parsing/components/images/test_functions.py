@@ -0,0 +1,67 @@
+"""Tests for the image loading hints and the header-only size reader."""
+
+import struct
+from pathlib import Path
+
+from electric_toolbox.parsing.components.images import ImageSize, image_size, optimise_images, read_image_size
+
+_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + struct.pack('>II', 640, 480) + b'\x08\x02\x00\x00\x00' + bytes(4)
+_JPEG = (
+    b'\xff\xd8'
+    + b'\xff\xe0'
+    + struct.pack('>H', 16)
+    + b'JFIF\x00'
+    + bytes(9)  # APP0 first: the frame header is further in
+    + b'\xff\xc2'
+    + struct.pack('>HBHH', 17, 8, 300, 400)  # progressive frame: height, width
+    + bytes(12)
+)
+_WEBP = b'RIFF' + bytes(4) + b'WEBPVP8X' + bytes(8) + (799).to_bytes(3, 'little') + (599).to_bytes(3, 'little')
+
+
+def test_sizes_are_read_from_the_headers(tmp_path: Path) -> None:
+    """PNG, GIF, JPEG, WebP and SVG sizes; anything else has none."""
+    files = {
+        'a.png': _PNG,
+        'b.gif': b'GIF89a' + struct.pack('<HH', 10, 20) + bytes(8),
+        'c.jpg': _JPEG,
+        'd.webp': _WEBP,
+        'e.svg': b'<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 120.4 60">',
+        'f.svg': b'<svg width="32px" height="16" viewBox="0 0 1 1">',
+        'g.txt': b'not an image',
+        'h.jpg': b'\xff\xd8\xff\xe0',
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+
+    assert {name: read_image_size(tmp_path / name) for name in files} == {
+        'a.png': ImageSize(640, 480),
+        'b.gif': ImageSize(10, 20),
+        'c.jpg': ImageSize(400, 300),
+        'd.webp': ImageSize(800, 600),
+        'e.svg': ImageSize(120, 60),
+        'f.svg': ImageSize(32, 16),
+        'g.txt': None,
+        'h.jpg': None,
+    }
+    assert image_size(tmp_path / 'missing.png') is None
+
+
+def test_images_get_loading_hints_and_sizes(tmp_path: Path) -> None:
+    """The first image is high priority, the others lazy; local images are sized; author attributes win."""
+    (tmp_path / 'images').mkdir()
+    (tmp_path / 'images' / 'hero image.png').write_bytes(_PNG)
+    (tmp_path / 'chart.png').write_bytes(_PNG)
+    html = (
+        '<p><img alt="Hero" src="images/hero%20image.png" /></p>\n'
+        '<p>Text <img alt="Remote" src="https://example.com/x.png" /></p>\n'
+        '<p><img alt="Chart" src="chart.png" width="320" loading="eager"></p>'
+    )
+
+    assert optimise_images(html, tmp_path) == (
+        '<p><img alt="Hero" src="images/hero%20image.png" width="640" height="480" fetchpriority="high" /></p>\n'
+        '<p>Text <img alt="Remote" src="https://example.com/x.png" loading="lazy" decoding="async" /></p>\n'
+        '<p><img alt="Chart" src="chart.png" width="320" loading="eager" decoding="async"></p>'
+    )
+    assert optimise_images('<p>No images.</p>', tmp_path) == '<p>No images.</p>'
+    assert optimise_images('<img src="/abs.png">') == '<img src="/abs.png" fetchpriority="high">'
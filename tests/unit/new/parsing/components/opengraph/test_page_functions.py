@@ -1,114 +1,15 @@
 """Tests for page_functions."""
 
-from pathlib import Path
-
-import frontmatter  # type: ignore
-import pytest
-from expression import Ok, Some
-from expression.collections import Block, Map
+from expression import Some
+from expression.collections import Block
 from pydantic import HttpUrl
 
-from electric_toolbox.configs import FileData
 from electric_toolbox.parsing.components.opengraph.models import OpenGraph, ViewModelOpenGraph
 from electric_toolbox.parsing.components.opengraph.page_functions import (
-    create_opengraph_typed_article,
     create_opengraph_view_model,
 )
 
 
-@pytest.fixture
-def sample_file_data_1(sample_01_list_folder_files: Map[str, FileData]) -> FileData:
-    """Sample file data."""
-    return sample_01_list_folder_files['test1.md']
-
-
-@pytest.fixture
-def sample_file_data_2() -> FileData:
-    """Sample file data."""
-    return FileData(
-        path=Path('tests/data/snap_posts_01/A very- Complicated name - Hi.md'),
-        file_name='A very- Complicated name - Hi.md',
-        contents="""---
-title: "Complicated Name"
-image: "none"
-publication_time: 2024-01-01 15:00:00
-section: "example_section"
-authors:
-  - first_name: "João"
-    last_name: "Monteiro"
-    username: "Portugapt"
-    gender: "male"
-    email: "monteiro.joao.ps@gmail.com"
-language: "en"
-stage: "draft"
-tags:
-  - "example"
-  - "example2"
-content_type: "blog"
----
-# Complicated Name
-
-Lorem ipsum 02
-""",
-    )
-
-
-@pytest.fixture
-def sample_file_data_invalid_frontmatter() -> FileData:
-    """Sample file data with invalid front matter."""
-    return FileData(
-        path=Path('tests/data/invalid_frontmatter.md'),
-        file_name='invalid_frontmatter.md',
-        contents="""---
-invalid_field: "This should cause an error"
----
-# Invalid Frontmatter
-""",
-    )
-
-
-def test_from_markdown_frontmatter_valid(
-    sample_file_data_1: FileData,
-) -> None:
-    """Test from_markdown_frontmatter with valid front matter."""
-    post = frontmatter.loads(sample_file_data_1.contents)
-    url = 'https://example.com/path/to/post'
-
-    expected = Ok(
-        OpenGraph(
-            title='A Sample test post',
-            ogtype='article',
-            image='https://example.com/image.jpg',
-            description=Some('This is a sample description'),
-            locale='en',
-            url=HttpUrl(url),
-        )
-    )
-
-    result = create_opengraph_typed_article(
-        data=post,
-        url=url,
-    )
-
-    assert result == expected
-
-
-def test_from_markdown_frontmatter_invalid(
-    sample_file_data_1: FileData,
-) -> None:
-    """Test from_markdown_frontmatter with invalid front matter."""
-    post = frontmatter.loads(sample_file_data_1.contents)
-    post.metadata['title'] = None  # Make the title invalid
-    url = 'https://example.com/path/to/post'
-
-    result = create_opengraph_typed_article(
-        data=post,
-        url=url,
-    )
-
-    assert result.is_error()
-
-
 def test_to_view_model_valid_page() -> None:
     """Test to_view_model with a valid OpenGraph object."""
     og = OpenGraph(
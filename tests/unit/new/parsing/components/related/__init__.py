@@ -0,0 +1 @@
+"""Related posts unit tests."""
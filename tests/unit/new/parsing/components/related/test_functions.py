@@ -0,0 +1,72 @@
+"""Tests for the related posts computation."""
+
+import random
+
+import pytest
+
+from electric_toolbox.parsing.components.related import RelatedDocument, document_terms, functions, related_posts
+
+_HAS_EXTRA = functions.VECTORIZED
+
+_DOCUMENTS = [
+    RelatedDocument(tags=['python'], text='Railway oriented programming with Result types in Python.'),
+    RelatedDocument(tags=['python', 'fp'], text='Result types and railway programming, revisited.'),
+    RelatedDocument(tags=['rust'], text='Ownership and the borrow checker.'),
+    RelatedDocument(tags=['rust'], text='Lifetimes and the borrow checker explained.'),
+    RelatedDocument(tags=[], text='Gardening notes.'),
+]
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=['python', 'sparse'])
+def vectorized(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run every test on the pure Python path and, with the ``related`` extra, on the sparse one."""
+    if request.param and not _HAS_EXTRA:
+        pytest.skip('the related extra (numpy, scipy) is not installed')
+    monkeypatch.setattr(functions, 'VECTORIZED', request.param)
+    return bool(request.param)
+
+
+def test_related_posts_ranks_shared_tags_and_terms() -> None:
+    """Each post links to the one sharing its tag and vocabulary; unrelated posts get nothing."""
+    related = related_posts(_DOCUMENTS, k=2)
+
+    assert [j for j, _ in related[0]] == [1]
+    assert [j for j, _ in related[2]] == [3]
+    assert related[4] == []
+    assert all(0.0 < score <= 1.0 for row in related for _, score in row)
+
+
+def test_related_posts_is_chunk_independent() -> None:
+    """The chunk size only bounds memory; it never changes the result."""
+    assert related_posts(_DOCUMENTS, chunk_size=1) == related_posts(_DOCUMENTS, chunk_size=512)
+
+
+def test_related_posts_limits_to_k_most_similar() -> None:
+    """At most ``k`` posts are kept, most similar first."""
+    documents = [RelatedDocument(tags=['a'], text=f'shared words here {i} ' + 'extra ' * i) for i in range(6)]
+
+    related = related_posts(documents, k=3, max_df=1.0)
+
+    assert all(len(row) == 3 for row in related)
+    assert all(row == sorted(row, key=lambda item: -item[1]) for row in related)
+
+
+def test_both_paths_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The sparse matrix path keeps the same terms and finds the same posts as the pure Python one."""
+    if not _HAS_EXTRA:
+        pytest.skip('the related extra (numpy, scipy) is not installed')
+    rng = random.Random(0)  # noqa: S311
+    words = [f'word{i}' for i in range(300)]
+    terms = [
+        document_terms(
+            RelatedDocument(tags=rng.sample(['a', 'b', 'c', 'd'], 2), text=' '.join(rng.choices(words, k=60)))
+        )
+        for _ in range(200)
+    ]
+
+    monkeypatch.setattr(functions, 'VECTORIZED', True)
+    sparse = functions.related_from_terms(terms, k=5, max_terms=8, chunk_size=64)
+    monkeypatch.setattr(functions, 'VECTORIZED', False)
+    python = functions.related_from_terms(terms, k=5, max_terms=8, chunk_size=64)
+
+    assert sparse == python
@@ -0,0 +1 @@
+"""Plain-text extraction unit tests."""
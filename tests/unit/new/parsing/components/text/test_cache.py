@@ -0,0 +1,36 @@
+"""Tests for the persistent Markdown conversion cache."""
+
+from pathlib import Path
+
+from expression.collections import Block
+
+from electric_toolbox.parsing.components.text import ConversionCache, Heading, PlainText, conversion_fingerprint
+
+_PLAIN = PlainText(
+    text='Title words',
+    word_count=2,
+    excerpt='words',
+    outline=Block.of_seq([Heading(level=1, id='title', title='Title')]),
+)
+
+
+def test_conversions_round_trip(tmp_path: Path) -> None:
+    """A stored conversion comes back identical; other sources miss."""
+    cache = ConversionCache(tmp_path, conversion_fingerprint({'toc': True}, ['markdown']))
+
+    cache.put('# Title\n\nwords', '<h1 id="title">Title</h1>\n<p>words</p>', _PLAIN)
+
+    assert cache.get('# Title\n\nwords') == ('<h1 id="title">Title</h1>\n<p>words</p>', _PLAIN)
+    assert cache.get('# Other') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+def test_converter_changes_invalidate_the_entries(tmp_path: Path) -> None:
+    """Other settings give another key; a corrupt entry is a miss."""
+    cache = ConversionCache(tmp_path, conversion_fingerprint({'toc': True}, ['markdown']))
+    cache.put('text', '<p>text</p>', _PLAIN)
+
+    assert ConversionCache(tmp_path, conversion_fingerprint({'toc': False}, ['markdown'])).get('text') is None
+    next(tmp_path.rglob('*.json')).write_text('{"html": ')
+    assert cache.get('text') is None
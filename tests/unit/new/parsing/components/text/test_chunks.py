@@ -0,0 +1,55 @@
+"""Tests for the chunked conversion of large Markdown documents."""
+
+import pytest
+
+from electric_toolbox.parsing.components.text import split_markdown, stitch_chunks
+from electric_toolbox.parsing.sections.blog.article_functions import _convert_markdown, _md_to_html
+
+
+def _document(sections: int) -> str:
+    blocks = []
+    for i in range(sections):
+        blocks += [
+            f'## Part {i % 3}',
+            f'Words of part {i}, a note[^n{i}] and a [shared link][home].',
+            '```python\ndef f():\n\n    # Not a heading\n    return 1\n```',
+            '- first\n- second',
+            f'[^n{i}]: Note {i}.',
+        ]
+    blocks.append('Closing words, [again][home] and the first note again[^n0].')
+    blocks.append('[home]: https://example.com "Home"')
+    return '\n\n'.join(blocks)
+
+
+def test_parts_never_split_fences_or_shared_footnotes() -> None:
+    """Each part converts on its own: fences are whole, definitions travel with their references."""
+    # The closing paragraph references the first note again: there is nowhere to cut.
+    assert len(split_markdown(_document(12), chunk_size=200)) == 1
+
+    parts = split_markdown(_document(12).replace(' and the first note again[^n0]', ''), chunk_size=200)
+
+    assert len(parts) > 3
+    for part in parts:
+        assert part.count('```') % 2 == 0
+        assert '[home]: https://example.com "Home"' in part
+        assert all(f'[^n{i}]:' in part for i in range(12) if f'[^n{i}] ' in part)
+
+
+@pytest.mark.parametrize('chunk_size', [150, 400])
+def test_stitched_conversion_matches_whole_conversion(chunk_size: int) -> None:
+    """Heading ids stay unique, footnotes are renumbered into one list, the text is the same."""
+    document = _document(12).replace(' and the first note again[^n0]', '')
+    parts = split_markdown(document, chunk_size=chunk_size)
+
+    html, plain = stitch_chunks([_convert_markdown(part) for part in parts])
+
+    assert len(parts) > 1
+    assert (html, plain) == _convert_markdown(document)
+    assert [heading.id for heading in plain.outline][:4] == ['part-0', 'part-1', 'part-2', 'part-0_1']
+
+
+def test_small_documents_are_converted_whole() -> None:
+    """Below the threshold nothing is split (and no process is started)."""
+    document = _document(2)
+
+    assert _md_to_html(document) == _convert_markdown(document)
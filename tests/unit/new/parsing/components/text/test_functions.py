@@ -0,0 +1,90 @@
+"""Tests for the single-pass plain-text extraction."""
+
+import xml.etree.ElementTree as etree
+
+from markdown import Markdown
+
+from electric_toolbox.parsing.components.text import Heading, PlainText, PlainTextExtension, excerpt
+from electric_toolbox.parsing.components.text.functions import extract_plain_text
+
+_DOCUMENT = """# Title
+
+Some *emph*asis with `code` and a [link](https://example.com) and a note[^1].
+
+```python
+def hidden(): pass
+```
+
+| a | b |
+|---|---|
+| c | d |
+
+## Sub section
+
+More <span>inline</span> words. ![alt text](image.png)
+
+[^1]: The footnote.
+"""
+
+
+def _convert(document: str, **config: int) -> PlainText:
+    extension = PlainTextExtension(**config)
+    md = Markdown(
+        extensions=['toc', 'footnotes', 'fenced_code', 'tables', extension],
+        extension_configs={'toc': {'permalink': True}},
+    )
+    md.convert(document)
+    assert extension.result is not None
+    return extension.result
+
+
+def test_plain_text_skips_markup_code_and_footnotes() -> None:
+    """Inline markup is joined, code/images/permalinks/footnotes are dropped."""
+    result = _convert(_DOCUMENT)
+
+    assert result.text == ('Title Some emphasis with and a link and a note. a b c d Sub section More inline words.')
+    assert result.word_count == 19
+
+
+def test_superscripts_are_kept_but_footnote_refs_are_not() -> None:
+    """A ``sup`` is text (an exponent); the footnote reference inside one is dropped by its class."""
+    root = etree.Element('div')
+    paragraph = etree.SubElement(root, 'p')
+    paragraph.text = 'E = mc'
+    exponent = etree.SubElement(paragraph, 'sup')
+    exponent.text, exponent.tail = '2', ' and a note'
+    reference = etree.SubElement(paragraph, 'sup', {'id': 'fnref:1'})
+    etree.SubElement(reference, 'a', {'class': 'footnote-ref', 'href': '#fn:1'}).text = '1'
+    reference.tail = '.'
+
+    assert extract_plain_text(root, []).text == 'E = mc2 and a note.'
+
+
+def test_excerpt_and_outline() -> None:
+    """The excerpt leaves headings out; the outline keeps their ids."""
+    result = _convert(_DOCUMENT, excerpt_limit=30)
+
+    assert result.excerpt == 'Some emphasis with and a link…'
+    assert list(result.outline) == [
+        Heading(level=1, id='title', title='Title'),
+        Heading(level=2, id='sub-section', title='Sub section'),
+    ]
+
+
+def test_extension_resets_between_documents() -> None:
+    """Each conversion replaces the previous result."""
+    extension = PlainTextExtension()
+    md = Markdown(extensions=['toc', extension])
+
+    md.convert('First document.')
+    md.reset()
+    md.convert('Second.')
+
+    assert extension.result is not None
+    assert extension.result.text == 'Second.'
+
+
+def test_excerpt_cuts_at_word_boundary() -> None:
+    """Short texts are kept whole; long ones end on a full word."""
+    assert excerpt('short', limit=10) == 'short'
+    assert excerpt('one two three four', limit=10) == 'one two…'
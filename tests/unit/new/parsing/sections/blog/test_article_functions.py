@@ -95,6 +95,10 @@ def test_read_post_valid(
         '<a class="headerlink" href="#test-post" title="Link to this section">&para;</a></h1>\n'
         '<p>This is the content of the test post.</p>'
     )
+    # Plain text, word count and outline come from the same conversion.
+    assert post.text == 'Test Post This is the content of the test post.'
+    assert post.word_count == 10
+    assert [heading.id for heading in post.outline] == ['test-post']
     assert post.breadcrumbs.title == 'Test Post'
     assert post.breadcrumbs.path == 'test-file'
     # The frontmatter description is surfaced as the card summary.
@@ -0,0 +1,208 @@
+"""Tests for the compiled frontmatter schema."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+import frontmatter  # type: ignore
+import pytest
+from expression import Some
+from expression.collections import Block
+from pydantic import HttpUrl
+
+from electric_toolbox.parsing.components.opengraph import Author, OpenGraph, OpenGraphArticle
+from electric_toolbox.parsing.components.opengraph.article_functions import default_author
+from electric_toolbox.parsing.sections.blog.schema import (
+    frontmatter_errors,
+    parse_frontmatter,
+    post_article_opengraph,
+    post_opengraph,
+    post_thumbnail,
+)
+
+_VALID: Dict[str, Any] = {
+    'title': 'A post',
+    'image': {'src': 'https://example.com/a.png'},
+    'publication_time': datetime(2024, 1, 2, 10),
+    'section': 'Programming',
+    'tags': ['python'],
+    'description': 'About things.',
+    'thumbnail': 'a.png',
+}
+
+
+def test_valid_frontmatter_builds_the_open_graph_data() -> None:
+    """The page data of a post, with the site author when the post names none."""
+    metadata = parse_frontmatter(_VALID).ok
+
+    assert post_opengraph(metadata, 'https://example.com/a.html') == OpenGraph(
+        title='A post',
+        ogtype='article',
+        image='https://example.com/a.png',
+        locale='en',
+        description=Some('About things.'),
+        url=HttpUrl('https://example.com/a.html'),
+    )
+    assert post_article_opengraph(metadata) == OpenGraphArticle(
+        publication_time='2024-01-02T10:00:00+00:00',
+        modified_time='2024-01-02T10:00:00+00:00',
+        expiration_time='2026-01-02T10:00:00+00:00',
+        authors=default_author().ok,
+        section='Programming',
+        tags=Block.of_seq(['python']),
+    )
+    assert post_thumbnail(metadata) == Some('a.png')
+
+
+def test_article_data_keeps_authors_and_offsets() -> None:
+    """Named authors are kept; a naive datetime is UTC, an aware one keeps its offset."""
+    metadata = parse_frontmatter(
+        {
+            **_VALID,
+            'publication_time': datetime(2023, 1, 1, 12),
+            'modified_time': datetime(2023, 1, 1, 12, tzinfo=timezone(timedelta(hours=1))),
+            'authors': [
+                {'first_name': 'John', 'last_name': 'Doe', 'username': 'johndoe', 'url': 'https://example.com/1'},
+                {
+                    'first_name': 'Jane',
+                    'last_name': 'Doe',
+                    'username': 'jd',
+                    'url': 'https://example.com/2',
+                    'gender': 'female',
+                },
+            ],
+        }
+    ).ok
+
+    article = post_article_opengraph(metadata)
+
+    assert (article.publication_time, article.modified_time, article.expiration_time) == (
+        '2023-01-01T12:00:00+00:00',
+        '2023-01-01T12:00:00+01:00',
+        '2025-01-01T12:00:00+00:00',
+    )
+    assert article.authors == Block.of_seq(
+        [
+            Author(first_name='John', last_name='Doe', username='johndoe', url=HttpUrl('https://example.com/1')),
+            Author(
+                first_name='Jane', last_name='Doe', username='jd', url=HttpUrl('https://example.com/2'), gender='female'
+            ),
+        ]
+    )
+
+
+def test_article_data_from_a_markdown_file() -> None:
+    """Frontmatter as read from a file: YAML datetimes, two authors, tags."""
+    post = frontmatter.loads(
+        """---
+title: "Example Post"
+image: "https://example.com/a.png"
+publication_time: 2023-01-01T12:00:00
+authors:
+    - first_name: "John"
+      last_name: "Doe"
+      username: "johndoe"
+      url: "https://example.com/author1"
+    - first_name: "Jane"
+      last_name: "Doe"
+      username: "janedoe"
+      gender: "female"
+      url: "https://example.com/author2"
+tags:
+    - tag1
+    - tag2
+section: "example"
+---
+# Example Post
+"""
+    )
+
+    assert post_article_opengraph(parse_frontmatter(post.metadata).ok) == OpenGraphArticle(
+        publication_time='2023-01-01T12:00:00+00:00',
+        modified_time='2023-01-01T12:00:00+00:00',
+        expiration_time='2025-01-01T12:00:00+00:00',
+        authors=Block.of_seq(
+            [
+                Author(
+                    first_name='John', last_name='Doe', username='johndoe', url=HttpUrl('https://example.com/author1')
+                ),
+                Author(
+                    first_name='Jane',
+                    last_name='Doe',
+                    username='janedoe',
+                    gender='female',
+                    url=HttpUrl('https://example.com/author2'),
+                ),
+            ]
+        ),
+        section='example',
+        tags=Block.of_seq(['tag1', 'tag2']),
+    )
+
+
+@pytest.mark.parametrize('empty', [{}, {'tags': None, 'authors': None}, {'tags': [], 'authors': []}])
+def test_missing_or_empty_tags_and_authors(empty: Dict[str, Any]) -> None:
+    """No tags is an empty block and no authors is the site author."""
+    metadata = {key: value for key, value in _VALID.items() if key not in ('tags', 'authors')}
+
+    article = post_article_opengraph(parse_frontmatter({**metadata, **empty}).ok)
+
+    assert article.tags == Block.empty()
+    assert article.authors == default_author().ok
+    assert len(article.authors) == 1
+
+
+def test_missing_section() -> None:
+    """A post must name its section."""
+    metadata = {key: value for key, value in _VALID.items() if key != 'section'}
+
+    assert parse_frontmatter(metadata).error.message == 'Invalid content type: False'
+
+
+def test_unknown_keys_only() -> None:
+    """Frontmatter with none of the expected keys is an error, not an empty post."""
+    errors = frontmatter_errors([{'invalid_field': 'This should cause an error'}])[0]
+
+    assert [error.context['field'] for error in errors] == ['title', 'publication_time', 'image', 'section']
+
+
+@pytest.mark.parametrize(
+    ('changes', 'message'),
+    [
+        ({'title': None}, 'Title is missing'),
+        ({'title': 5}, 'Title must be a string'),
+        ({'title': ['a']}, 'Title must be a string'),
+        ({'image': ''}, 'Image not found'),
+        ({'language': 3}, 'Language must be a string'),
+        ({'description': ['not', 'text']}, 'Description must be a string'),
+        ({'publication_time': '2024-01-02'}, 'Frontmatter `publication_time` must be an ISO8601 datetime string'),
+        ({'publication_time': 'invalid'}, 'Frontmatter `publication_time` must be an ISO8601 datetime string'),
+        ({'modified_time': 'yesterday'}, 'Frontmatter `modified_time` must be an ISO8601 datetime string'),
+        ({'authors': [{'first_name': 'Only'}]}, 'Author frontmatter incorrect.'),
+        ({'authors': [{'invalid_field': 'invalid'}]}, 'Author frontmatter incorrect.'),
+        ({'tags': ['fine', 2]}, 'Tags must be a list of strings'),
+        ({'tags': 'invalid'}, 'Tags must be a list of strings'),
+        ({'section': ''}, 'Invalid content type: '),
+    ],
+)
+def test_each_failing_key_has_its_message(changes: Dict[str, Any], message: str) -> None:
+    """A failing key is reported with its own message."""
+    (errors,) = frontmatter_errors([{**_VALID, **changes}])
+
+    assert [error.message for error in errors] == [message]
+    assert [error.context['field'] for error in errors] == list(changes)
+
+
+def test_a_batch_reports_every_check_of_every_post() -> None:
+    """One call: valid posts have no errors, the others one per failing key."""
+    broken = {'thumbnail': 3, 'image': 'https://example.com/4.png'}
+
+    errors = frontmatter_errors([_VALID, broken, _VALID])
+
+    assert errors[0] == errors[2] == []
+    assert [error.message for error in errors[1]] == [
+        'Title is missing',
+        'Frontmatter `publication_time` must be an ISO8601 datetime string',
+        'Frontmatter `thumbnail` must be a string or "none"',
+        'Invalid content type: False',
+    ]
+    assert parse_frontmatter(broken).error.message == 'Title is missing'
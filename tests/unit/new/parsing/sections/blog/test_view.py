@@ -141,3 +141,6 @@ def test_create_blog_to_view_model_collects_tags() -> None:
     assert tags['tech'].count == 2
     assert tags['fp'].count == 1
     assert tags['tech'].href == '/blog.html?tag=tech'
+    # Both posts share the 'tech' tag, so they link to each other.
+    assert [related.href for related in vm.posts[0].related] == ['/blog/post-2.html']
+    assert [related.title for related in vm.posts[1].related] == ['Post 1']
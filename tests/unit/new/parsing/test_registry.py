@@ -0,0 +1,78 @@
+"""Tests for the section registry."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jinja2 import Environment
+
+from electric_toolbox.configs import parse_website_config
+from electric_toolbox.main import main
+from electric_toolbox.parsing import parse_website
+from electric_toolbox.sinks import MemorySink
+from tests.unit._fixtures.site import sample_post
+
+
+@pytest.fixture
+def multi_section_configs(sample_site_configs: Dict[str, Any], tmp_path: Path) -> Dict[str, Any]:
+    """The sample site plus a second collection (reading notes) and an about page."""
+    notes = tmp_path / 'content' / 'notes'
+    notes.mkdir()
+    (notes / 'a-note.md').write_text(sample_post('A Note', 4, ['reading']))
+    (tmp_path / 'content' / 'about.md').write_text('About me.')
+    sample_site_configs['sections']['about'] = {
+        'title': 'About',
+        'description': 'Who writes here',
+        'url': 'about',
+        'read_from': {'type': 'singular', 'path': str(tmp_path / 'content' / 'about.md')},
+    }
+    sample_site_configs['sections']['notes'] = {
+        'title': 'Notes',
+        'description': 'Reading notes',
+        'url': 'notes',
+        'read_from': {'type': 'plural', 'each': 'singular', 'path': str(notes)},
+    }
+    return sample_site_configs
+
+
+def test_every_configured_section_is_read(multi_section_configs: Dict[str, Any]) -> None:
+    """Sections are read by their ``read_from.type``, in configuration order."""
+    website = parse_website(parse_website_config(multi_section_configs).ok, workers=1).ok
+
+    assert list(website.pages) == ['home', 'about']
+    assert list(website.collections) == ['blog', 'notes']
+    assert [post.title for post in website.collections['notes'].posts] == ['A Note']
+
+
+def test_second_collection_is_rendered(
+    multi_section_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """The new sections get their pages, fragments, sitemap and feed entries."""
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=multi_section_configs, sink=sink, workers=1)
+
+    assert {'about.html', 'notes.html', 'notes/a-note.html', '_fragments/notes/a-note.html'} <= set(sink.files)
+    assert 'Some words about a note' in sink.files['notes/a-note.html']
+    assert '<title>About' in sink.files['about.html']
+    assert 'https://example.com/notes/a-note.html' in sink.files['sitemap.xml']
+    assert 'https://example.com/about.html' in sink.files['sitemap.xml']
+    assert 'A Note' in sink.files['feed.xml']
+
+
+def test_parallel_and_streaming_builds_match(
+    multi_section_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """Reading the collections in worker processes, or streaming them, changes nothing."""
+    serial, parallel, streamed = MemorySink(), MemorySink(), MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=multi_section_configs, sink=serial, workers=1)
+    main(base_path=tmp_path, j2_env=jinja_env, configs=multi_section_configs, sink=parallel, workers=2)
+    main(base_path=tmp_path, j2_env=jinja_env, configs=multi_section_configs, sink=streamed, streaming=True)
+
+    assert parallel.files == serial.files
+    assert streamed.files == serial.files
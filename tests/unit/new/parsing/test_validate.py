@@ -0,0 +1,47 @@
+"""Tests for the collect-all-errors validation."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from electric_toolbox.configs import SiteConfigs, parse_website_config
+from electric_toolbox.parsing import format_report, validate_website
+
+
+def _configs(raw: Dict[str, Any]) -> SiteConfigs:
+    return parse_website_config(raw, load_contents=False).ok
+
+
+def _break_posts(raw: Dict[str, Any]) -> Path:
+    posts = Path(raw['sections']['blog']['read_from']['path'])
+    # No title, publication time or section and a non-string thumbnail: four errors.
+    (posts / 'fourth-post.md').write_text('---\nthumbnail: 3\nimage: "https://example.com/4.png"\n---\n\nBody.\n')
+    (posts / 'fifth-post.md').write_text('---\ntitle: [unclosed\n---\n\nBody.\n')
+    return posts
+
+
+def test_valid_corpus_has_no_errors(sample_site_configs: Dict[str, Any]) -> None:
+    """Every sample post is valid."""
+    report = validate_website(_configs(sample_site_configs), workers=1)
+
+    assert report.ok
+    assert report.checked == 3
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_every_error_of_every_post_is_reported(sample_site_configs: Dict[str, Any], workers: int) -> None:
+    """Errors do not stop the run: all of them come back, each with its file."""
+    posts = _break_posts(sample_site_configs)
+
+    report = validate_website(_configs(sample_site_configs), workers=workers)
+
+    assert report.checked == 5
+    by_file: Dict[str, list[str]] = {}
+    for error in report.errors:
+        by_file.setdefault(error.context['file'], []).append(error.message)
+    assert set(by_file) == {str(posts / 'fourth-post.md'), str(posts / 'fifth-post.md')}
+    assert by_file[str(posts / 'fifth-post.md')] == ['Invalid frontmatter']
+    # Each failing key once.
+    assert len(by_file[str(posts / 'fourth-post.md')]) == 4
+    assert format_report(report).endswith('5 files checked, 5 errors in 2 files')
@@ -0,0 +1,102 @@
+"""Tests for the static asset sync."""
+
+import os
+from pathlib import Path
+
+from electric_toolbox.assets import (
+    AssetFile,
+    AssetFolder,
+    AssetSync,
+    asset_files,
+    asset_manifest,
+    clean_and_sync,
+    sync_assets,
+)
+from electric_toolbox.manifest import Manifest, ManifestEntry, ManifestSink, manifest_entry, save_manifest
+from electric_toolbox.sinks import MemorySink
+from electric_toolbox.utils import clean_or_create
+
+
+def _sources(tmp_path: Path) -> Path:
+    (tmp_path / 'content' / 'posts' / 'images').mkdir(parents=True)
+    (tmp_path / 'content' / 'posts' / 'first.md').write_text('# First')
+    (tmp_path / 'content' / 'posts' / 'images' / 'chart.PNG').write_bytes(b'png')
+    (tmp_path / 'content' / 'cover.jpg').write_bytes(b'jpg')
+    (tmp_path / 'share.html').write_text('<p>share</p>')
+    return tmp_path
+
+
+def test_asset_files_mirror_the_declared_folders(tmp_path: Path) -> None:
+    """Folders keep their layout under the destination, files their name; ``images`` keeps only the images."""
+    root = _sources(tmp_path)
+
+    assert asset_files(
+        [
+            AssetFolder(source=root / 'content', images=True),
+            AssetFolder(source=root / 'share.html', destination='/vendor/'),
+            AssetFolder(source=root / 'missing.css'),
+        ]
+    ) == [
+        AssetFile(root / 'content' / 'cover.jpg', 'cover.jpg'),
+        AssetFile(root / 'content' / 'posts' / 'images' / 'chart.PNG', 'posts/images/chart.PNG'),
+        AssetFile(root / 'share.html', 'vendor/share.html'),
+    ]
+
+
+def test_sync_copies_only_what_changed(tmp_path: Path) -> None:
+    """A second sync skips everything; a changed source is replaced; a clean build keeps the synced assets."""
+    assets = asset_files([AssetFolder(source=_sources(tmp_path) / 'content', images=True)])
+    site = tmp_path / 'website'
+
+    for hardlink in (True, False):
+        clean_or_create(site)
+        assert sync_assets(assets, site, hardlink=hardlink) == AssetSync(['cover.jpg', 'posts/images/chart.PNG'], [])
+        assert (site / 'posts' / 'images' / 'chart.PNG').read_bytes() == b'png'
+        assert (site / 'cover.jpg').samefile(tmp_path / 'content' / 'cover.jpg') is hardlink
+        assert sync_assets(assets, site, hardlink=hardlink) == AssetSync([], ['cover.jpg', 'posts/images/chart.PNG'])
+
+    # Same size, another time: compared by contents, and left alone when they match.
+    os.utime(site / 'cover.jpg', ns=(0, 0))
+    assert sync_assets(assets, site, hardlink=False).copied == []
+    # Replaced (not edited in place, which a hard link would follow).
+    (tmp_path / 'content' / 'cover.jpg').unlink()
+    (tmp_path / 'content' / 'cover.jpg').write_bytes(b'JPEG')
+    assert sync_assets(assets, site).copied == ['cover.jpg']
+    assert (site / 'cover.jpg').read_bytes() == b'JPEG'
+
+    (site / 'posts' / 'first.html').write_text('<p>page</p>')
+    assert clean_and_sync(site, assets).unchanged == ['cover.jpg', 'posts/images/chart.PNG']
+    assert sorted(path.relative_to(site).as_posix() for path in site.rglob('*')) == [
+        'cover.jpg',
+        'posts',
+        'posts/images',
+        'posts/images/chart.PNG',
+    ]
+
+
+def test_assets_are_in_the_deploy_manifest(tmp_path: Path) -> None:
+    """An asset has the size and sha256 of its source, so a deploy delta lists it when it changes."""
+    assets = asset_files([AssetFolder(source=_sources(tmp_path) / 'share.html', destination='vendor')])
+    sink = ManifestSink(MemorySink())
+
+    for location, entry in asset_manifest(assets).items():
+        sink.record(location, entry)
+
+    assert sink.manifest.files == {'vendor/share.html': manifest_entry(b'<p>share</p>')}
+
+
+def test_asset_manifest_reuses_the_previous_entries(tmp_path: Path) -> None:
+    """A source with the size of its entry, untouched since the manifest was written, is not hashed again."""
+    assets = asset_files([AssetFolder(source=_sources(tmp_path) / 'content', images=True)])
+    previous = tmp_path / 'deploy-manifest.json'
+    stale = ManifestEntry(size=3, sha256='recorded')
+    save_manifest(Manifest(files={'cover.jpg': stale, 'posts/images/chart.PNG': stale}), previous)
+    os.utime(tmp_path / 'content' / 'cover.jpg', ns=(0, 0))
+    os.utime(previous, ns=(10**9, 10**9))
+    os.utime(tmp_path / 'content' / 'posts' / 'images' / 'chart.PNG', ns=(2 * 10**9, 2 * 10**9))
+
+    assert asset_manifest(assets, previous=previous) == {
+        'cover.jpg': stale,
+        'posts/images/chart.PNG': manifest_entry(b'png'),
+    }
+    assert asset_manifest(assets, previous=tmp_path / 'missing.json')['cover.jpg'] == manifest_entry(b'jpg')
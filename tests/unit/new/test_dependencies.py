@@ -0,0 +1,68 @@
+"""Tests for the template dependency graph."""
+
+from jinja2 import DictLoader, Environment, PackageLoader
+
+from electric_toolbox.dependencies import (
+    DYNAMIC_DEPENDENCY,
+    TemplateDependencies,
+    affected_pages,
+    normalise_template_name,
+    template_closure,
+)
+from electric_toolbox.partials import PartialCache
+
+
+def _package_env() -> Environment:
+    return Environment(
+        loader=PackageLoader('electric_toolbox', 'templates'), autoescape=True, extensions=[PartialCache]
+    )
+
+
+def test_template_closure_follows_extends_and_includes() -> None:
+    """The article loads the base layout, the header, the menu and the share buttons."""
+    closure = template_closure(_package_env(), 'sections/blog/article.html')
+
+    assert {
+        'sections/blog/article.html',
+        'body.html',
+        'base.html',
+        'blocks/header.html',
+        'components/navigation/_menu.html',
+        'sections/blog/_article.html',
+        'sections/blog/_share.html',
+    } <= closure
+    assert 'sections/blog/_index.html' not in closure
+
+
+def test_template_closure_marks_dynamic_includes() -> None:
+    """A non-constant include makes the page depend on everything."""
+    env = Environment(loader=DictLoader({'page.html': '{% include partial_name %}'}), autoescape=True)
+
+    assert template_closure(env, 'page.html') == frozenset({'page.html', DYNAMIC_DEPENDENCY})
+
+
+def test_affected_pages_targets_only_dependants() -> None:
+    """A partial change only re-renders the pages that load that partial."""
+    env = _package_env()
+    graph = TemplateDependencies(
+        pages={
+            'index.html': template_closure(env, 'sections/index/index.html'),
+            '/posts.html': template_closure(env, 'sections/blog/index.html'),
+            '/posts/a.html': template_closure(env, 'sections/blog/article.html'),
+        }
+    )
+
+    # The blog index also renders share buttons for every listed post.
+    assert affected_pages(graph, ['src/electric_toolbox/templates/sections/blog/_share.html']) == frozenset(
+        {'/posts.html', '/posts/a.html'}
+    )
+    assert affected_pages(graph, ['sections/blog/_article.html']) == frozenset({'/posts/a.html'})
+    assert affected_pages(graph, ['sections/blog/_index.html']) == frozenset({'/posts.html'})
+    assert affected_pages(graph, ['blocks/header.html']) == frozenset(graph.pages)
+    assert affected_pages(graph, ['unused.html']) == frozenset()
+
+
+def test_normalise_template_name() -> None:
+    """Filesystem paths and template names normalise to the same name."""
+    assert normalise_template_name('src/electric_toolbox/templates/body.html') == 'body.html'
+    assert normalise_template_name('sections/blog/_share.html') == 'sections/blog/_share.html'
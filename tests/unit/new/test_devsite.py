@@ -0,0 +1,61 @@
+"""Tests for the in-memory, render-on-request development website."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+from jinja2 import Environment
+
+from electric_toolbox.devsite import DevSite
+from electric_toolbox.main import main
+from electric_toolbox.sinks import MemorySink
+
+
+def test_pages_are_rendered_on_request(sample_site_configs: Dict[str, Any], jinja_env: Environment) -> None:
+    """Only the requested pages are rendered, once, as a build renders them."""
+    built = MemorySink()
+    main(base_path=Path('unused'), j2_env=jinja_env, configs=sample_site_configs, sink=built)
+    site = DevSite(jinja_env, sample_site_configs)
+
+    assert site.page('/posts/first-post.html') == built.files['posts/first-post.html']
+    assert site.page('/') == built.files['index.html']
+    assert site.page('posts/first-post.html') == built.files['posts/first-post.html']
+    assert site.page('/missing.html') is None
+    assert site.renders == 2
+    assert site.page('feed.xml') == built.files['feed.xml']
+
+
+def test_template_edits_only_stale_the_pages_using_them(
+    sample_site_configs: Dict[str, Any], jinja_env: Environment
+) -> None:
+    """After invalidation, the dependent pages are rendered again on their next request."""
+    site = DevSite(jinja_env, sample_site_configs)
+    site.export(MemorySink())
+    renders = site.renders
+
+    # The three posts and their fragments.
+    assert site.invalidate(['sections/blog/_article.html']) == 6
+    site.page('/index.html')
+    site.page('/posts/second-post.html')
+
+    assert site.renders == renders + 1
+    assert site.invalidate() == 10
+
+
+def test_content_edits_are_picked_up_on_reload(
+    sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path
+) -> None:
+    """A reload parses the website again; nothing is written until the export."""
+    site = DevSite(jinja_env, sample_site_configs)
+    post = Path(sample_site_configs['sections']['blog']['read_from']['path']) / 'third-post.md'
+    assert 'Some words about third post' in (site.page('/posts/third-post.html') or '')
+
+    post.write_text(post.read_text().replace('Some words', 'Other words'))
+    site.reload()
+
+    assert 'Other words about third post' in (site.page('/posts/third-post.html') or '')
+    exported = MemorySink()
+    built = MemorySink()
+    main(base_path=tmp_path / 'website', j2_env=jinja_env, configs=sample_site_configs, sink=built)
+    assert site.export(exported) == len(built.files)
+    assert exported.files == built.files
+    assert not (tmp_path / 'website').exists()
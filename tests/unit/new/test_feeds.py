@@ -0,0 +1,120 @@
+"""Tests for the streaming sitemap and feed writers."""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from electric_toolbox.feeds import FeedEntry, FeedInfo, SitemapUrl, write_atom_feed, write_sitemap
+from electric_toolbox.manifest import ManifestSink, manifest_of_directory
+from electric_toolbox.sinks import DirectorySink, MemorySink
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+
+def _xml(text: str) -> ET.Element:
+    return ET.fromstring(text)  # noqa: S314 -- our own output
+
+
+def _urls(count: int) -> list[SitemapUrl]:
+    return [SitemapUrl(loc=f'https://example.com/p/{i}.html', lastmod=f'2024-01-{i + 1:02d}') for i in range(count)]
+
+
+def test_sitemap_single_file() -> None:
+    """A site under the limits gets a plain urlset, no index."""
+    sink = MemorySink()
+
+    files = write_sitemap(sink, iter(_urls(3)), base_url='https://example.com/')
+
+    assert files == ['sitemap.xml']
+    assert set(sink.files) == {'sitemap.xml'}
+    urlset = _xml(sink.files['sitemap.xml'])
+    assert urlset.tag == f'{SITEMAP_NS}urlset'
+    assert [u.findtext(f'{SITEMAP_NS}loc') for u in urlset] == [u.loc for u in _urls(3)]
+
+
+def test_sitemap_at_the_limit_stays_single() -> None:
+    """Exactly filling one file does not switch to an index."""
+    sink = MemorySink()
+
+    files = write_sitemap(sink, _urls(2), base_url='https://example.com', max_urls=2)
+
+    assert files == ['sitemap.xml']
+    assert len(_xml(sink.files['sitemap.xml'])) == 2
+
+
+def test_sitemap_empty() -> None:
+    """No URLs still yield a valid, empty urlset."""
+    sink = MemorySink()
+
+    write_sitemap(sink, [], base_url='https://example.com')
+
+    assert len(_xml(sink.files['sitemap.xml'])) == 0
+
+
+def test_sitemap_splits_on_url_limit() -> None:
+    """Shards never exceed the URL limit."""
+    sink = MemorySink()
+
+    shards = write_sitemap(sink, _urls(5), base_url='https://example.com', max_urls=2)
+
+    assert shards == ['sitemap-1.xml', 'sitemap-2.xml', 'sitemap-3.xml']
+    assert [len(_xml(sink.files[s])) for s in shards] == [2, 2, 1]
+    index = _xml(sink.files['sitemap.xml'])
+    assert index.tag == f'{SITEMAP_NS}sitemapindex'
+    assert [s.findtext(f'{SITEMAP_NS}loc') for s in index] == [f'https://example.com/{s}' for s in shards]
+    assert [s.findtext(f'{SITEMAP_NS}lastmod') for s in index] == ['2024-01-02', '2024-01-04', '2024-01-05']
+
+
+def test_sitemap_splits_on_byte_limit() -> None:
+    """Shards never exceed the byte limit."""
+    sink = MemorySink()
+
+    shards = write_sitemap(sink, _urls(10), base_url='https://example.com', max_bytes=400)
+
+    assert len(shards) > 1
+    assert all(len(sink.files[s].encode('utf-8')) <= 400 for s in shards)
+    assert sum(len(_xml(sink.files[s])) for s in shards) == 10
+
+
+def test_sitemap_streams_through_manifest(tmp_path: Path) -> None:
+    """Streamed files are recorded in the manifest like any other file."""
+    sink = ManifestSink(DirectorySink(tmp_path))
+
+    write_sitemap(sink, _urls(2), base_url='https://example.com')
+
+    assert sink.manifest == manifest_of_directory(tmp_path)
+
+
+def test_atom_feed() -> None:
+    """The feed is valid Atom, escaped and capped at the entry limit."""
+    sink = MemorySink()
+    entries = (
+        FeedEntry(
+            title=f'Post <{i}>',
+            url=f'https://example.com/p/{i}.html',
+            published='2024-01-01T00:00:00+00:00',
+            updated='2024-01-02T00:00:00+00:00',
+            summary='A & B',
+            authors=('Jane Doe',),
+            categories=('python',),
+        )
+        for i in range(5)
+    )
+    info = FeedInfo(
+        title='Example',
+        url='https://example.com/',
+        feed_url='https://example.com/feed.xml',
+        updated='2024-01-02T00:00:00+00:00',
+    )
+
+    written = write_atom_feed(sink, 'feed.xml', info, entries, limit=3)
+
+    feed = _xml(sink.files['feed.xml'])
+    assert written == 3
+    assert feed.findtext(f'{ATOM_NS}title') == 'Example'
+    assert [e.findtext(f'{ATOM_NS}title') for e in feed.iter(f'{ATOM_NS}entry')] == [
+        'Post <0>',
+        'Post <1>',
+        'Post <2>',
+    ]
+    assert feed.findtext(f'{ATOM_NS}entry/{ATOM_NS}summary') == 'A & B'
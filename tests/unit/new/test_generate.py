@@ -0,0 +1,180 @@
+"""End-to-end tests for the website generation."""
+
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jinja2 import Environment
+
+from electric_toolbox.main import main
+from electric_toolbox.parsing.sections.blog import article_functions
+from electric_toolbox.sinks import MemorySink
+
+
+def test_generate_into_memory(sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path) -> None:
+    """The whole site renders into a memory sink without touching the output folder."""
+    sink = MemorySink()
+
+    graph = main(base_path=tmp_path / 'website', j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    assert set(sink.files) == {
+        'index.html',
+        'posts.html',
+        'posts/first-post.html',
+        'posts/second-post.html',
+        'posts/third-post.html',
+        '_fragments/index.html',
+        '_fragments/posts.html',
+        '_fragments/posts/first-post.html',
+        '_fragments/posts/second-post.html',
+        '_fragments/posts/third-post.html',
+        'sitemap.xml',
+        'feed.xml',
+        'robots.txt',
+        'llms.txt',
+        'index.html.md',
+        'posts.html.md',
+        'posts/first-post.html.md',
+        'posts/second-post.html.md',
+        'posts/third-post.html.md',
+    }
+    assert 'Some words about first post' in sink.files['posts/first-post.html']
+    assert not (tmp_path / 'website').exists()
+    assert set(graph.pages) == {
+        'index.html',
+        '/posts.html',
+        *(f'/posts/{n}-post.html' for n in ('first', 'second', 'third')),
+        '/_fragments/index.html',
+        '/_fragments/posts.html',
+        *(f'/_fragments/posts/{n}-post.html' for n in ('first', 'second', 'third')),
+    }
+
+
+def test_generate_htmx_fragments(sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path) -> None:
+    """Each fragment carries the title and #body-content of its page (with its prefetch hints), and nothing else."""
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    page, fragment = sink.files['posts/first-post.html'], sink.files['_fragments/posts/first-post.html']
+    title = page[page.index('<title>') : page.index('</title>') + len('</title>')]
+    body = page[page.index('<main') : page.index('</main>') + len('</main>')]
+    assert title in fragment
+    assert body in re.sub(r'<link href=\S+ rel=prefetch>', '', fragment)
+    assert 'og:title' not in fragment
+    assert '<script' not in fragment
+    assert len(fragment) < len(page)
+    assert 'Disallow: /_fragments/' in sink.files['robots.txt']
+
+
+def test_generate_prefetch_hints(sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path) -> None:
+    """Index pages prefetch the newest posts; a post its neighbours, related posts and the index."""
+    sample_site_configs['sections']['home']['prefetch'] = 1
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    def _hints(location: str) -> list[str]:
+        return re.findall(r'<link href=(\S+) rel=prefetch>', sink.files[location])
+
+    assert _hints('index.html') == ['/_fragments/posts/third-post.html']
+    assert _hints('posts.html') == [f'/_fragments/posts/{n}-post.html' for n in ('third', 'second', 'first')]
+    assert _hints('posts/second-post.html') == [
+        '/_fragments/posts/third-post.html',
+        '/_fragments/posts/first-post.html',
+        '/_fragments/posts.html',
+    ]
+    # Boosted navigation swaps in the fragment: its hints come with it.
+    assert _hints('_fragments/posts/second-post.html') == _hints('posts/second-post.html')
+    assert _hints('_fragments/posts.html') == _hints('posts.html')
+
+
+def test_streaming_build_matches_full_build(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """Streaming the posts one at a time produces exactly the same files."""
+    full, streamed = MemorySink(), MemorySink()
+
+    full_graph = main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=full)
+    streamed_graph = main(
+        base_path=tmp_path,
+        j2_env=jinja_env,
+        configs=sample_site_configs,
+        sink=streamed,
+        streaming=True,
+    )
+
+    assert streamed.files == full.files
+    assert streamed_graph == full_graph
+
+
+def test_conversion_cache_skips_unchanged_posts(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A rebuild converts no post again, and a streaming build converts each post once."""
+    converted: list[str] = []
+    convert = article_functions._convert_markdown
+
+    def _counting(contents: str) -> Any:
+        converted.append(contents)
+        return convert(contents)
+
+    monkeypatch.setattr(article_functions, '_convert_markdown', _counting)
+    first, second, streamed = MemorySink(), MemorySink(), MemorySink()
+    cache = tmp_path / 'markdown-cache'
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=first, conversion_cache=cache)
+    assert len(converted) == 3
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=second, conversion_cache=cache)
+    assert len(converted) == 3
+    assert second.files == first.files
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=streamed, streaming=True)
+    assert len(converted) == 6
+    assert streamed.files == first.files
+
+
+def test_generate_only_changed_templates(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """A change to the article body template re-renders only the articles."""
+    sink = MemorySink()
+
+    main(
+        base_path=tmp_path,
+        j2_env=jinja_env,
+        configs=sample_site_configs,
+        changed_templates=['sections/blog/_article.html'],
+        sink=sink,
+    )
+
+    # Only the articles; the sitemap and feed do not depend on templates.
+    assert set(sink.files) == {
+        *(f'posts/{n}-post.html' for n in ('first', 'second', 'third')),
+        *(f'_fragments/posts/{n}-post.html' for n in ('first', 'second', 'third')),
+    }
+
+
+def test_generate_sitemap_and_feed(sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path) -> None:
+    """Every page is in the sitemap and the feed lists posts newest first."""
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    sitemap = sink.files['sitemap.xml']
+    assert '<loc>https://example.com/</loc>' in sitemap
+    assert '<loc>https://example.com/posts.html</loc><lastmod>2024-01-03T10:00:00+00:00</lastmod>' in sitemap
+    assert '<loc>https://example.com/posts/first-post.html</loc><lastmod>2024-01-01T10:00:00+00:00</lastmod>' in sitemap
+    assert '<urlset' in sitemap
+    feed = sink.files['feed.xml']
+    assert feed.index('Third Post') < feed.index('Second Post') < feed.index('First Post')
+    assert '<updated>2024-01-03T10:00:00+00:00</updated>' in feed
+    assert 'Sitemap: https://example.com/sitemap.xml' in sink.files['robots.txt']
@@ -0,0 +1,43 @@
+"""Cold-start budget of the build entry point (``python -X importtime``)."""
+
+import subprocess
+import sys
+
+# Measured ~0.3 s here, almost all of it pydantic and expression; the margin
+# absorbs slow CI machines but not an eager import of the rendering stack.
+IMPORT_BUDGET_US = 800_000
+# Imported on first use only: by a conversion, a render or a post parse.
+LAZY_MODULES = ('markdown', 'pymdownx', 'pygments', 'frontmatter', 'yaml', 'slugify', 'jinja2', 'minify_html')
+
+
+def _import(module: str) -> subprocess.CompletedProcess[str]:
+    code = f'import sys, {module}; print(" ".join(sorted(sys.modules)))'
+    return subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(importtime: str, module: str) -> int:
+    """Cumulative import time of ``module`` from the ``-X importtime`` report."""
+    for line in importtime.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(':', '|', 1).split('|'))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f'{module} not in the importtime report')
+
+
+def test_entry_point_defers_heavy_imports() -> None:
+    """Importing the build entry point does not import the parsers and renderers."""
+    loaded = set(_import('electric_toolbox.main').stdout.split())
+
+    assert [module for module in LAZY_MODULES if module in loaded] == []
+
+
+def test_entry_point_import_budget() -> None:
+    """The entry point imports within the budget."""
+    report = _import('electric_toolbox.main').stderr
+
+    assert _cumulative_us(report, 'electric_toolbox.main') < IMPORT_BUDGET_US
@@ -0,0 +1,41 @@
+"""Tests for the Markdown versions of the pages and llms.txt."""
+
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+from jinja2 import Environment
+
+from electric_toolbox.main import main
+from electric_toolbox.sinks import MemorySink
+
+
+def _build(configs: Dict[str, Any], env: Environment) -> Dict[str, str]:
+    sink = MemorySink()
+    main(base_path=Path('unused'), j2_env=env, configs=configs, sink=sink)
+    return sink.files
+
+
+def test_posts_have_a_markdown_version(sample_site_configs: Dict[str, Any], jinja_env: Environment) -> None:
+    """The Markdown version of a post is its metadata and source body: no HTML, no frontmatter."""
+    post = _build(sample_site_configs, jinja_env)['posts/first-post.html.md']
+
+    assert post.startswith('# First Post\n\nPublished 2024-01-01, ')
+    assert 'Source: <https://example.com/posts/first-post.html>' in post
+    assert '\nTags: python, testing\n' in post
+    assert post.endswith('Some words about first post and a [link](https://example.com).\n')
+    assert '<p>' not in post
+    assert 'publication_time' not in post
+
+
+def test_llms_txt_links_every_markdown_version(sample_site_configs: Dict[str, Any], jinja_env: Environment) -> None:
+    """llms.txt names the site and links the Markdown version of every page, which all exist."""
+    files = _build(sample_site_configs, jinja_env)
+    index = files['llms.txt']
+    links = re.findall(r'\]\(https://example\.com/([^)]+)\)', index)
+
+    assert index.startswith('# Example\n\n> An example site\n')
+    assert sorted(links) == sorted(location for location in files if location.endswith('.md'))
+    assert '- [Third Post](https://example.com/posts/third-post.html.md)' in index
+    assert files['posts.html.md'].count('\n- [') == 3
+    assert files['index.html.md'] == '# Home\n\nHello, this is home.\n'
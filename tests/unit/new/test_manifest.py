@@ -0,0 +1,86 @@
+"""Tests for the deploy manifest."""
+
+from pathlib import Path
+
+from electric_toolbox.manifest import (
+    Manifest,
+    ManifestDiff,
+    ManifestSink,
+    diff_manifests,
+    load_manifest,
+    manifest_entry,
+    manifest_of_directory,
+    save_manifest,
+    urls_to_purge,
+)
+from electric_toolbox.sinks import DirectorySink, MemorySink
+
+
+def test_manifest_sink_records_while_forwarding() -> None:
+    """Every write is forwarded and recorded with its size and hash."""
+    inner = MemorySink()
+    sink = ManifestSink(inner)
+
+    sink.write('/index.html', 'home')
+    sink.write('posts/a.html', 'ä')
+
+    assert inner.files == {'index.html': 'home', 'posts/a.html': 'ä'}
+    assert sink.manifest.files['posts/a.html'] == manifest_entry('ä'.encode('utf-8'))
+    assert sink.manifest.files['posts/a.html'].size == 2
+
+
+def test_manifest_sink_keeps_base_entries() -> None:
+    """Files not rewritten keep the entries of the base manifest."""
+    base = Manifest(files={'a.html': manifest_entry(b'a'), 'b.html': manifest_entry(b'b')})
+    sink = ManifestSink(MemorySink(), base=base)
+
+    sink.write('b.html', 'B')
+
+    assert sink.manifest.files == {'a.html': manifest_entry(b'a'), 'b.html': manifest_entry(b'B')}
+
+
+def test_manifest_matches_directory_hash(tmp_path: Path) -> None:
+    """The recorded manifest equals hashing the written folder afterwards."""
+    sink = ManifestSink(DirectorySink(tmp_path))
+    sink.write('index.html', 'home')
+    sink.write('posts/a.html', 'post')
+
+    assert manifest_of_directory(tmp_path) == sink.manifest
+
+
+def test_diff_manifests_and_purge() -> None:
+    """Added, changed and removed files are listed; stale URLs are purged."""
+    previous = Manifest(
+        files={
+            'index.html': manifest_entry(b'old home'),
+            'posts/a.html': manifest_entry(b'a'),
+            'posts/gone.html': manifest_entry(b'gone'),
+        }
+    )
+    current = Manifest(
+        files={
+            'index.html': manifest_entry(b'new home'),
+            'posts/a.html': manifest_entry(b'a'),
+            'posts/new.html': manifest_entry(b'new'),
+        }
+    )
+
+    diff = diff_manifests(previous, current)
+
+    assert diff == ManifestDiff(added=('posts/new.html',), changed=('index.html',), removed=('posts/gone.html',))
+    assert diff.to_upload == ('posts/new.html', 'index.html')
+    assert urls_to_purge(diff, 'https://example.com/') == [
+        'https://example.com/index.html',
+        'https://example.com/',
+        'https://example.com/posts/gone.html',
+    ]
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    """A saved manifest loads back unchanged; a missing one is empty."""
+    manifest = Manifest(files={'index.html': manifest_entry(b'home')})
+
+    save_manifest(manifest, tmp_path / 'manifest.json')
+
+    assert load_manifest(tmp_path / 'manifest.json') == manifest
+    assert load_manifest(tmp_path / 'missing.json') == Manifest()
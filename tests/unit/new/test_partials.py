@@ -0,0 +1,55 @@
+"""Tests for the render-once cache of shared partials."""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from electric_toolbox.main import main
+from electric_toolbox.partials import PartialCache, RenderedPartials, rendered_partials
+from electric_toolbox.sinks import MemorySink
+
+
+def test_a_block_renders_once_per_key() -> None:
+    """Same key: the first rendering is reused; another key renders again."""
+    env = Environment(
+        loader=DictLoader({'page.html': '{% cached section %}<b>{{ section }}</b> {{ counter() }}{% endcached %}'}),
+        autoescape=True,
+        extensions=[PartialCache],
+    )
+    calls = iter(range(10))
+    env.globals['counter'] = lambda: next(calls)
+    page = env.get_template('page.html')
+
+    assert [page.render(section=name) for name in ('blog', 'blog', '<home>')] == [
+        '<b>blog</b> 0',
+        '<b>blog</b> 0',
+        '<b>&lt;home&gt;</b> 1',
+    ]
+    partials = rendered_partials(env)
+    assert (partials.hits, partials.misses, len(partials)) == (1, 2, 2)
+
+
+def test_generated_pages_match_uncached_rendering(
+    sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The header, footer and scripts are spliced in unchanged, per section."""
+    cached = MemorySink()
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=cached)
+    partials = rendered_partials(jinja_env)
+    counts = partials.misses, partials.hits
+
+    def _always_render(_: RenderedPartials, key: Hashable, render: Callable[[], str]) -> str:
+        return render()
+
+    monkeypatch.setattr(RenderedPartials, 'get_or_render', _always_render)
+    uncached = MemorySink()
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=uncached)
+
+    assert cached.files == uncached.files
+    # Five pages: a header for the home page and one for the blog (index and
+    # posts), one footer and one script block.
+    assert counts == (4, 3 + 4 + 4)
+    assert 'aria-current=page href=/posts.html' in cached.files['posts/first-post.html'].split('</header>')[0]
+    assert 'aria-current=page href=/posts.html' not in cached.files['index.html']
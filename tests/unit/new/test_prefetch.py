@@ -0,0 +1,39 @@
+"""Tests for the build-time navigation graph."""
+
+from electric_toolbox.constants import ExistingTemplates
+from electric_toolbox.parsing import TargetFiles, Template
+from electric_toolbox.parsing.common import page_targets
+from electric_toolbox.prefetch import PrefetchPage, adjacent, newest, prefetch_href, ranked
+
+
+def _pages() -> list[PrefetchPage]:
+    return [
+        PrefetchPage(page='/posts/b.html', href='/_fragments/posts/b.html', date='2024-01-02T00:00:00+00:00'),
+        PrefetchPage(page='/posts/a.html', href='/_fragments/posts/a.html', date='2024-01-01T00:00:00+00:00'),
+        PrefetchPage(page='/posts/c.html', href='/_fragments/posts/c.html', date='2024-01-03T00:00:00+00:00'),
+    ]
+
+
+def test_prefetch_href_prefers_the_fragment() -> None:
+    """Boosted navigation fetches the fragment, so that is what gets prefetched."""
+    assert prefetch_href(page_targets('index.html', ExistingTemplates.INDEX)) == '/_fragments/index.html'
+    complete_only = TargetFiles(
+        complete=Template(destination='index.html', template=ExistingTemplates.INDEX, extension='html')
+    )
+    assert prefetch_href(complete_only) == '/index.html'
+
+
+def test_newest_and_adjacent() -> None:
+    """Posts are ordered by date; each post links to the next (newer) post, then the previous one."""
+    assert newest(_pages()) == ['/_fragments/posts/c.html', '/_fragments/posts/b.html', '/_fragments/posts/a.html']
+    assert adjacent(_pages()) == {
+        '/posts/a.html': ['/_fragments/posts/b.html'],
+        '/posts/b.html': ['/_fragments/posts/c.html', '/_fragments/posts/a.html'],
+        '/posts/c.html': ['/_fragments/posts/b.html'],
+    }
+
+
+def test_ranked_dedupes_and_limits() -> None:
+    """The first distinct candidates are kept, without the page itself."""
+    assert list(ranked(['/a', None, '/self', '/a', '/b', '/c'], limit=2, exclude='/self')) == ['/a', '/b']
+    assert list(ranked(['/a'], limit=0)) == []
@@ -0,0 +1,151 @@
+"""Tests for the static server."""
+
+import gzip
+import http.client
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+import pytest
+
+from electric_toolbox.manifest import manifest_of_directory, save_manifest
+from electric_toolbox.server import byte_range, etag_matches, index_site, make_server, precompress
+
+_PAGE = '<!doctype html><title>Post</title>' + '<p>Words.</p>' * 200
+
+
+def _built(root: Path) -> Path:
+    """Save the manifest of ``root`` next to it, as a build does once the files are written."""
+    manifest = root.parent / 'deploy-manifest.json'
+    save_manifest(manifest_of_directory(root), manifest)
+    return manifest
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Iterator[Tuple[Path, int]]:
+    """A served site: an index, a post with a .gz sibling and a small stylesheet."""
+    root = tmp_path / 'website'
+    (root / 'posts').mkdir(parents=True)
+    (root / 'index.html').write_text('<!doctype html><title>Home</title>', encoding='utf-8')
+    (root / 'posts' / 'post.html').write_text(_PAGE, encoding='utf-8')
+    (root / 'style.css').write_text('body{margin:0}', encoding='utf-8')
+    manifest = _built(root)
+    assert precompress(root) == 1  # the stylesheet is too small to bother
+    server = make_server(root, port=0, manifest=manifest, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield root, server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def _request(
+    port: int, path: str, headers: Dict[str, str] = {}, method: str = 'GET'
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request(method, path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def _status(port: int, path: str, headers: Dict[str, str] = {}) -> int:
+    return _request(port, path, headers)[0].status
+
+
+def test_etags_come_from_the_manifest_and_revalidate(site: Tuple[Path, int]) -> None:
+    """The ETag is the built file's hash; sending it back gets a 304."""
+    root, port = site
+    response, _ = _request(port, '/')
+
+    etag = response.getheader('ETag')
+    assert response.status == 200
+    assert etag == f'"{manifest_of_directory(root).files["index.html"].sha256[:32]}"'
+    assert response.getheader('Content-Type') == 'text/html; charset=utf-8'
+    assert _status(port, '/index.html', {'If-None-Match': f'"other", {etag}'}) == 304
+    assert _status(port, '/index.html', {'If-None-Match': f'W/{etag}'}) == 304
+    assert _status(port, '/index.html', {'If-None-Match': '"other"'}) == 200
+
+
+def test_files_modified_after_the_manifest_are_not_trusted(tmp_path: Path) -> None:
+    """Same size but written after the manifest: the ETag is the file's size and mtime, not the old hash."""
+    root = tmp_path / 'website'
+    root.mkdir()
+    (root / 'a.html').write_text('before', encoding='utf-8')
+    (root / 'b.html').write_text('kept', encoding='utf-8')
+    manifest = _built(root)
+    saved = manifest.stat().st_mtime_ns
+    (root / 'a.html').write_text('after!', encoding='utf-8')
+    os.utime(root / 'a.html', ns=(saved + 1, saved + 1))
+
+    files = index_site(root, manifest)
+
+    assert files['a.html'].representations[0].etag == f'"6-{saved + 1:x}"'
+    assert files['b.html'].representations[0].etag == f'"{manifest_of_directory(root).files["b.html"].sha256[:32]}"'
+    assert index_site(root, tmp_path / 'missing.json')['b.html'].representations[0].etag.startswith('"4-')
+
+
+def test_if_none_match_lists() -> None:
+    """Weak tags, lists and ``*`` match; a weak-looking tag of another file does not."""
+    assert etag_matches('*', '"a"')
+    assert etag_matches('"x", W/"a"', '"a"')
+    assert etag_matches(' "x" ,"a" ', '"a"')
+    assert not etag_matches('W/"b", "x"', '"a"')
+    assert not etag_matches('', '"a"')
+
+
+def test_precompressed_siblings_are_negotiated(site: Tuple[Path, int]) -> None:
+    """The gzip sibling is sent when accepted (with its own ETag), the identity otherwise."""
+    _, port = site
+    response, body = _request(port, '/posts/post.html', {'Accept-Encoding': 'br;q=0, gzip'})
+    identity, plain = _request(port, '/posts/post.html', {'Accept-Encoding': 'gzip;q=0'})
+
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert response.getheader('Vary') == 'Accept-Encoding'
+    assert gzip.decompress(body).decode('utf-8') == plain.decode('utf-8') == _PAGE
+    assert identity.getheader('Content-Encoding') is None
+    assert response.getheader('ETag') != identity.getheader('ETag')
+
+
+def test_ranges(site: Tuple[Path, int]) -> None:
+    """A single range gets a 206, an impossible one a 416, a stale If-Range the whole file."""
+    _, port = site
+    response, body = _request(port, '/posts/post.html', {'Range': 'bytes=5-13'})
+    suffix, tail = _request(port, '/posts/post.html', {'Range': 'bytes=-4'})
+
+    assert (response.status, body) == (206, _PAGE.encode('utf-8')[5:14])
+    assert response.getheader('Content-Range') == f'bytes 5-13/{len(_PAGE)}'
+    assert (suffix.status, tail) == (206, b'</p>')
+    assert _status(port, '/posts/post.html', {'Range': f'bytes={len(_PAGE)}-'}) == 416
+    assert _status(port, '/posts/post.html', {'Range': 'bytes=0-1', 'If-Range': '"stale"'}) == 200
+    assert byte_range('bytes=0-1,4-5', 10) is None
+
+
+def test_only_indexed_files_are_served(site: Tuple[Path, int]) -> None:
+    """Unknown paths, traversal attempts and the siblings themselves are 404s; HEAD has no body."""
+    root, port = site
+    (root.parent / 'secret.txt').write_text('no', encoding='utf-8')
+
+    assert _status(port, '/missing.html') == 404
+    assert _status(port, '/../secret.txt') == 404
+    assert _status(port, '/posts/post.html.gz') == 404
+    head, body = _request(port, '/style.css', method='HEAD')
+    assert (head.status, head.getheader('Content-Length'), body) == (200, '14', b'')
+
+
+def test_stale_siblings_are_not_served(tmp_path: Path) -> None:
+    """A sibling older than its file (re-rendered since) is skipped; a fresh one carries the file's ETag."""
+    root = tmp_path / 'website'
+    root.mkdir()
+    (root / 'a.html').write_text(_PAGE, encoding='utf-8')
+    (root / 'b.html').write_text(_PAGE, encoding='utf-8')
+    manifest = _built(root)
+    assert precompress(root) == 2
+    os.utime(root / 'a.html.gz', ns=(0, 0))
+
+    files = index_site(root, manifest)
+
+    assert [representation.encoding for representation in files['a.html'].representations] == [None]
+    identity, sibling = files['b.html'].representations
+    assert sibling.etag == f'{identity.etag[:-1]}-gzip"'
@@ -0,0 +1,69 @@
+"""Tests for the service worker and its precache list."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+from jinja2 import Environment
+
+from electric_toolbox.main import main
+from electric_toolbox.manifest import manifest_entry
+from electric_toolbox.sinks import MemorySink
+from electric_toolbox.vendor import ScriptTag
+
+
+def _precache(sink: MemorySink) -> Dict[str, str]:
+    match = re.search(r'const ENTRIES = (.*);', sink.files['sw.js'])
+    assert match is not None
+    return {entry['url']: entry['revision'] for entry in json.loads(match.group(1))}
+
+
+def test_service_worker_precaches_pages_with_their_revisions(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """The worker lists the pages, fragments and vendored scripts with their revisions; the pages register it."""
+    jinja_env.globals['service_worker'] = '/sw.js'
+    jinja_env.globals['vendor_scripts'] = [ScriptTag(src='/vendor/htmx.min.js', integrity='sha384-abc')]
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    precache = _precache(sink)
+    assert precache.pop('/vendor/htmx.min.js') == 'sha384-abc'
+    pages = ['index.html', 'posts.html', *(f'posts/{n}-post.html' for n in ('first', 'second', 'third'))]
+    assert set(precache) == {f'/{prefix}{page}' for page in pages for prefix in ('', '_fragments/')}
+    assert all(
+        revision == manifest_entry(sink.files[url[1:]].encode('utf-8')).sha256[:16]
+        for url, revision in precache.items()
+    )
+    assert '"/posts/"' in sink.files['sw.js']
+    assert 'const RUNTIME_CACHE_ENTRIES = 50;' in sink.files['sw.js']
+    assert 'serviceWorker.register(`/sw.js`)' in sink.files['index.html']
+
+    # A template change re-renders the precached pages too, so the worker keeps up.
+    targeted = MemorySink()
+    main(
+        base_path=tmp_path,
+        j2_env=jinja_env,
+        configs=sample_site_configs,
+        changed_templates=['sections/blog/_article.html'],
+        sink=targeted,
+    )
+    assert _precache(targeted) == {**precache, '/vendor/htmx.min.js': 'sha384-abc'}
+
+
+def test_no_service_worker_by_default(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """Without the ``service_worker`` global, nothing is written nor registered."""
+    sink = MemorySink()
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    assert 'sw.js' not in sink.files
+    assert 'serviceWorker' not in sink.files['index.html']
@@ -0,0 +1,109 @@
+"""Tests for the output sinks."""
+
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from electric_toolbox.sinks import ArchiveSink, DirectorySink, MemorySink
+
+
+def test_directory_sink_creates_folders(tmp_path: Path) -> None:
+    """Files land below the base path, leading slashes are ignored."""
+    written = DirectorySink(tmp_path).write('/posts/a.html', '<p>a</p>')
+
+    assert written['path'] == tmp_path / 'posts' / 'a.html'
+    assert (tmp_path / 'posts' / 'a.html').read_text() == '<p>a</p>'
+
+
+def test_memory_sink_keeps_last_version() -> None:
+    """The in-memory sink maps normalised locations to contents."""
+    sink = MemorySink()
+    sink.write('/index.html', 'old')
+    sink.write('index.html', 'new')
+
+    assert sink.files == {'index.html': 'new'}
+
+
+@pytest.mark.parametrize('name', ['site.tar', 'site.tar.gz', 'site.tgz'])
+def test_archive_sink_tar(tmp_path: Path, name: str) -> None:
+    """Tar archives contain every written file."""
+    path = tmp_path / name
+    with ArchiveSink(path) as sink:
+        sink.write('/index.html', 'home')
+        sink.write('posts/a.html', 'ä')
+
+    with tarfile.open(path) as archive:
+        assert sorted(archive.getnames()) == ['index.html', 'posts/a.html']
+        member = archive.extractfile('posts/a.html')
+        assert member is not None
+        assert member.read().decode('utf-8') == 'ä'
+
+
+def test_archive_sink_zip(tmp_path: Path) -> None:
+    """Zip archives contain every written file."""
+    path = tmp_path / 'site.zip'
+    with ArchiveSink(path) as sink:
+        sink.write('/index.html', 'home')
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read('index.html') == b'home'
+
+
+@pytest.mark.parametrize('name', ['site.tar.gz', 'site.zip'])
+def test_archive_sink_adds_files(tmp_path: Path, name: str) -> None:
+    """Files copied in as they are (the static assets) sit next to the rendered ones."""
+    (tmp_path / 'chart.png').write_bytes(b'\x89PNG')
+    path = tmp_path / name
+    with ArchiveSink(path) as sink:
+        sink.write('index.html', 'home')
+        sink.add_file('/posts/images/chart.png', tmp_path / 'chart.png')
+
+    if name.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            assert archive.read('posts/images/chart.png') == b'\x89PNG'
+    else:
+        with tarfile.open(path) as archive:
+            member = archive.extractfile('posts/images/chart.png')
+            assert member is not None
+            assert member.read() == b'\x89PNG'
+
+
+def test_archive_sink_rejects_unknown_suffix(tmp_path: Path) -> None:
+    """Only zip and tar flavours are supported."""
+    with pytest.raises(ValueError, match='Unsupported archive type'):
+        ArchiveSink(tmp_path / 'site.rar')
+
+
+@pytest.mark.parametrize('name', ['site.tar.gz', 'site.zip'])
+def test_archive_sink_streams_members(tmp_path: Path, name: str) -> None:
+    """Streamed members end up in the archive like written ones."""
+    path = tmp_path / name
+    with ArchiveSink(path) as sink:
+        with sink.open('sitemap.xml') as handle:
+            handle.write('<urlset>')
+            handle.write('</urlset>')
+        sink.write('index.html', 'home')
+
+    if name.endswith('.zip'):
+        with zipfile.ZipFile(path) as zipped:
+            assert zipped.read('sitemap.xml') == b'<urlset></urlset>'
+    else:
+        with tarfile.open(path) as tarred:
+            member = tarred.extractfile('sitemap.xml')
+            assert member is not None
+            assert member.read() == b'<urlset></urlset>'
+            assert tarred.getnames() == ['sitemap.xml', 'index.html']
+
+
+def test_directory_and_memory_sinks_stream(tmp_path: Path) -> None:
+    """Streaming into the directory and memory sinks stores the whole stream."""
+    memory = MemorySink()
+    for sink in (DirectorySink(tmp_path), memory):
+        with sink.open('/feeds/feed.xml') as handle:
+            handle.write('a')
+            handle.write('b')
+
+    assert (tmp_path / 'feeds' / 'feed.xml').read_text() == 'ab'
+    assert memory.files == {'feeds/feed.xml': 'ab'}
@@ -0,0 +1,86 @@
+"""Tests for the self-hosted vendor scripts."""
+
+import base64
+import hashlib
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jinja2 import Environment
+
+from electric_toolbox.main import main
+from electric_toolbox.sinks import MemorySink
+from electric_toolbox.vendor import VendorScript, write_vendor_scripts
+
+
+def _scripts(tmp_path: Path) -> list[VendorScript]:
+    (tmp_path / 'a.js').write_text('window.a=1')
+    (tmp_path / 'b.js').write_text('window.b=2\n')
+    (tmp_path / 'SHA256SUMS').write_text(
+        f'{hashlib.sha256(b"window.a=1").hexdigest()}  a.js\n{hashlib.sha256(b"window.b=2\n").hexdigest()} *b.js\n'
+    )
+    return [VendorScript('a', tmp_path / 'a.js'), VendorScript('b', tmp_path / 'b.js')]
+
+
+def test_write_vendor_scripts(tmp_path: Path) -> None:
+    """Each script is written under a content-hashed name, with the SRI hash of what was written."""
+    sink = MemorySink()
+
+    tags = write_vendor_scripts(sink, _scripts(tmp_path), checksums=tmp_path / 'SHA256SUMS')
+
+    assert [tag.src for tag in tags] == [
+        f'/vendor/a.{hashlib.sha256(b"window.a=1").hexdigest()[:10]}.js',
+        f'/vendor/b.{hashlib.sha256(b"window.b=2\n").hexdigest()[:10]}.js',
+    ]
+    for tag in tags:
+        written = sink.files[tag.src.lstrip('/')].encode('utf-8')
+        assert tag.integrity == 'sha384-' + base64.b64encode(hashlib.sha384(written).digest()).decode('ascii')
+
+
+def test_write_vendor_scripts_bundle(tmp_path: Path) -> None:
+    """A bundle is one file with every script, in order, each terminated."""
+    sink = MemorySink()
+
+    (tag,) = write_vendor_scripts(sink, _scripts(tmp_path), bundle=True, checksums=tmp_path / 'SHA256SUMS')
+
+    assert tag.src.startswith('/vendor/bundle.')
+    assert sink.files[tag.src.lstrip('/')] == 'window.a=1\n;\nwindow.b=2\n;\n'
+
+
+def test_scripts_must_match_their_checksums(tmp_path: Path) -> None:
+    """A changed or unlisted copy fails the build instead of being served."""
+    scripts = _scripts(tmp_path)
+    (tmp_path / 'a.js').write_text('window.a=2')
+    with pytest.raises(ValueError, match='does not match'):
+        write_vendor_scripts(MemorySink(), scripts, checksums=tmp_path / 'SHA256SUMS')
+
+    (tmp_path / 'c.js').write_text('window.c=3')
+    with pytest.raises(ValueError, match='no checksum'):
+        write_vendor_scripts(MemorySink(), [VendorScript('c', tmp_path / 'c.js')], checksums=tmp_path / 'SHA256SUMS')
+
+
+def test_pinned_copies_are_committed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The default scripts are in the repository and match ``SHA256SUMS``: the build needs no network."""
+    monkeypatch.chdir(Path(__file__).parents[3])
+
+    assert [tag.src.split('.')[0] for tag in write_vendor_scripts(MemorySink())] == ['/vendor/alpine', '/vendor/htmx']
+
+
+def test_pages_reference_vendored_scripts(
+    sample_site_configs: Dict[str, Any],
+    jinja_env: Environment,
+    tmp_path: Path,
+) -> None:
+    """With vendored scripts the pages load nothing from the CDNs."""
+    sink = MemorySink()
+    jinja_env.globals['vendor_scripts'] = write_vendor_scripts(
+        sink, _scripts(tmp_path), checksums=tmp_path / 'SHA256SUMS'
+    )
+
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    page = sink.files['posts/first-post.html']
+    assert 'unpkg.com' not in page
+    assert 'cdn.jsdelivr.net' not in page
+    assert '/vendor/a.' in page
+    assert 'integrity=sha384-' in page
@@ -0,0 +1,76 @@
+"""Tests for the page weight report and budgets."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jinja2 import Environment
+from pydantic import ValidationError
+
+from electric_toolbox.main import main
+from electric_toolbox.sinks import DirectorySink
+from electric_toolbox.weight import (
+    CATEGORIES,
+    BudgetViolation,
+    WeightBudget,
+    WeightSink,
+    format_weight_report,
+    over_budget,
+    page_weight,
+    weights_of_directory,
+)
+
+_PAGE = (
+    '<!doctype html><html lang=en><head><style>body{margin:0}</style>'
+    '<meta property=og:title content=Post><meta name=twitter:card content=summary>'
+    '<script type=application/ld+json>{\n  "@type": "Article",\n  "headline": "Post"\n}</script>'
+    '<script>toggle()</script><title>Post</title></head>'
+    '<body><nav><svg viewBox="0 0 1 1"><path d=M0/></svg></nav>'
+    '<main id=body-content><p>Words.</p><svg viewBox="0 0 2 2"></svg></main></body></html>'
+)
+
+
+def test_every_byte_is_attributed_once() -> None:
+    """The categories split the page; icons in <main> are icons, not content."""
+    weight = page_weight('/posts/post.html', _PAGE)
+    raw = {category: size.raw for category, size in weight.categories.items()}
+
+    assert weight.location == 'posts/post.html'
+    assert sum(raw.values()) == weight.total.raw == len(_PAGE)
+    assert raw['css'] == len('<style>body{margin:0}</style>')
+    assert raw['social_meta'] == len('<meta property=og:title content=Post><meta name=twitter:card content=summary>')
+    assert raw['icons'] == len('<svg viewBox="0 0 1 1"><path d=M0/></svg><svg viewBox="0 0 2 2"></svg>')
+    assert raw['scripts'] == len('<script>toggle()</script>')
+    assert raw['content'] == len('<main id=body-content><p>Words.</p></main>')
+    # JSON-LD is written with its whitespace; that is what minifying it would save.
+    assert weight.categories['json_ld'].minified == raw['json_ld'] - 9
+    assert 0 < weight.categories['markup'].compressed
+
+
+def test_build_pages_are_measured_and_checked(
+    sample_site_configs: Dict[str, Any], jinja_env: Environment, tmp_path: Path
+) -> None:
+    """Every page written through the sink is measured, as it would be from the built folder."""
+    sink = WeightSink(DirectorySink(tmp_path))
+    main(base_path=tmp_path, j2_env=jinja_env, configs=sample_site_configs, sink=sink)
+
+    weights = sink.weights
+    heaviest = max(weights, key=lambda w: w.total.compressed)
+    violations = over_budget(weights, WeightBudget(compressed=heaviest.total.compressed - 1))
+    report = format_weight_report(weights, violations, top=2)
+
+    assert weights == weights_of_directory(tmp_path)
+    assert 'posts/first-post.html' in {w.location for w in weights}
+    assert 'feed.xml' not in {w.location for w in weights}
+    assert violations == [
+        BudgetViolation(heaviest.location, 'compressed', heaviest.total.compressed, heaviest.total.compressed - 1)
+    ]
+    assert report.splitlines()[1].startswith(f'  {heaviest.location}: ')
+    assert report.splitlines()[-1] == f'{len(weights)} pages measured, 1 over budget'
+    assert over_budget(weights, WeightBudget(categories=dict.fromkeys(CATEGORIES, 10**6))) == []
+
+
+def test_budgets_name_known_categories() -> None:
+    """A typo in a category budget is an error, not a budget that is never checked."""
+    with pytest.raises(ValidationError, match='Unknown page weight categories'):
+        WeightBudget(categories={'jsonld': 1000})